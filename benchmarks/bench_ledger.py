@@ -0,0 +1,292 @@
+"""
+Benchmark suite for ledger appends and verification at scale.
+
+Synthesizes bolts whose lock.jsonl holds 1k, 10k and 100k events, signed with
+real Ed25519 identities (a human lead and an agent, cycling through the
+standard workflow's seal actions as long-lived bolts re-seal), and times:
+
+    load_lock                     LedgerManager.load_lock
+    open_lock                     LedgerManager.open_lock (header and head only)
+    find_last                     LazyLedger.find_last of the latest SEAL_INTENT
+    verify_chain_integrity        LedgerManager.verify_chain_integrity
+    verify_from_checkpoint        the same, resuming from a checkpoint at the last event
+    validate_chain_integrity      verification.validate_chain_integrity
+    validate_signatures           verification.validate_signatures
+    validate_workflow_compliance  verification.validate_workflow_compliance
+    verify_ledger                 verification.verify_ledger (all of them in one pass)
+    geas_verify                   the full `geas verify` command
+    append_save                   LedgerManager.append_event + append_lock, per append
+
+For each, events/sec and the peak Python heap (tracemalloc) are reported.
+Peak memory is measured in a separate run, since tracing slows the code.
+
+Usage:
+    $ uv run python benchmarks/bench_ledger.py
+    $ uv run python benchmarks/bench_ledger.py --sizes 1k,10k --output ledger.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from typer.testing import CliRunner
+
+from geas_ai.core import verification
+from geas_ai.core.cache import CheckpointCache
+from geas_ai.core.identity import IdentityManager
+from geas_ai.core.ledger import LedgerManager
+from geas_ai.core.workflow import WorkflowManager
+from geas_ai.main import app
+from geas_ai.schemas.identity import Identity, IdentityRole, IdentityStore
+from geas_ai.schemas.ledger import EventIdentity, LedgerAction, LedgerEvent
+from geas_ai.utils.crypto import (
+    canonicalize_json,
+    generate_keypair,
+    load_private_key_from_bytes,
+    sign,
+)
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+BOLT_ID = "bench-bolt"
+
+# The standard workflow's actions and the identity that signs each of them
+CYCLE = [
+    (LedgerAction.SEAL_REQ, "lead"),
+    (LedgerAction.SEAL_SPECS, "lead"),
+    (LedgerAction.SEAL_PLAN, "agent"),
+    (LedgerAction.SEAL_INTENT, "lead"),
+    (LedgerAction.SEAL_MRP, "agent"),
+    (LedgerAction.APPROVE, "lead"),
+]
+ARTIFACTS = {
+    LedgerAction.SEAL_REQ: "01_request.md",
+    LedgerAction.SEAL_SPECS: "02_specs.md",
+    LedgerAction.SEAL_PLAN: "03_plan.md",
+    LedgerAction.SEAL_MRP: "mrp/summary.md",
+}
+
+
+class Signer:
+    def __init__(self, name: str, role: IdentityRole):
+        private_bytes, self.public_key = generate_keypair()
+        self.private_key = load_private_key_from_bytes(private_bytes)
+        self.identity = Identity(
+            name=name,
+            role=role,
+            persona="architect" if role == IdentityRole.AGENT else None,
+            model="bench-model" if role == IdentityRole.AGENT else None,
+            active_key=self.public_key,
+        )
+
+
+def make_event(index: int, signers: Dict[str, Signer]) -> LedgerEvent:
+    """Builds a signed event the way `geas seal` / `geas approve` would."""
+    action, signer_name = CYCLE[index % len(CYCLE)]
+    signer = signers[signer_name]
+    digest = f"sha256:{index:064x}"
+
+    payload: Dict[str, Any]
+    if action == LedgerAction.SEAL_INTENT:
+        payload = {"hashes": {name: digest for name in ARTIFACTS.values()}}
+        signed: Dict[str, Any] = payload
+    elif action == LedgerAction.APPROVE:
+        payload = {"context": f"Approval {index}", "mrp_hash": digest}
+        signed = payload
+    else:
+        payload = {"file": ARTIFACTS[action], "hash": digest}
+        signed = {"action": action.value, "hash": digest}
+
+    return LedgerEvent(
+        sequence=0,
+        timestamp=datetime.now(timezone.utc),
+        action=action,
+        payload=payload,
+        identity=EventIdentity(
+            signer_id=signer.identity.name,
+            public_key=signer.public_key,
+            signature=sign(signer.private_key, canonicalize_json(signed)),
+        ),
+        event_hash="",
+    )
+
+
+def make_project(root: Path, count: int) -> Tuple[Path, Dict[str, Signer]]:
+    """Creates a .geas project under `root` with one bolt of `count` events."""
+    signers = {
+        "lead": Signer("lead", IdentityRole.HUMAN),
+        "agent": Signer("agent", IdentityRole.AGENT),
+    }
+    IdentityManager(root / ".geas" / "config" / "identities.yaml").save(
+        IdentityStore(identities=[s.identity for s in signers.values()])
+    )
+
+    bolt_path = root / ".geas" / "bolts" / BOLT_ID
+    bolt_path.mkdir(parents=True)
+    ledger = LedgerManager.create_genesis_ledger(BOLT_ID)
+    for i in range(count):
+        LedgerManager.append_event(ledger, make_event(i, signers))
+    LedgerManager.save_lock(bolt_path, ledger)
+    return bolt_path, signers
+
+
+def measure(fn: Callable[[], object]) -> Tuple[float, int]:
+    """Returns (seconds of an untraced run, peak traced bytes of a second run)."""
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run_size(root: Path, count: int, appends: int) -> Dict[str, Dict[str, float]]:
+    bolt_path, signers = make_project(root, count)
+    ledger = LedgerManager.load_lock(bolt_path)
+    assert ledger is not None
+    workflow = WorkflowManager.DEFAULT_WORKFLOW
+    identities = IdentityManager(root / ".geas" / "config" / "identities.yaml").load()
+
+    def append_save() -> None:
+        for _ in range(appends):
+            index = len(ledger.events)
+            LedgerManager.append_event(ledger, make_event(index, signers))
+            LedgerManager.append_lock(bolt_path, ledger)
+
+    def geas_verify() -> None:
+        result = CliRunner().invoke(app, ["verify", "--bolt", BOLT_ID])
+        if result.exit_code != 0:
+            raise RuntimeError(f"geas verify failed:\n{result.output}")
+
+    def find_last() -> None:
+        lazy = LedgerManager.open_lock(bolt_path)
+        assert lazy is not None
+        check(lazy.find_last(LedgerAction.SEAL_INTENT) is not None)
+
+    def verify_from_checkpoint() -> None:
+        cache = CheckpointCache(root / "checkpoints.json")
+        LedgerManager.save_checkpoint(bolt_path, ledger, cache)
+        checkpoint = LedgerManager.load_checkpoint(bolt_path, cache)
+        check(LedgerManager.verify_chain_integrity(ledger, checkpoint))
+
+    def check(ok: bool) -> None:
+        if not ok:
+            raise RuntimeError("the synthesized ledger did not verify")
+
+    operations: List[Tuple[str, int, Callable[[], object]]] = [
+        ("load_lock", count, lambda: LedgerManager.load_lock(bolt_path)),
+        ("open_lock", count, lambda: LedgerManager.open_lock(bolt_path)),
+        ("find_last", count, find_last),
+        (
+            "verify_chain_integrity",
+            count,
+            lambda: check(LedgerManager.verify_chain_integrity(ledger)),
+        ),
+        ("verify_from_checkpoint", count, verify_from_checkpoint),
+        (
+            "validate_chain_integrity",
+            count,
+            lambda: check(verification.validate_chain_integrity(ledger).valid),
+        ),
+        (
+            "validate_signatures",
+            count,
+            lambda: check(verification.validate_signatures(ledger, identities).valid),
+        ),
+        (
+            "validate_workflow_compliance",
+            count,
+            lambda: check(
+                verification.validate_workflow_compliance(
+                    ledger, workflow, identities
+                ).valid
+            ),
+        ),
+        (
+            "verify_ledger",
+            count,
+            lambda: check(
+                verification.verify_ledger(ledger, workflow, identities).valid
+            ),
+        ),
+        ("geas_verify", count, geas_verify),
+        # Last: it grows the ledger
+        ("append_save", appends, append_save),
+    ]
+
+    results: Dict[str, Dict[str, float]] = {}
+    cwd = os.getcwd()
+    # geas verify resolves .geas/ from the working directory
+    os.chdir(root)
+    try:
+        for name, events, fn in operations:
+            seconds, peak = measure(fn)
+            results[name] = {
+                "seconds": round(seconds, 4),
+                "events_per_second": round(events / seconds, 1) if seconds else 0.0,
+                "peak_mib": round(peak / (1024 * 1024), 2),
+            }
+            print(
+                f"{name:<30} {events:>8} {seconds:>9.3f} "
+                f"{results[name]['events_per_second']:>12.0f} {results[name]['peak_mib']:>9.2f}"
+            )
+    finally:
+        os.chdir(cwd)
+    return results
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        default="1k,10k,100k",
+        help=f"Comma-separated ledger sizes ({', '.join(SIZES)})",
+    )
+    parser.add_argument(
+        "--appends",
+        type=int,
+        default=10,
+        help="Events appended (and saved one by one) for append_save",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Also write the results as JSON to this file"
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip().lower() for s in args.sizes.split(",")]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)}")
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    workdir = Path(tempfile.mkdtemp(prefix="geas-ledger-bench-"))
+    try:
+        for size in sizes:
+            print(f"\n{size} events")
+            print(
+                f"{'operation':<30} {'events':>8} {'seconds':>9} {'events/s':>12} {'peak MiB':>9}"
+            )
+            results[size] = run_size(workdir / size, SIZES[size], args.appends)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
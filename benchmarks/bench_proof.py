@@ -0,0 +1,299 @@
+"""
+Benchmark suite for the proof pipeline: walking, hashing and Merkle roots.
+
+Generates synthetic source trees (mixed file sizes, nested .gitignore files
+at every depth, ignored files and build/ directories to prune) and times:
+
+    walk          walk_source_files over the tree (cold ignore-rule cache)
+    file_sha256   file_sha256 on every walked file, one after the other
+    hash_files    the prove hashing loop (thread pool, no hash cache)
+    hash_cached   the prove hashing loop with a warm .geas hash cache
+    merkle_root   calculate_merkle_root over the file digests
+
+Each timing is the best of --repeat runs. Results are written as JSON and
+compared with a stored baseline; the run fails (exit code 1) if any timing
+regressed beyond --threshold. Baselines are machine-specific, so none is
+committed (benchmarks/baseline.json is git-ignored): record one with
+--update-baseline on the machine you compare on.
+
+The 1m tree takes minutes to generate and hash; it only runs when asked
+for with --sizes.
+
+Usage:
+    $ uv run python benchmarks/bench_proof.py --update-baseline
+    $ uv run python benchmarks/bench_proof.py
+    $ uv run python benchmarks/bench_proof.py --sizes 10k --repeat 5
+    $ uv run python benchmarks/bench_proof.py --sizes 1m --workdir /tmp/geas-trees
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from geas_ai.core import walker
+from geas_ai.core.cache import HashCache
+from geas_ai.core.hashing import file_sha256, hash_files
+from geas_ai.core.manifest import calculate_merkle_root
+from geas_ai.core.walker import walk_source_files
+
+RESULTS_VERSION = 1
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+FILES_PER_DIR = 40
+FANOUT = 6
+
+# (probability, min bytes, max bytes): mostly small sources, a few large files
+SIZE_MIX = [(0.97, 0, 1024), (0.029, 1024, 16 * 1024), (0.001, 64 * 1024, 256 * 1024)]
+
+IGNORE_PATTERNS = ["*.log", "*.tmp", "build/", "cache_*/", "!keep.log", "/gen_*.py"]
+IGNORED_NAMES = ["debug.log", "scratch.tmp", "keep.log", "gen_table.py"]
+
+
+def make_tree(root: Path, count: int, seed: int = 0) -> None:
+    """
+    Creates `count` files under root/src, deterministically for a given seed.
+
+    About one file in ten matches an ignore pattern, and roughly a third of
+    the directories carry their own .gitignore, so the walker has to stack
+    rules many levels deep.
+    """
+    rng = random.Random(seed)
+    block = rng.randbytes(512 * 1024)
+    # Old enough to be outside the hash cache's racy-clean window
+    mtime = time.time() - 3600
+
+    src = root / "src"
+    directories = [src]
+    queue = [src]
+    while queue and len(directories) * FILES_PER_DIR < count:
+        parent = queue.pop(0)
+        for i in range(FANOUT):
+            child = parent / f"d{i}"
+            directories.append(child)
+            queue.append(child)
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+        if directory != src and rng.random() < 0.3:
+            patterns = rng.sample(IGNORE_PATTERNS, rng.randint(1, 3))
+            (directory / ".gitignore").write_text("\n".join(patterns) + "\n")
+
+    for i in range(count):
+        directory = directories[i % len(directories)]
+        roll = rng.random()
+        if roll < 0.02:
+            directory = directory / "build"
+            directory.mkdir(exist_ok=True)
+            name = f"out_{i}.o"
+        elif roll < 0.1:
+            name = f"{i}_{rng.choice(IGNORED_NAMES)}"
+        else:
+            name = f"m_{i}.{rng.choice(['py', 'py', 'md', 'txt', 'json'])}"
+
+        path = directory / name
+        size = _pick_size(rng)
+        offset = rng.randrange(len(block) - size + 1)
+        with open(path, "wb") as f:
+            f.write(block[offset : offset + size])
+        os.utime(path, (mtime, mtime))
+
+
+def _pick_size(rng: random.Random) -> int:
+    roll = rng.random()
+    for probability, low, high in SIZE_MIX:
+        if roll < probability:
+            return rng.randint(low, high)
+        roll -= probability
+    return 0
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> Tuple[float, object]:
+    best = float("inf")
+    result: object = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_size(root: Path, repeat: int) -> Dict[str, float]:
+    def walk() -> List[str]:
+        # Measure the cold walk: compiled ignore rules are cached per process
+        walker._RULES_CACHE.clear()
+        return walk_source_files(root, ["src"])
+
+    timings: Dict[str, float] = {}
+    timings["walk"], files = best_of(repeat, walk)
+    assert isinstance(files, list)
+
+    timings["file_sha256"], _ = best_of(
+        repeat, lambda: [file_sha256(root / p) for p in files]
+    )
+    timings["hash_files"], file_hashes = best_of(
+        repeat, lambda: hash_files(root, files)
+    )
+    assert isinstance(file_hashes, dict)
+
+    geas_dir = root / ".geas"
+    shutil.rmtree(geas_dir, ignore_errors=True)
+    cache = HashCache.load(geas_dir)
+    hash_files(root, files, cache=cache)
+    cache.save()
+    timings["hash_cached"], _ = best_of(
+        repeat, lambda: hash_files(root, files, cache=HashCache.load(geas_dir))
+    )
+
+    timings["merkle_root"], _ = best_of(
+        repeat, lambda: calculate_merkle_root(file_hashes)
+    )
+    print(f"  {len(files)} files in scope")
+    return timings
+
+
+def compare(
+    current: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    min_seconds: float,
+) -> List[str]:
+    """Returns a description of every timing that regressed beyond the threshold."""
+    regressions = []
+    for size, timings in current.items():
+        for metric, seconds in timings.items():
+            before = baseline.get(size, {}).get(metric)
+            if before is None:
+                continue
+            if seconds > before * (1 + threshold) and seconds - before > min_seconds:
+                regressions.append(
+                    f"{size} {metric}: {before:.3f}s -> {seconds:.3f}s "
+                    f"(+{(seconds / before - 1) * 100 if before else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+def load_results(path: Path) -> Optional[Dict[str, Dict[str, float]]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != RESULTS_VERSION:
+        return None
+    results: Dict[str, Dict[str, float]] = data["results"]
+    return results
+
+
+def save_results(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    data = {
+        "version": RESULTS_VERSION,
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": {
+            size: {metric: round(seconds, 4) for metric, seconds in timings.items()}
+            for size, timings in results.items()
+        },
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        default="10k,100k",
+        help=f"Comma-separated tree sizes ({', '.join(SIZES)}; 1m is opt-in)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        help="Keep the generated trees here and reuse them on later runs",
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.05,
+        help="Ignore slowdowns smaller than this, whatever the ratio (timer noise)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip().lower() for s in args.sizes.split(",")]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)}")
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="geas-bench-"))
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for size in sizes:
+            root = workdir / size
+            if not (root / "src").is_dir():
+                print(f"Generating {size} tree in {root}...")
+                make_tree(root, SIZES[size])
+            print(f"Benchmarking {size}...")
+            results[size] = run_size(root, args.repeat)
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    save_results(args.output, results)
+    baseline = None if args.update_baseline else load_results(args.baseline)
+
+    print(f"\n{'size':<6} {'metric':<12} {'seconds':>9} {'baseline':>9} {'ratio':>7}")
+    for size, timings in results.items():
+        for metric, seconds in timings.items():
+            before = (baseline or {}).get(size, {}).get(metric)
+            ratio = f"{seconds / before:>7.2f}" if before else f"{'-':>7}"
+            shown = f"{before:>9.3f}" if before is not None else f"{'-':>9}"
+            print(f"{size:<6} {metric:<12} {seconds:>9.3f} {shown} {ratio}")
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if baseline is None:
+        print(
+            f"No baseline at {args.baseline}; run with --update-baseline to record one."
+        )
+        return 0
+
+    regressions = compare(results, baseline, args.threshold, args.min_seconds)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
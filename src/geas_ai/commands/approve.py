@@ -4,7 +4,9 @@ from datetime import datetime, timezone
 from rich.console import Console
 
 from geas_ai import utils
-from geas_ai.core import ledger, identity
+from geas_ai.core import ledger, identity, workflow
+from geas_ai.core.cache import CheckpointCache
+from geas_ai.core.profiling import phase
 from geas_ai.schemas import ledger as ledger_schemas
 from geas_ai.schemas.identity import IdentityRole
 from geas_ai.utils import crypto
@@ -20,29 +22,42 @@ def approve(
     comment: Optional[str] = typer.Option(
         None, "--comment", "-c", help="Optional approval comment"
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Re-check the whole ledger chain instead of resuming from the last verified checkpoint",
+    ),
 ) -> None:
     """Approve the sealed MRP for merge.
 
     Usage:
         $ geas approve --identity tech-lead
         $ geas approve -i tech-lead -c "LGTM"
+        $ geas approve -i tech-lead --full
     """
     utils.ensure_geas_root()
     bolt_path = utils.get_active_bolt_path()
 
-    # 1. Load Ledger
-    ledger_obj = ledger.LedgerManager.load_lock(bolt_path)
+    # 1. Open Ledger (events are read on demand, newest first)
+    ledger_obj = ledger.LedgerManager.open_lock(bolt_path)
     if not ledger_obj:
-        console.print("[bold red]Error:[/bold red] No lock.json found.")
+        console.print("[bold red]Error:[/bold red] No ledger (lock.jsonl) found.")
+        raise typer.Exit(code=1)
+
+    # Verify Chain Integrity before appending (events since the last checkpoint)
+    checkpoints = CheckpointCache.load(utils.get_geas_root())
+    checkpoint = (
+        None if full else ledger.LedgerManager.load_checkpoint(bolt_path, checkpoints)
+    )
+    if not ledger_obj.verify_chain(checkpoint):
+        console.print(
+            "[bold red]CRITICAL:[/bold red] Ledger integrity check failed! The chain is broken."
+        )
         raise typer.Exit(code=1)
 
     # 2. Verify State (Must have SEAL_MRP)
     # Check if SEAL_MRP exists
-    mrp_event = None
-    for event in reversed(ledger_obj.events):
-        if event.action == ledger_schemas.LedgerAction.SEAL_MRP:
-            mrp_event = event
-            break
+    mrp_event = ledger_obj.find_last(ledger_schemas.LedgerAction.SEAL_MRP)
 
     if not mrp_event:
         console.print(
@@ -52,11 +67,8 @@ def approve(
 
     # Check if already approved? (Optional, but good UX)
     # The spec doesn't strictly forbid double approval, but let's warn.
-    for event in ledger_obj.events:
-        if event.action == ledger_schemas.LedgerAction.APPROVE:
-            console.print(
-                "[yellow]Warning: This bolt already has an approval.[/yellow]"
-            )
+    if ledger_obj.find_last(ledger_schemas.LedgerAction.APPROVE):
+        console.print("[yellow]Warning: This bolt already has an approval.[/yellow]")
 
     # 3. Validate Identity
     id_manager = identity.IdentityManager()
@@ -91,7 +103,8 @@ def approve(
 
         # Canonicalize and Sign
         canonical_bytes = crypto.canonicalize_json(payload)
-        signature = crypto.sign(private_key_obj, canonical_bytes)
+        with phase("signing"):
+            signature = crypto.sign(private_key_obj, canonical_bytes)
 
         event_identity = ledger_schemas.EventIdentity(
             signer_id=identity_name,
@@ -109,8 +122,10 @@ def approve(
             event_hash="",  # Set by append
         )
 
-        ledger.LedgerManager.append_event(ledger_obj, event)
-        ledger.LedgerManager.save_lock(bolt_path, ledger_obj)
+        algorithm = workflow.WorkflowManager.load_hash_algorithm(utils.get_geas_root())
+        offset = ledger_obj.append(event, algorithm)
+        ledger.LedgerManager.save_checkpoint(bolt_path, ledger_obj, checkpoints, offset)
+        checkpoints.save()
 
         console.print(
             f"[bold green]Approved![/bold green] Bolt '{ledger_obj.bolt_id}' is approved by '{identity_name}'."
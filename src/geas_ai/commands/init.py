@@ -13,7 +13,8 @@ def init() -> None:
     """Initialize the GEAS governance layer in the current directory.
 
     Creates the .geas/ directory structure and default configuration files.
-    This includes config/agents.yaml, config/models.yaml, and GEAS_MANIFESTO.md.
+    This includes config/agents.yaml, config/models.yaml, GEAS_MANIFESTO.md and a
+    .geas/.gitignore that keeps the machine-local .geas/cache/ out of git.
 
     Usage:
         $ geas init
@@ -46,6 +47,9 @@ def init() -> None:
         with open(os.path.join(base_dir, "config", "identities.yaml"), "w") as f:
             f.write(content.DEFAULT_IDENTITIES_YAML)
 
+        with open(os.path.join(base_dir, ".gitignore"), "w") as f:
+            f.write(content.GEAS_GITIGNORE)
+
         # 4. Create Default Workflow
         yaml = YAML()
         yaml.indent(mapping=2, sequence=4, offset=2)
@@ -67,7 +71,7 @@ def init() -> None:
         # 6. Success Message
         console.print(
             Panel(
-                f"[bold green]Success![/bold green] GEAS initialized at [blue]{os.path.abspath(base_dir)}[/blue]\n\nCreated:\n- .geas/config/agents.yaml\n- .geas/config/models.yaml\n- .geas/config/identities.yaml\n- .geas/config/workflow.yaml\n- GEAS_MANIFESTO.md",
+                f"[bold green]Success![/bold green] GEAS initialized at [blue]{os.path.abspath(base_dir)}[/blue]\n\nCreated:\n- .geas/config/agents.yaml\n- .geas/config/models.yaml\n- .geas/config/identities.yaml\n- .geas/config/workflow.yaml\n- .geas/.gitignore\n- GEAS_MANIFESTO.md",
                 title="GEAS Protocol",
             )
         )
@@ -0,0 +1,140 @@
+import json
+import typer
+from pathlib import Path
+from typing import Optional
+from rich.console import Console
+
+from geas_ai import utils
+from geas_ai.core.manifest import (
+    MANIFEST_FORMATS,
+    ChangeType,
+    Manifest,
+    diff_manifests,
+    find_manifest_path,
+    load_manifest,
+    save_manifest,
+)
+from geas_ai.core.merkle import MERKLE_FILE_NAME, MerkleTree
+
+app = typer.Typer(help="Inspect and compare proof manifests.")
+console = Console()
+
+_CHANGE_STYLES = {
+    ChangeType.ADDED: ("A", "green"),
+    ChangeType.REMOVED: ("D", "red"),
+    ChangeType.MODIFIED: ("M", "yellow"),
+}
+
+
+@app.command("diff")
+def diff(
+    old: str = typer.Argument(..., help="Manifest file, or bolt name, to compare from"),
+    new: str = typer.Argument(..., help="Manifest file, or bolt name, to compare to"),
+    json_output: bool = typer.Option(
+        False, "--json", help="Output one JSON object per changed path"
+    ),
+) -> None:
+    """
+    Show the files added, removed and modified between two proofs.
+
+    Usage:
+        $ geas manifest diff feature-a feature-b
+        $ geas manifest diff old/manifest.json .geas/bolts/feature-a/mrp/manifest.json
+    """
+    old_path = _resolve_manifest_path(old)
+    new_path = _resolve_manifest_path(new)
+
+    old_manifest = _load_or_exit(old_path)
+    new_manifest = _load_or_exit(new_path)
+
+    counts = {change: 0 for change in ChangeType}
+    for change in diff_manifests(
+        old_manifest.files,
+        new_manifest.files,
+        _load_tree(old_manifest, old_path),
+        _load_tree(new_manifest, new_path),
+    ):
+        counts[change.change] += 1
+        if json_output:
+            typer.echo(
+                json.dumps(
+                    {
+                        "change": change.change.value,
+                        "path": change.path,
+                        "old_hash": change.old_hash,
+                        "new_hash": change.new_hash,
+                    }
+                )
+            )
+        else:
+            letter, style = _CHANGE_STYLES[change.change]
+            console.print(
+                f"{letter}  {change.path}", style=style, markup=False, highlight=False
+            )
+
+    if not json_output:
+        console.print(
+            f"\n[bold]{counts[ChangeType.ADDED]}[/bold] added, "
+            f"[bold]{counts[ChangeType.REMOVED]}[/bold] removed, "
+            f"[bold]{counts[ChangeType.MODIFIED]}[/bold] modified"
+        )
+
+
+@app.command("convert")
+def convert(
+    source: str = typer.Argument(..., help="Manifest file, or bolt name, to convert"),
+    destination: Path = typer.Argument(..., help="Output manifest file"),
+    to: Optional[str] = typer.Option(
+        None,
+        "--to",
+        help="Output format: 'json' or 'binary' (default: from the output file extension)",
+    ),
+) -> None:
+    """
+    Convert a manifest between the JSON and the compact binary format.
+
+    Usage:
+        $ geas manifest convert feature-a manifest.json
+        $ geas manifest convert manifest.json manifest.bin
+    """
+    fmt = to or ("binary" if destination.suffix == ".bin" else "json")
+    if fmt not in MANIFEST_FORMATS:
+        console.print(
+            f"[bold red]Error:[/bold red] Invalid format '{fmt}'. Use: {', '.join(MANIFEST_FORMATS)}"
+        )
+        raise typer.Exit(code=1)
+
+    manifest = _load_or_exit(_resolve_manifest_path(source))
+    save_manifest(manifest, destination, fmt)
+    console.print(
+        f"Wrote {len(manifest.files)} entries to [bold]{destination}[/bold] ({fmt})"
+    )
+
+
+def _resolve_manifest_path(ref: str) -> Path:
+    """Accepts a manifest file, an mrp/ or bolt directory, or a bolt name."""
+    path = Path(ref)
+    if path.is_file():
+        return path
+    if path.is_dir():
+        for mrp_dir in (path, path / "mrp"):
+            candidate = find_manifest_path(mrp_dir)
+            if candidate.is_file():
+                return candidate
+    return find_manifest_path(utils.get_geas_root() / "bolts" / ref / "mrp")
+
+
+def _load_or_exit(path: Path) -> Manifest:
+    manifest = load_manifest(path)
+    if manifest is None:
+        console.print(f"[bold red]Error:[/bold red] Manifest not found: {path}")
+        raise typer.Exit(code=1)
+    return manifest
+
+
+def _load_tree(manifest: Manifest, manifest_path: Path) -> Optional[MerkleTree]:
+    """Returns the persisted Merkle levels next to a manifest, if they match it."""
+    tree = MerkleTree.load(manifest_path.parent / MERKLE_FILE_NAME, manifest.algorithm)
+    if tree is not None and tree.root == manifest.root_hash:
+        return tree
+    return None
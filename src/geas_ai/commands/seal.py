@@ -7,6 +7,8 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 from geas_ai import utils
 from geas_ai.core import ledger, hashing, identity, workflow
+from geas_ai.core.cache import CheckpointCache
+from geas_ai.core.profiling import phase
 from geas_ai.schemas import ledger as ledger_schemas
 from geas_ai.utils import crypto
 from cryptography.hazmat.primitives.asymmetric import ed25519
@@ -24,6 +26,11 @@ def seal(
     context: Optional[str] = typer.Option(
         None, "--context", "-c", help="Context message for the event"
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Re-check the whole ledger chain instead of resuming from the last verified checkpoint",
+    ),
 ) -> None:
     """Cryptographically seal the current Bolt's artifacts.
 
@@ -35,6 +42,7 @@ def seal(
     Usage:
         $ geas seal req
         $ geas seal intent --identity arch-lead
+        $ geas seal plan --full
     """
     utils.ensure_geas_root()
     bolt_path = utils.get_active_bolt_path()
@@ -43,25 +51,40 @@ def seal(
     ledger_obj = ledger.LedgerManager.load_lock(bolt_path)
     if not ledger_obj:
         console.print(
-            "[bold red]Error:[/bold red] lock.json not found. Is this a valid bolt?"
+            "[bold red]Error:[/bold red] Ledger (lock.jsonl) not found. Is this a valid bolt?"
         )
         raise typer.Exit(code=1)
 
-    # Verify Chain Integrity before appending
-    if not ledger.LedgerManager.verify_chain_integrity(ledger_obj):
+    # Verify Chain Integrity before appending (events since the last checkpoint)
+    checkpoints = CheckpointCache.load(utils.get_geas_root())
+    checkpoint = (
+        None if full else ledger.LedgerManager.load_checkpoint(bolt_path, checkpoints)
+    )
+    if not ledger.LedgerManager.verify_chain_integrity(ledger_obj, checkpoint):
         console.print(
             "[bold red]CRITICAL:[/bold red] Ledger integrity check failed! The chain is broken."
         )
         raise typer.Exit(code=1)
 
+    try:
+        algorithm = workflow.WorkflowManager.load_hash_algorithm(utils.get_geas_root())
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
     # Dispatch Logic
+    persisted = len(ledger_obj.events)
     if target == "intent":
-        _seal_intent(bolt_path, ledger_obj, identity_name, context)
+        _seal_intent(bolt_path, ledger_obj, identity_name, context, algorithm)
     else:
-        _seal_artifact(bolt_path, ledger_obj, target, identity_name, context)
+        _seal_artifact(bolt_path, ledger_obj, target, identity_name, context, algorithm)
 
-    # Save Ledger
-    ledger.LedgerManager.save_lock(bolt_path, ledger_obj)
+    # Save Ledger (appends the new event)
+    offset = ledger.LedgerManager.append_lock(
+        bolt_path, ledger_obj, len(ledger_obj.events) - persisted
+    )
+    ledger.LedgerManager.save_checkpoint(bolt_path, ledger_obj, checkpoints, offset)
+    checkpoints.save()
 
     # ledger_obj.head_hash is Optional[str], but after seal it should be str.
     head_hash_display = ledger_obj.head_hash[:12] if ledger_obj.head_hash else "None"
@@ -80,6 +103,7 @@ def _seal_artifact(
     target: str,
     identity_name: Optional[str],
     context: Optional[str],
+    algorithm: str = hashing.DEFAULT_HASH_ALGORITHM,
 ) -> None:
     # 1. Map Target to File and Action
     mapping = {
@@ -105,7 +129,7 @@ def _seal_artifact(
         raise typer.Exit(code=1)
 
     # 2. Hash Content
-    file_hash = hashing.file_sha256(file_path)
+    file_hash = hashing.file_hash(file_path, algorithm)
 
     # 3. Handle Identity (Optional)
     event_identity = None
@@ -129,7 +153,7 @@ def _seal_artifact(
         event_hash="",  # Will be set by append_event
     )
 
-    ledger.LedgerManager.append_event(ledger_obj, event)
+    ledger.LedgerManager.append_event(ledger_obj, event, algorithm)
 
 
 def _seal_intent(
@@ -137,6 +161,7 @@ def _seal_intent(
     ledger_obj: ledger_schemas.Ledger,
     identity_name: Optional[str],
     context: Optional[str],
+    algorithm: str = hashing.DEFAULT_HASH_ALGORITHM,
 ) -> None:
     # 1. Validation: Identity Required
     if not identity_name:
@@ -168,7 +193,7 @@ def _seal_intent(
                 f"[bold red]Error:[/bold red] Required document '{filename}' not found."
             )
             raise typer.Exit(code=1)
-        file_hashes[filename] = hashing.file_sha256(path)
+        file_hashes[filename] = hashing.file_hash(path, algorithm)
 
     # 3. Create Payload for Signing
     # We sign the hashes of the documents
@@ -187,7 +212,7 @@ def _seal_intent(
         event_hash="",
     )
 
-    ledger.LedgerManager.append_event(ledger_obj, event)
+    ledger.LedgerManager.append_event(ledger_obj, event, algorithm)
 
 
 def _create_event_signature(
@@ -228,7 +253,8 @@ def _create_event_signature_from_payload(
 
         # Canonicalize and Sign
         canonical_bytes = crypto.canonicalize_json(payload)
-        signature = crypto.sign(private_key, canonical_bytes)
+        with phase("signing"):
+            signature = crypto.sign(private_key, canonical_bytes)
 
         return ledger_schemas.EventIdentity(
             signer_id=identity_name,
@@ -1,9 +1,11 @@
 import typer
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Optional
 from rich.console import Console
 from rich.table import Table
 from geas_ai import utils
 from geas_ai.core.ledger import LedgerManager
+from geas_ai.schemas.ledger import LedgerEvent
 
 console = Console()
 
@@ -12,12 +14,16 @@ def status(
     bolt: Optional[str] = typer.Option(
         None, "--bolt", "-b", help="Name of the bolt to check status for"
     ),
+    last: Optional[int] = typer.Option(
+        None, "--last", "-n", min=1, help="Only list the N most recent events"
+    ),
 ) -> None:
     """Display the current seal status of a bolt.
 
     Usage:
         $ geas status
         $ geas status -b feature-login
+        $ geas status --last 5
     """
     utils.ensure_geas_root()
 
@@ -29,12 +35,12 @@ def status(
     else:
         bolt_path = utils.get_active_bolt_path()
 
-    # Load Ledger
-    ledger = LedgerManager.load_lock(bolt_path)
+    # Open Ledger (only the header and the head are read up front)
+    ledger = LedgerManager.open_lock(bolt_path)
 
-    if not ledger or not ledger.events:
+    if not ledger or not ledger.head:
         console.print(
-            f"[yellow]No ledger (lock.json) found or empty for bolt '{bolt_path.name}'. Not Sealed.[/yellow]"
+            f"[yellow]No ledger (lock.jsonl) found or empty for bolt '{bolt_path.name}'. Not Sealed.[/yellow]"
         )
         return
 
@@ -43,7 +49,7 @@ def status(
     console.print(f"[bold]Created:[/bold] {ledger.created_at}")
 
     # Determine State (Last Event)
-    last_event = ledger.events[-1]
+    last_event = ledger.head
     state_display = f"[cyan]{last_event.action.value}[/cyan]"
     console.print(f"[bold]Current State:[/bold] {state_display}")
     console.print()
@@ -55,7 +61,12 @@ def status(
     table.add_column("Action", style="cyan")
     table.add_column("Signer", style="magenta")
 
-    for event in ledger.events:
+    events: Iterable[LedgerEvent] = ledger
+    if last is not None:
+        # Read from the tail, then list oldest first
+        events = reversed(list(islice(ledger.reversed(), last)))
+
+    for event in events:
         signer = "-"
         if event.identity:
             signer = f"{event.identity.signer_id}"
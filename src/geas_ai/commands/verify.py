@@ -1,12 +1,20 @@
 import typer
 import json
 from typing import Optional
+from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from geas_ai import utils
 from geas_ai.core import verification, workflow as workflow_core
 from geas_ai.core.ledger import LedgerManager
+from geas_ai.core.cache import CheckpointCache, HashCache
+from geas_ai.core.hashing import digest_file
+from geas_ai.core.manifest import (
+    lookup_manifest_file,
+    normalize_manifest_path,
+)
+from geas_ai.core.merkle import verify_inclusion
 from geas_ai.core.identity import IdentityManager
 from geas_ai.schemas.verification import (
     ChainValidationResult,
@@ -26,13 +34,33 @@ def verify(
         False, "--content", help="Also verify sealed file contents match hashes"
     ),
     json_output: bool = typer.Option(False, "--json", help="Output results as JSON"),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        "--rehash",
+        help="Re-hash sealed files instead of trusting the hash cache",
+    ),
+    file: Optional[str] = typer.Option(
+        None,
+        "--file",
+        help="Only check that one file matches the proof manifest's root_hash",
+    ),
+    full: bool = typer.Option(
+        True,
+        "--full/--resume",
+        help="Check the whole ledger chain (default), or resume from the last checkpoint "
+        "verified on this machine",
+    ),
 ) -> None:
     """Verify the cryptographic integrity and governance compliance of a bolt.
 
     Usage:
         $ geas verify
         $ geas verify --content
+        $ geas verify --content --rehash
         $ geas verify --json
+        $ geas verify --file src/geas_ai/main.py
+        $ geas verify --resume
     """
     utils.ensure_geas_root()
 
@@ -44,10 +72,14 @@ def verify(
     else:
         bolt_path = utils.get_active_bolt_path()
 
+    if file:
+        _verify_file(bolt_path, file, json_output)
+        return
+
     # 1. Load Data
     ledger = LedgerManager.load_lock(bolt_path)
     if not ledger:
-        msg = f"No lock.json found for bolt '{bolt_path.name}'."
+        msg = f"No ledger (lock.jsonl) found for bolt '{bolt_path.name}'."
         if json_output:
             print(json.dumps({"error": msg, "valid": False}))
         else:
@@ -61,28 +93,44 @@ def verify(
     id_manager = IdentityManager()
     identities = id_manager.load()
 
-    # 2. Run Validations
-    chain_res = verification.validate_chain_integrity(ledger)
-    sig_res = verification.validate_signatures(ledger, identities)
-    flow_res = verification.validate_workflow_compliance(
-        ledger, workflow_config, identities
+    # 2. Run Validations (a single pass over the events)
+    checkpoints = CheckpointCache.load(utils.get_geas_root())
+    checkpoint = None if full else LedgerManager.load_checkpoint(bolt_path, checkpoints)
+    cache = None
+    if check_content and not no_cache:
+        cache = HashCache.load(utils.get_geas_root())
+    result = verification.verify_ledger(
+        ledger,
+        workflow_config,
+        identities,
+        bolt_path=bolt_path if check_content else None,
+        cache=cache,
+        checkpoint=checkpoint,
     )
-
-    content_res = None
-    if check_content:
-        content_res = verification.validate_content_integrity(ledger, bolt_path)
+    if cache is not None:
+        cache.save()
+    if result.chain.valid:
+        LedgerManager.save_checkpoint(bolt_path, ledger, checkpoints)
+        checkpoints.save()
 
     # 3. Aggregate Results
-    overall_valid = chain_res.valid and sig_res.valid and flow_res.valid
-    if content_res:
-        overall_valid = overall_valid and content_res.valid
+    chain_res = result.chain
+    sig_res = result.signatures
+    flow_res = result.workflow
+    content_res = result.content
+    overall_valid = result.valid
 
     # 4. Output
     if json_output:
         output = {
             "bolt": bolt_path.name,
             "valid": overall_valid,
-            "chain": chain_res.model_dump(mode="json"),
+            # resumed_from is only reported when set, so a full check keeps
+            # the output it had before checkpoints existed
+            "chain": chain_res.model_dump(
+                mode="json",
+                exclude={"resumed_from"} if chain_res.resumed_from is None else None,
+            ),
             "signatures": sig_res.model_dump(mode="json"),
             "workflow": flow_res.model_dump(mode="json"),
         }
@@ -98,6 +146,70 @@ def verify(
         raise typer.Exit(code=1)
 
 
+def _verify_file(bolt_path: Path, file: str, json_output: bool) -> None:
+    """Checks one file against the proof manifest via its Merkle audit path."""
+    mrp_dir = bolt_path / "mrp"
+    rel_path = normalize_manifest_path(file)
+    lookup = lookup_manifest_file(mrp_dir, rel_path)
+    if not lookup:
+        msg = f"No proof manifest found for bolt '{bolt_path.name}'."
+        if json_output:
+            print(json.dumps({"error": msg, "valid": False}))
+        else:
+            console.print(f"[bold red]Fail:[/bold red] {msg}")
+        raise typer.Exit(code=1)
+
+    # Manifest keys are relative to the project root (<root>/.geas/bolts/<bolt>),
+    # not to the current directory
+    file_path = bolt_path.resolve().parents[2] / rel_path
+    proof = lookup.proof
+    current_hash = None
+    if file_path.is_file():
+        current_hash = digest_file(file_path, lookup.algorithm)
+
+    in_manifest = proof is not None
+    proof_valid = proof is not None and verify_inclusion(
+        proof.leaf_hash, proof.audit_path, lookup.root_hash, lookup.algorithm
+    )
+    content_valid = proof is not None and current_hash == proof.leaf_hash
+    valid = proof_valid and content_valid
+
+    if json_output:
+        output = {
+            "bolt": bolt_path.name,
+            "file": rel_path,
+            "valid": valid,
+            "in_manifest": in_manifest,
+            "proof_valid": proof_valid,
+            "root_hash": lookup.root_hash,
+            "expected_hash": proof.leaf_hash if proof else None,
+            "actual_hash": current_hash,
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        console.print(
+            Panel(f"[bold]File Verification:[/bold] {rel_path}", expand=False)
+        )
+        if not in_manifest:
+            console.print(f"[red]FAIL[/red] '{rel_path}' is not in the manifest.")
+        elif current_hash is None:
+            console.print(f"[red]FAIL[/red] '{rel_path}' is missing.")
+        elif not content_valid:
+            console.print(f"[red]FAIL[/red] '{rel_path}' has been modified.")
+        elif not proof_valid:
+            console.print(
+                "[red]FAIL[/red] Audit path does not lead to the manifest root_hash."
+            )
+        else:
+            console.print(
+                f"[bold green]PASS[/bold green] Included in root {lookup.root_hash[:12]}... "
+                f"({len(proof.audit_path) if proof else 0} hashes)"
+            )
+
+    if not valid:
+        raise typer.Exit(code=1)
+
+
 def _print_report(
     bolt_name: str,
     valid: bool,
@@ -117,9 +229,10 @@ def _print_report(
     def status_style(is_valid: bool) -> str:
         return "[green]PASS[/green]" if is_valid else "[red]FAIL[/red]"
 
-    table.add_row(
-        "Chain Integrity", status_style(chain.valid), f"{chain.event_count} events"
-    )
+    chain_details = f"{chain.event_count} events"
+    if chain.resumed_from is not None:
+        chain_details += f" (checked from checkpoint #{chain.resumed_from})"
+    table.add_row("Chain Integrity", status_style(chain.valid), chain_details)
     table.add_row(
         "Signatures", status_style(sig.valid), f"{sig.verified_count} verified"
     )
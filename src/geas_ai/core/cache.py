@@ -0,0 +1,308 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
+
+from geas_ai.core.manifest import TestResultInfo
+
+CACHE_DIR_NAME = "cache"
+HASH_CACHE_FILE_NAME = "hashes.json"
+HASH_CACHE_VERSION = 2
+TEST_CACHE_FILE_NAME = "tests.json"
+TEST_CACHE_VERSION = 1
+# Oldest entries are dropped beyond this many cached test results
+TEST_CACHE_MAX_ENTRIES = 256
+IMPORT_CACHE_FILE_NAME = "imports.json"
+IMPORT_CACHE_VERSION = 1
+CHECKPOINT_CACHE_FILE_NAME = "checkpoints.json"
+CHECKPOINT_CACHE_VERSION = 1
+GIT_WALK_CACHE_FILE_NAME = "gitwalk.json"
+GIT_WALK_CACHE_VERSION = 1
+
+# Files modified this recently are not cached: a write landing in the same
+# timestamp tick as our stat() would otherwise go unnoticed ("racy clean").
+RACY_WINDOW_NS = 2_000_000_000
+
+_C = TypeVar("_C", bound="_JsonCache")
+
+
+class _JsonCache:
+    """
+    A dict of entries persisted as .geas/cache/<FILE_NAME>.
+
+    The file holds {"version": VERSION, "entries": {...}}. A missing,
+    corrupted or other-version file loads as an empty (cold) cache, and
+    save() only writes, atomically, when an entry changed.
+    """
+
+    FILE_NAME: str
+    VERSION: int
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.entries: Dict[str, Any] = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls: Type[_C], geas_dir: Path) -> _C:
+        """Loads <geas_dir>/cache/<FILE_NAME> (empty if missing or unreadable)."""
+        path = geas_dir / CACHE_DIR_NAME / cls.FILE_NAME
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == cls.VERSION:
+                return cls(path, data.get("entries", {}))
+        except (OSError, ValueError, AttributeError):
+            # A missing or corrupted cache is just a cold cache
+            pass
+        return cls(path)
+
+    def save(self) -> None:
+        """Writes the cache atomically if it changed since it was loaded."""
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": self.VERSION, "entries": self.entries},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+class HashCache(_JsonCache):
+    """
+    Persistent content-hash cache stored in .geas/cache/hashes.json.
+
+    Entries are keyed by POSIX path relative to the project root (the parent
+    of .geas/) and validated against the file's (size, mtime_ns, inode) stat
+    tuple. A stat mismatch is a cache miss, so a file is only re-hashed when
+    it actually changed on disk.
+    """
+
+    FILE_NAME = HASH_CACHE_FILE_NAME
+    VERSION = HASH_CACHE_VERSION
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, Any]] = None):
+        super().__init__(path, entries)
+        # <root>/.geas/cache/hashes.json
+        self.root = os.path.abspath(path.parent.parent.parent)
+        self._lock = threading.Lock()
+        self._seen: Set[str] = set()
+
+    def key(self, file_path: Path) -> str:
+        """Returns the cache key of a file: its path relative to the project root."""
+        return Path(os.path.relpath(os.path.abspath(file_path), self.root)).as_posix()
+
+    def key_prefix(self, root_dir: Path) -> str:
+        """Returns the prefix turning a path relative to root_dir into a key."""
+        prefix = self.key(root_dir)
+        return "" if prefix == "." else prefix + "/"
+
+    def lookup(
+        self, key: str, st: os.stat_result, algorithm: str = "sha256"
+    ) -> Optional[str]:
+        """Returns the cached hex digest for `key` if its stat data is unchanged."""
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry is None or not _stat_matches(entry, st):
+            return None
+        digest = entry["digests"].get(algorithm)
+        return str(digest) if digest is not None else None
+
+    def store(
+        self, key: str, st: os.stat_result, digest: str, algorithm: str = "sha256"
+    ) -> None:
+        """Records the hex digest of `key` for the given stat data."""
+        if time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS:
+            # Racily clean: the file may still change within the same mtime tick
+            return
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or not _stat_matches(entry, st):
+                entry = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "ino": st.st_ino,
+                    "digests": {},
+                }
+                self.entries[key] = entry
+            if entry["digests"].get(algorithm) != digest:
+                entry["digests"][algorithm] = digest
+                self._dirty = True
+
+    def prune(self) -> int:
+        """
+        Drops the entries of files that no longer exist.
+
+        Only the entries not looked up since the cache was loaded are
+        checked, so after hashing a whole scope this costs one stat per
+        file that left it rather than one per entry.
+
+        Returns:
+            The number of entries dropped.
+        """
+        gone = [
+            key
+            for key in self.entries
+            if key not in self._seen
+            and not os.path.isfile(os.path.join(self.root, key))
+        ]
+        for key in gone:
+            del self.entries[key]
+        if gone:
+            self._dirty = True
+        return len(gone)
+
+
+class TestResultCache(_JsonCache):
+    """
+    Passing test results of previous proofs, stored in .geas/cache/tests.json.
+
+    A result is keyed by the Merkle root of the proven scope together with
+    the test command and the scope itself: if none of those changed, the
+    same suite would run against the same files. Anything outside the scope
+    (interpreter, environment, files not in scope) is not part of the key,
+    which is why `geas prove --force-tests` exists.
+    """
+
+    FILE_NAME = TEST_CACHE_FILE_NAME
+    VERSION = TEST_CACHE_VERSION
+
+    @staticmethod
+    def key(root_hash: str, command: str, scope: List[str]) -> str:
+        material = json.dumps([root_hash, command, sorted(scope)])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[TestResultInfo]:
+        """Returns the cached passing result for `key`, if any."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            result = TestResultInfo.model_validate(entry)
+        except ValueError:
+            return None
+        return result if result.passed and not result.skipped else None
+
+    def store(self, key: str, result: TestResultInfo) -> None:
+        """Records a passing result; failures and skipped runs are never cached."""
+        if not result.passed or result.skipped:
+            return
+        self.entries.pop(key, None)
+        self.entries[key] = result.model_dump(mode="json")
+        # Entries are kept in insertion order, so the first ones are the oldest
+        while len(self.entries) > TEST_CACHE_MAX_ENTRIES:
+            del self.entries[next(iter(self.entries))]
+        self._dirty = True
+
+
+class ImportCache(_JsonCache):
+    """
+    Parsed imports of Python sources, stored in .geas/cache/imports.json.
+
+    Entries are keyed by file path and validated against the file's content
+    digest (as computed for the manifest), so only changed files are parsed
+    again when the import graph is rebuilt.
+    """
+
+    FILE_NAME = IMPORT_CACHE_FILE_NAME
+    VERSION = IMPORT_CACHE_VERSION
+
+    def lookup(self, key: str, digest: str) -> Optional[List[str]]:
+        """Returns the cached imported module names of `key` if its digest is unchanged."""
+        entry = self.entries.get(key)
+        if entry is None or entry.get("digest") != digest:
+            return None
+        return list(entry["imports"])
+
+    def store(self, key: str, digest: str, imports: List[str]) -> None:
+        """Records the imported module names of `key` at `digest`."""
+        self.entries[key] = {"digest": digest, "imports": imports}
+        self._dirty = True
+
+    def retain(self, keys: Set[str]) -> None:
+        """Drops the entries of files that are no longer in scope."""
+        for key in [k for k in self.entries if k not in keys]:
+            del self.entries[key]
+            self._dirty = True
+
+
+class CheckpointCache(_JsonCache):
+    """
+    Verified ledger prefixes, stored in .geas/cache/checkpoints.json.
+
+    Entries are keyed by ledger file path and hold the sequence number and
+    event hash of the last event whose chain was verified, plus the offset
+    where that event's line ends, so a later check only needs to cover the
+    events appended since (see LedgerManager.load_checkpoint).
+    """
+
+    FILE_NAME = CHECKPOINT_CACHE_FILE_NAME
+    VERSION = CHECKPOINT_CACHE_VERSION
+
+    def lookup(self, key: str) -> Optional[Tuple[int, str, int]]:
+        """Returns the (sequence, event hash, offset) recorded for `key`."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            return (
+                int(entry["sequence"]),
+                str(entry["event_hash"]),
+                int(entry["offset"]),
+            )
+        except (TypeError, KeyError, ValueError):
+            return None
+
+    def store(self, key: str, sequence: int, event_hash: str, offset: int) -> None:
+        """Records the verified prefix of `key`."""
+        entry = {"sequence": sequence, "event_hash": event_hash, "offset": offset}
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self._dirty = True
+
+
+class GitWalkCache(_JsonCache):
+    """
+    Tracked files matched by the ignore rules, stored in .geas/cache/gitwalk.json.
+
+    Holds a single answer: the key identifying the tracked paths and the
+    ignore rules in effect for them, and the tracked paths those rules
+    ignore (see walker._tracked_ignored).
+    """
+
+    FILE_NAME = GIT_WALK_CACHE_FILE_NAME
+    VERSION = GIT_WALK_CACHE_VERSION
+
+    def lookup(self, key: str) -> Optional[Set[str]]:
+        """Returns the ignored tracked paths recorded for `key`, if any."""
+        if self.entries.get("key") != key:
+            return None
+        ignored = self.entries.get("ignored")
+        if not isinstance(ignored, list) or not all(
+            isinstance(path, str) for path in ignored
+        ):
+            return None
+        return set(ignored)
+
+    def store(self, key: str, ignored: Set[str]) -> None:
+        """Records the ignored tracked paths for `key`."""
+        self.entries = {"key": key, "ignored": sorted(ignored)}
+        self._dirty = True
+
+
+def _stat_matches(entry: Dict[str, Any], st: os.stat_result) -> bool:
+    return bool(
+        entry.get("size") == st.st_size
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("ino") == st.st_ino
+    )
@@ -0,0 +1,273 @@
+import bisect
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+COMPACT_MAGIC = b"GEASMAN1"
+# Every RESTART_INTERVAL-th path is stored in full, so lookups can bisect
+RESTART_INTERVAL = 64
+
+# magic, header length, file count, digest size, restart count
+_PREAMBLE = struct.Struct("<8sIQII")
+
+
+class CompactManifest:
+    """
+    Read-only view of a compact binary manifest, usually backed by a memory map.
+
+    Layout (little-endian):
+    - Preamble: magic, header length, file count, digest size, restart count.
+    - Header: JSON object with every manifest field except `files`.
+    - Digests: file_count packed raw digests of digest_size bytes each.
+    - Restart table: uint64 offsets (into the path table) of every
+      RESTART_INTERVAL-th entry.
+    - Path table: sorted UTF-8 paths, each stored as
+      varint(shared prefix length), varint(suffix length), suffix.
+      Restart entries always have a shared prefix length of 0.
+
+    Digests are read straight out of the mapping by index, and a single path
+    is found by bisecting the restart entries and scanning at most
+    RESTART_INTERVAL entries, so neither needs the whole table decoded.
+    """
+
+    def __init__(self, data: Any):
+        self._data = data
+        try:
+            magic, header_len, count, digest_size, restarts = _PREAMBLE.unpack_from(
+                data, 0
+            )
+        except struct.error:
+            raise ValueError("Truncated compact manifest.")
+        if magic != COMPACT_MAGIC:
+            raise ValueError("Not a compact manifest.")
+
+        offset = _PREAMBLE.size
+        self.header: Dict[str, Any] = json.loads(
+            bytes(data[offset : offset + header_len])
+        )
+        offset += header_len
+
+        self.count: int = count
+        self.digest_size: int = digest_size
+        self._digests_offset = offset
+        offset += count * digest_size
+
+        restart_table = struct.Struct(f"<{restarts}Q")
+        self._restarts: Tuple[int, ...] = restart_table.unpack_from(data, offset)
+        self._paths_offset = offset + restart_table.size
+        if self._paths_offset > len(data):
+            raise ValueError("Truncated compact manifest.")
+
+    @classmethod
+    def open(cls, path: Path) -> "CompactManifest":
+        """Memory-maps a compact manifest file."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped)
+        except BaseException:
+            mapped.close()
+            raise
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> "CompactManifest":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def digest_at(self, index: int) -> str:
+        """Returns the hex digest of the index-th file (in path order)."""
+        start = self._digests_offset + index * self.digest_size
+        return bytes(self._data[start : start + self.digest_size]).hex()
+
+    def digests(self) -> List[str]:
+        """Returns every hex digest in path order, without decoding any path."""
+        if not self.count:
+            return []
+        width = self.digest_size * 2
+        start = self._digests_offset
+        blob = bytes(self._data[start : start + self.count * self.digest_size]).hex()
+        return [blob[i : i + width] for i in range(0, len(blob), width)]
+
+    def paths(self) -> Iterator[str]:
+        """Decodes every path in sorted order."""
+        # Sequential decode of the whole table: copy it out of the mapping
+        # once and inline the (almost always single-byte) varints
+        table = bytes(self._data[self._paths_offset :])
+        offset = 0
+        previous = b""
+        for _ in range(self.count):
+            shared = table[offset]
+            if shared < 0x80:
+                offset += 1
+            else:
+                shared, offset = _read_varint(table, offset)
+            length = table[offset]
+            if length < 0x80:
+                offset += 1
+            else:
+                length, offset = _read_varint(table, offset)
+            previous = previous[:shared] + table[offset : offset + length]
+            offset += length
+            yield previous.decode("utf-8")
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Yields (path, hex digest) pairs in sorted order."""
+        # One hex conversion for the whole digest block, then slice it
+        width = self.digest_size * 2
+        start = self._digests_offset
+        digests = bytes(self._data[start : start + self.count * self.digest_size])
+        hex_digests = digests.hex()
+        for index, path in enumerate(self.paths()):
+            yield path, hex_digests[index * width : (index + 1) * width]
+
+    def index_of(self, path: str) -> Optional[int]:
+        """Finds a path's index without decoding the whole table."""
+        target = path.encode("utf-8")
+        restart_paths = _LazyRestartPaths(self)
+        block = bisect.bisect_right(restart_paths, target) - 1
+        if block < 0:
+            return None
+
+        offset = self._paths_offset + self._restarts[block]
+        previous = b""
+        first = block * RESTART_INTERVAL
+        for index in range(first, min(first + RESTART_INTERVAL, self.count)):
+            previous, offset = self._decode_entry(offset, previous)
+            if previous == target:
+                return index
+            if previous > target:
+                break
+        return None
+
+    def get(self, path: str) -> Optional[str]:
+        """Returns the hex digest of `path`, or None if it is not in the manifest."""
+        index = self.index_of(path)
+        return self.digest_at(index) if index is not None else None
+
+    def _decode_entry(self, offset: int, previous: bytes) -> Tuple[bytes, int]:
+        shared, offset = _read_varint(self._data, offset)
+        length, offset = _read_varint(self._data, offset)
+        suffix = bytes(self._data[offset : offset + length])
+        return previous[:shared] + suffix, offset + length
+
+
+class _LazyRestartPaths:
+    """Sequence of restart-point paths, decoded on access (for bisect)."""
+
+    def __init__(self, manifest: CompactManifest):
+        self._manifest = manifest
+
+    def __len__(self) -> int:
+        return len(self._manifest._restarts)
+
+    def __getitem__(self, block: int) -> bytes:
+        offset = self._manifest._paths_offset + self._manifest._restarts[block]
+        path, _ = self._manifest._decode_entry(offset, b"")
+        return path
+
+
+def write_compact_manifest(
+    path: Path, header: Dict[str, Any], files: Dict[str, str]
+) -> None:
+    """
+    Writes a compact manifest.
+
+    Args:
+        path: Output file.
+        header: Every manifest field except `files` (JSON-serializable).
+        files: Path -> hex digest. All digests must have the same length.
+    """
+    sorted_paths = sorted(files.keys())
+    digest_size = len(files[sorted_paths[0]]) // 2 if sorted_paths else 0
+
+    hex_digests = [files[p] for p in sorted_paths]
+    if any(len(h) != digest_size * 2 for h in hex_digests):
+        raise ValueError("All digests of a compact manifest must have the same length.")
+    digests = bytes.fromhex("".join(hex_digests))
+
+    table = bytearray()
+    restarts: List[int] = []
+    previous = b""
+    for index, p in enumerate(sorted_paths):
+        encoded = p.encode("utf-8")
+        if index % RESTART_INTERVAL:
+            shared = _common_prefix(previous, encoded)
+        else:
+            restarts.append(len(table))
+            shared = 0
+        suffix = encoded[shared:]
+        if shared < 0x80 and len(suffix) < 0x80:
+            table += bytes((shared, len(suffix)))
+        else:
+            table += _varint(shared) + _varint(len(suffix))
+        table += suffix
+        previous = encoded
+
+    header_bytes = json.dumps(header, sort_keys=True, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    with open(path, "wb") as f:
+        f.write(
+            _PREAMBLE.pack(
+                COMPACT_MAGIC,
+                len(header_bytes),
+                len(sorted_paths),
+                digest_size,
+                len(restarts),
+            )
+        )
+        f.write(header_bytes)
+        f.write(digests)
+        f.write(struct.pack(f"<{len(restarts)}Q", *restarts))
+        f.write(table)
+
+
+def is_compact_manifest(path: Path) -> bool:
+    """True if the file starts with the compact manifest magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(COMPACT_MAGIC)) == COMPACT_MAGIC
+    except OSError:
+        return False
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    # XOR of the two big-endian integers: the highest set bit marks the first
+    # differing byte, so this is a few C-level calls instead of a byte loop
+    n = min(len(a), len(b))
+    diff = int.from_bytes(a[:n], "big") ^ int.from_bytes(b[:n], "big")
+    return n - (diff.bit_length() + 7) // 8
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(data: Any, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
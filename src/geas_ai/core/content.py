@@ -70,6 +70,11 @@ DEFAULT_MODELS_YAML = """models:
 DEFAULT_IDENTITIES_YAML = """identities: []
 """
 
+# .geas/ is committed; its caches are machine-local and must not be
+GEAS_GITIGNORE = """# Machine-local caches: file stat data, test results, ledger checkpoints
+cache/
+"""
+
 MANIFESTO_CONTENT = """# GEAS_MANIFESTO.md
 
 ## Protocol for Agent Control & Trust
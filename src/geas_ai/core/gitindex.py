@@ -0,0 +1,132 @@
+import struct
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+_SIGNATURE = b"DIRC"
+_HEADER = struct.Struct(">4sII")
+# ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size
+_STAT_SIZE = 40
+_FLAG_EXTENDED = 0x4000
+_STAGE_MASK = 0x3000
+
+
+def find_git_dir(root_dir: Path) -> Optional[Path]:
+    """Returns the git directory of the worktree at root_dir, if any.
+
+    Supports both a `.git` directory and a `.git` file (`gitdir: <path>`)
+    as used by linked worktrees and submodules.
+    """
+    dot_git = root_dir / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        try:
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if content.startswith("gitdir:"):
+            git_dir = Path(content[len("gitdir:") :].strip())
+            return git_dir if git_dir.is_absolute() else root_dir / git_dir
+    return None
+
+
+def find_common_dir(git_dir: Path) -> Path:
+    """Returns the directory holding the config and info/ of a git directory.
+
+    A linked worktree's git directory only has its own HEAD and index; its
+    `commondir` file points at the main repository's git directory.
+    """
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common_dir = Path(common)
+    return common_dir if common_dir.is_absolute() else git_dir / common_dir
+
+
+def read_git_index(git_dir: Path) -> Optional[Set[str]]:
+    """
+    Parses the git index file directly (no `git` subprocess).
+
+    Supports index versions 2, 3 and 4 (prefix-compressed paths). Only
+    stage-0 entries are returned, plus the "ours" side of unmerged paths
+    so a conflicted file still counts as tracked.
+
+    Only the paths are kept: the walker just needs to know which files are
+    tracked, and unchanged files are skipped at hashing time by the
+    stat-keyed HashCache (a blob id is not a manifest digest).
+
+    Returns:
+        The tracked paths (POSIX, relative to the worktree root), or None
+        if there is no index or it cannot be parsed.
+    """
+    try:
+        data = (git_dir / "index").read_bytes()
+    except OSError:
+        return None
+
+    try:
+        signature, version, count = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        return None
+    if signature != _SIGNATURE or version not in (2, 3, 4):
+        return None
+
+    # SHA-1 repositories use 20-byte object ids; SHA-256 ones use 32
+    oid_size = 32 if _uses_sha256(find_common_dir(git_dir)) else 20
+
+    entries: Set[str] = set()
+    offset = _HEADER.size
+    previous_name = b""
+    try:
+        for _ in range(count):
+            entry_start = offset
+            # Stat data and blob id are not needed
+            offset += _STAT_SIZE + oid_size
+            (flags,) = struct.unpack_from(">H", data, offset)
+            offset += 2
+            if flags & _FLAG_EXTENDED and version >= 3:
+                offset += 2
+
+            if version == 4:
+                strip, offset = _read_offset_varint(data, offset)
+                end = data.index(b"\0", offset)
+                name = previous_name[: len(previous_name) - strip] + data[offset:end]
+                offset = end + 1
+            else:
+                end = data.index(b"\0", offset)
+                name = data[offset:end]
+                # Entries are NUL-padded to a multiple of 8 bytes
+                entry_len = end - entry_start
+                offset = entry_start + ((entry_len + 8) & ~7)
+            previous_name = name
+
+            stage = (flags & _STAGE_MASK) >> 12
+            if stage not in (0, 2):
+                continue
+
+            entries.add(name.decode("utf-8", errors="surrogateescape"))
+    except (struct.error, ValueError):
+        return None
+
+    return entries
+
+
+def _read_offset_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Decodes git's offset varint (used by index v4 path compression)."""
+    byte = data[offset]
+    offset += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[offset]
+        offset += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, offset
+
+
+def _uses_sha256(git_dir: Path) -> bool:
+    try:
+        config = (git_dir / "config").read_text(encoding="utf-8")
+    except OSError:
+        return False
+    return "objectformat = sha256" in config.replace("\t", " ").lower()
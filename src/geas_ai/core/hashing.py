@@ -1,27 +1,219 @@
 import hashlib
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
+from geas_ai.core.cache import HashCache
+from geas_ai.core.profiling import profiled
 from geas_ai.utils.crypto import canonicalize_json
 
+# Size of the reusable read buffer (one per thread)
+BUFFER_SIZE = 1024 * 1024
+# Files at least this large are hashed straight from a read-only memory map
+MMAP_THRESHOLD = 64 * 1024 * 1024
 
-def file_sha256(file_path: Path) -> str:
-    """Computes SHA256 hash of the file content (normalized to UTF-8 text if possible)."""
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read in chunks to be memory efficient
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256.update(chunk)
-    return f"sha256:{sha256.hexdigest()}"
+# hashlib algorithms that may be chosen for manifests, seals and the ledger
+HASH_ALGORITHMS = ("sha256", "blake2b", "sha3_256")
+# Also assumed for digests recorded without an "<algorithm>:" prefix
+DEFAULT_HASH_ALGORITHM = "sha256"
 
+_local = threading.local()
 
-def calculate_event_hash(event_data: Dict[str, Any]) -> str:
+
+def validate_algorithm(algorithm: str) -> str:
+    """Returns `algorithm` if it is supported, otherwise raises ValueError."""
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported hash algorithm '{algorithm}'. Use: {', '.join(HASH_ALGORITHMS)}"
+        )
+    return algorithm
+
+
+def split_digest(value: str) -> Tuple[str, str]:
+    """
+    Splits a prefixed digest ("blake2b:<hex>") into (algorithm, hex).
+
+    Digests without a prefix are legacy SHA-256 values.
+    """
+    algorithm, sep, hex_digest = value.partition(":")
+    if not sep:
+        return DEFAULT_HASH_ALGORITHM, value
+    return algorithm, hex_digest
+
+
+def file_hash(
+    file_path: Path,
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+    cache: Optional[HashCache] = None,
+) -> str:
+    """Computes the prefixed digest ("<algorithm>:<hex>") of the file content.
+
+    If a HashCache is given, an unchanged file (same size, mtime and inode)
+    is answered from the cache instead of being re-read.
+    """
+    if cache is not None:
+        key = cache.key(file_path)
+        st = os.stat(file_path)
+        cached = cache.lookup(key, st, algorithm)
+        if cached is None:
+            cached = digest_file(file_path, algorithm)
+            cache.store(key, st, cached, algorithm)
+        return f"{algorithm}:{cached}"
+
+    return f"{algorithm}:{digest_file(file_path, algorithm)}"
+
+
+def file_sha256(file_path: Path, cache: Optional[HashCache] = None) -> str:
+    """Computes SHA256 hash of the file content ("sha256:<hex>")."""
+    return file_hash(file_path, "sha256", cache)
+
+
+@profiled("hashing")
+def digest_file(file_path: Path, algorithm: str = "sha256") -> str:
+    """
+    Streams a file through `algorithm` and returns the bare hex digest.
+
+    This is the single hashing engine used by file_sha256 and hash_files:
+    - Huge files (>= MMAP_THRESHOLD) are hashed from a read-only mmap, so the
+      digest reads straight from the page cache without copying into Python.
+    - Everything else is read with readinto() into a reusable per-thread
+      buffer, so no chunk objects are allocated per read.
+    In both cases the kernel is told the access is sequential (where
+    posix_fadvise/madvise exist) so it can read ahead aggressively.
+    """
+    hasher = hashlib.new(algorithm)
+    with open(file_path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        size = os.fstat(fd).st_size
+        _advise_sequential(fd)
+
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapped)
+            return hasher.hexdigest()
+
+        buf = _read_buffer()
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def _read_buffer() -> bytearray:
+    """Returns this thread's reusable read buffer."""
+    buf: Optional[bytearray] = getattr(_local, "buffer", None)
+    if buf is None:
+        buf = bytearray(BUFFER_SIZE)
+        _local.buffer = buf
+    return buf
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hints the kernel that the file will be read sequentially (best effort)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def default_jobs() -> int:
+    """Returns the default number of hashing workers (one per CPU core)."""
+    return os.cpu_count() or 1
+
+
+def hash_files(
+    root_dir: Path,
+    files: List[str],
+    jobs: Optional[int] = None,
+    cache: Optional[HashCache] = None,
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+) -> Dict[str, str]:
+    """
+    Hashes a list of files (relative to root_dir) and returns Path -> hex digest.
+
+    Files are hashed on a thread pool: hashlib releases the GIL while digesting
+    large buffers and file reads block outside the interpreter, so threads scale
+    with the number of cores without the pickling overhead of a process pool.
+
+    The returned dict preserves the order of `files`, so the resulting manifest
+    (and its Merkle root) is identical to hashing serially.
+
+    Args:
+        root_dir: The root directory the file paths are relative to.
+        files: File paths relative to root_dir.
+        jobs: Number of workers. None or 0 means one per CPU core; 1 hashes serially.
+        cache: Optional HashCache consulted (and updated) per file, keyed by the
+            path relative to the project root. Only files whose stat data
+            changed are re-hashed.
+        algorithm: hashlib algorithm name (see HASH_ALGORITHMS).
+    """
+    workers = jobs or default_jobs()
+    # Usually "": root_dir is the project root the cache belongs to
+    key_prefix = cache.key_prefix(root_dir) if cache is not None else ""
+
+    def hash_one(rel_path: str) -> str:
+        full_path = root_dir / rel_path
+        if cache is None:
+            return digest_file(full_path, algorithm)
+
+        key = key_prefix + rel_path
+        st = os.stat(full_path)
+        digest = cache.lookup(key, st, algorithm)
+        if digest is None:
+            digest = digest_file(full_path, algorithm)
+            cache.store(key, st, digest, algorithm)
+        return digest
+
+    if workers <= 1 or len(files) <= 1:
+        digests = [hash_one(f) for f in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields results in submission order
+            digests = list(pool.map(hash_one, files))
+
+    return dict(zip(files, digests))
+
+
+def calculate_event_hash(
+    event_data: Dict[str, Any], algorithm: str = DEFAULT_HASH_ALGORITHM
+) -> str:
     """
-    Calculates the SHA-256 hash of a ledger event.
+    Calculates the hash of a ledger event ("<algorithm>:<hex>").
 
     The event dictionary should exclude the 'event_hash' field itself
     before calling this function if it was already present.
     """
-    canonical_bytes = canonicalize_json(event_data)
-    sha256_hash = hashlib.sha256(canonical_bytes).hexdigest()
-    return f"sha256:{sha256_hash}"
+    return hash_event_bytes(canonicalize_json(event_data), algorithm)
+
+
+@profiled("event_hashing")
+def hash_event_bytes(
+    canonical_bytes: bytes, algorithm: str = DEFAULT_HASH_ALGORITHM
+) -> str:
+    """
+    Hashes the canonical bytes of a ledger event (LedgerEvent.canonical_bytes).
+    """
+    event_hash = hashlib.new(algorithm, canonical_bytes).hexdigest()
+    return f"{algorithm}:{event_hash}"
+
+
+def recorded_algorithm(value: Optional[str]) -> str:
+    """
+    Returns the algorithm to re-compute a recorded digest with.
+
+    Unknown prefixes fall back to the default, so a tampered prefix shows up
+    as a hash mismatch instead of an error.
+    """
+    if not value:
+        return DEFAULT_HASH_ALGORITHM
+    algorithm, _ = split_digest(value)
+    return algorithm if algorithm in HASH_ALGORITHMS else DEFAULT_HASH_ALGORITHM
@@ -4,6 +4,7 @@ from typing import Optional
 from ruamel.yaml import YAML
 from geas_ai.schemas.identity import Identity, IdentityStore
 from geas_ai.utils.crypto import load_private_key_from_bytes, CryptoError
+from geas_ai.core.profiling import profiled
 from geas_ai.utils import get_geas_root
 
 
@@ -17,6 +18,7 @@ class KeyManager:
     """Handles resolution and loading of private keys."""
 
     @staticmethod
+    @profiled("key_load")
     def load_private_key(identity_name: str) -> object:
         """
         Resolves and loads the private key for the given identity name.
@@ -88,6 +90,7 @@ class IdentityManager:
         self.yaml = YAML()
         self.yaml.preserve_quotes = True
 
+    @profiled("yaml_parse")
     def load(self) -> IdentityStore:
         """Loads identities from the YAML file."""
         if not self.config_path.exists():
@@ -0,0 +1,237 @@
+import ast
+import posixpath
+import shlex
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from geas_ai.core.cache import ImportCache
+from geas_ai.core.manifest import (
+    ChangeType,
+    FileChange,
+    Manifest,
+    TestSelection,
+    diff_manifests,
+)
+
+# Default for `geas prove --full-every`: every Nth impact-analysed proof runs everything
+DEFAULT_FULL_EVERY = 10
+
+# Changes to these files can affect any test, so they always force a full run
+GLOBAL_TEST_FILES = frozenset(
+    ["conftest.py", "pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"]
+)
+
+
+def is_test_file(path: str) -> bool:
+    """True for pytest's default test module names (test_*.py, *_test.py)."""
+    name = posixpath.basename(path)
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def module_names(files: Set[str]) -> Dict[str, str]:
+    """
+    Maps the dotted module name of every Python file in `files` to its path.
+
+    A file's package is found the way the import system would see it from
+    the project layout: directories with an __init__.py are packages, and the
+    first ancestor without one is the import root (so src/pkg/mod.py is
+    `pkg.mod` and tests/test_x.py in a plain directory is `test_x`).
+    """
+    modules: Dict[str, str] = {}
+    for path in files:
+        if not path.endswith(".py"):
+            continue
+        parts = path[:-3].split("/")
+        start = len(parts) - 1
+        while start > 0 and "/".join(parts[:start]) + "/__init__.py" in files:
+            start -= 1
+        name_parts = parts[start:]
+        if name_parts[-1] == "__init__":
+            name_parts = name_parts[:-1]
+        if name_parts:
+            modules.setdefault(".".join(name_parts), path)
+    return modules
+
+
+def parse_imports(source: bytes, module: str, is_package: bool) -> List[str]:
+    """
+    Returns the absolute module names a Python source imports.
+
+    `from a import b` yields both `a` and `a.b`, since `b` may be a submodule;
+    relative imports are resolved against `module`. Names that do not belong
+    to the project are simply not found in the module map later on.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # The tests importing it will fail on their own
+        return []
+
+    package = module if is_package else module.rpartition(".")[0]
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".") if package else []
+                if node.level > 1:
+                    base_parts = base_parts[: len(base_parts) - (node.level - 1)]
+                if node.module:
+                    base_parts.append(node.module)
+                base = ".".join(base_parts)
+            else:
+                base = node.module or ""
+            if not base:
+                continue
+            names.add(base)
+            names.update(
+                f"{base}.{alias.name}" for alias in node.names if alias.name != "*"
+            )
+    return sorted(names)
+
+
+def build_import_graph(
+    root_dir: Path, files: Dict[str, str], cache: Optional[ImportCache] = None
+) -> Dict[str, Set[str]]:
+    """
+    Builds the import graph of the Python files in `files` (path -> digest).
+
+    Returns path -> paths of the in-scope modules it imports. Importing
+    `a.b.c` also runs `a` and `a.b`, so package __init__ files are edges too.
+    Parsed imports are cached by file digest.
+    """
+    file_set = set(files)
+    modules = module_names(file_set)
+    paths_to_modules = {path: name for name, path in modules.items()}
+
+    graph: Dict[str, Set[str]] = {}
+    for path, module in paths_to_modules.items():
+        imports = cache.lookup(path, files[path]) if cache is not None else None
+        if imports is None:
+            imports = parse_imports(
+                (root_dir / path).read_bytes(),
+                module,
+                path.endswith("/__init__.py") or path == "__init__.py",
+            )
+            if cache is not None:
+                cache.store(path, files[path], imports)
+
+        edges: Set[str] = set()
+        for name in imports:
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                target = modules.get(".".join(parts[:i]))
+                if target is not None and target != path:
+                    edges.add(target)
+        graph[path] = edges
+
+    if cache is not None:
+        cache.retain(set(paths_to_modules))
+    return graph
+
+
+def select_tests(
+    changed: List[str], graph: Dict[str, Set[str]]
+) -> Dict[str, List[str]]:
+    """
+    Maps every test file affected by `changed` to the changed files it depends on.
+
+    Walks the reversed import graph from each changed file; a changed test
+    file selects itself.
+    """
+    importers: Dict[str, Set[str]] = {}
+    for path, targets in graph.items():
+        for target in targets:
+            importers.setdefault(target, set()).add(path)
+
+    selected: Dict[str, List[str]] = {}
+    for source in sorted(changed):
+        seen = {source}
+        queue = deque([source])
+        while queue:
+            path = queue.popleft()
+            if is_test_file(path):
+                selected.setdefault(path, []).append(source)
+            for importer in importers.get(path, ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    queue.append(importer)
+    return dict(sorted(selected.items()))
+
+
+def plan_tests(
+    root_dir: Path,
+    files: Dict[str, str],
+    scope: List[str],
+    algorithm: str,
+    previous: Optional[Manifest],
+    full_every: int = DEFAULT_FULL_EVERY,
+    cache: Optional[ImportCache] = None,
+) -> TestSelection:
+    """
+    Decides which tests a proof of `files` has to run.
+
+    The scope is diffed against the previous proof's manifest and only the
+    tests importing a changed file are selected. Anything the import graph
+    cannot account for (no comparable previous proof, one that skipped the
+    tests, a removed or non-Python source, conftest.py or test configuration)
+    falls back to a full run, as does every `full_every`-th proof so that
+    drift cannot accumulate.
+    """
+    if previous is None:
+        return TestSelection(mode="full", reason="no previous proof to compare with")
+
+    changes = list(diff_manifests(previous.files, files))
+    previous_selection = previous.test_result.selection
+    runs_since_full = (
+        previous_selection.runs_since_full + 1
+        if previous_selection is not None and previous_selection.mode == "impact"
+        else 1
+    )
+
+    reason = _full_run_reason(changes, scope, algorithm, previous)
+    if reason is None and 0 < full_every <= runs_since_full:
+        reason = f"periodic full run (every {full_every} proofs)"
+    if reason is not None:
+        return TestSelection(mode="full", reason=reason, base_root=previous.root_hash)
+
+    changed = [c.path for c in changes if c.change != ChangeType.REMOVED]
+    tests = select_tests(changed, build_import_graph(root_dir, files, cache))
+    return TestSelection(
+        mode="impact",
+        reason=f"{len(changed)} changed files affect {len(tests)} test files",
+        base_root=previous.root_hash,
+        tests=tests,
+        runs_since_full=runs_since_full,
+    )
+
+
+def selection_command(command: str, selection: TestSelection) -> str:
+    """Appends the selected test files to the test command (full runs are unchanged)."""
+    if selection.mode != "impact":
+        return command
+    return " ".join([command, *(shlex.quote(test) for test in selection.tests)])
+
+
+def _full_run_reason(
+    changes: List[FileChange], scope: List[str], algorithm: str, previous: Manifest
+) -> Optional[str]:
+    if previous.test_result.skipped:
+        return "the previous proof skipped the tests"
+    if previous.algorithm != algorithm:
+        return "the previous proof used another hash algorithm"
+    if sorted(previous.scope) != sorted(scope):
+        return "the scope changed since the previous proof"
+
+    for change in changes:
+        if posixpath.basename(change.path) in GLOBAL_TEST_FILES:
+            return f"{change.path} affects every test"
+        if not change.path.endswith(".py"):
+            return f"{change.path} is not Python and cannot be mapped to tests"
+        if change.change == ChangeType.REMOVED and not is_test_file(change.path):
+            return f"{change.path} was removed"
+    return None
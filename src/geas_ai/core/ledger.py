@@ -1,12 +1,33 @@
 import json
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Dict, Iterator, Optional, Tuple, Union
 
-from geas_ai.schemas.ledger import Ledger, LedgerEvent
-from geas_ai.core.hashing import calculate_event_hash
+from pydantic import TypeAdapter
 
-LOCK_FILE_NAME = "lock.json"
+from geas_ai.schemas.ledger import Ledger, LedgerAction, LedgerEvent
+from geas_ai.core.cache import CheckpointCache
+from geas_ai.core.profiling import profiled
+from geas_ai.core.hashing import (
+    DEFAULT_HASH_ALGORITHM,
+    hash_event_bytes,
+    recorded_algorithm,
+)
+from geas_ai.utils.crypto import canonicalize_json
+
+# Append-only ledger: a header line, then one canonical JSON event per line
+LOCK_FILE_NAME = "lock.jsonl"
+LEDGER_FORMAT = "geas-ledger"
+# Single JSON document rewritten on every save (read, and migrated on write)
+LEGACY_LOCK_FILE_NAME = "lock.json"
+
+_TAIL_CHUNK = 64 * 1024
+# Encodes a string as canonicalize_json does, without its per-call overhead
+_encode_string = json.JSONEncoder(ensure_ascii=False).encode
+_DATETIME = TypeAdapter(datetime)
 
 
 class LedgerIntegrityError(Exception):
@@ -15,31 +36,187 @@ class LedgerIntegrityError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class LedgerCheckpoint:
+    """The last event of a verified ledger prefix and where its line ends."""
+
+    sequence: int
+    event_hash: str
+    offset: int
+
+
 class LedgerManager:
-    """Manages lock.json operations."""
+    """
+    Manages the bolt ledger file (lock.jsonl).
+
+    The first line is a header ({"format", "version", "bolt_id",
+    "created_at"}); every further line is one event, so recording a seal
+    appends a single line instead of rewriting the history. Only
+    newline-terminated lines count: a line torn by a crash mid-append was
+    never acknowledged and is ignored by readers and cut by the next append.
+    The head hash is not stored; it is the hash of the last event.
+    """
 
     @staticmethod
+    @profiled("ledger_load")
     def load_lock(bolt_path: Path) -> Optional[Ledger]:
-        """Loads the ledger from lock.json if it exists."""
+        """
+        Loads the ledger of a bolt, or None if it has none.
+
+        Reads lock.jsonl line by line; bolts created before the append-only
+        format are read from their lock.json.
+
+        Raises:
+            LedgerIntegrityError: If the file is not a ledger (bad header).
+        """
         lock_path = bolt_path / LOCK_FILE_NAME
         if not lock_path.exists():
-            return None
+            legacy_path = bolt_path / LEGACY_LOCK_FILE_NAME
+            if not legacy_path.exists():
+                return None
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                return Ledger(**json.load(f))
+
+        with open(lock_path, "rb") as f:
+            header = _read_header(f, lock_path)
+            events = [_parse_event(line) for line in _lines(f)]
+        return Ledger(
+            version=header["version"],
+            bolt_id=header["bolt_id"],
+            created_at=header["created_at"],
+            head_hash=events[-1].event_hash if events else None,
+            events=events,
+        )
+
+    @staticmethod
+    @profiled("ledger_save")
+    def save_lock(bolt_path: Path, ledger: Ledger) -> int:
+        """
+        Writes the whole ledger to lock.jsonl and returns its size.
 
+        The file is written next to the ledger, fsync'd and renamed over it,
+        so a crash leaves either the old or the new ledger. A legacy
+        lock.json is removed afterwards (this is the migration path).
+        """
+        lock_path = bolt_path / LOCK_FILE_NAME
+        tmp_path = lock_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_header_line(ledger))
+            for event in ledger.events:
+                f.write(_event_line(event))
+            size = f.tell()
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, lock_path)
+        _fsync_dir(bolt_path)
+
+        legacy_path = bolt_path / LEGACY_LOCK_FILE_NAME
+        if legacy_path.exists():
+            legacy_path.unlink()
+        return size
+
+    @staticmethod
+    @profiled("ledger_save")
+    def append_lock(bolt_path: Path, ledger: Ledger, new_events: int = 1) -> int:
+        """
+        Persists the last `new_events` events of the ledger.
+
+        They are appended to lock.jsonl and fsync'd, so the I/O does not grow
+        with the history. A torn last line left by an interrupted append is
+        cut first. If the bolt has no lock.jsonl yet (a legacy lock.json),
+        the whole ledger is written instead, migrating it.
+
+        Returns the offset where the last event's line ends (the file size).
+        """
+        lock_path = bolt_path / LOCK_FILE_NAME
+        if not lock_path.exists():
+            return LedgerManager.save_lock(bolt_path, ledger)
+
+        events = ledger.events[-new_events:] if new_events > 0 else []
+        return _append_lines(lock_path, b"".join(_event_line(e) for e in events))
+
+    @staticmethod
+    @profiled("ledger_load")
+    def open_lock(bolt_path: Path) -> Optional["LazyLedger"]:
+        """
+        Opens the ledger of a bolt without parsing its events, or None if it has none.
+
+        Only the header and the last event are read; see LazyLedger.
+
+        Raises:
+            LedgerIntegrityError: If the file is not a ledger (bad header).
+        """
+        lock_path = bolt_path / LOCK_FILE_NAME
+        if not lock_path.exists():
+            ledger = LedgerManager.load_lock(bolt_path)
+            return LazyLedger.from_ledger(bolt_path, ledger) if ledger else None
+
+        with open(lock_path, "rb") as f:
+            header = _read_header(f, lock_path)
+            header_end = f.tell()
+            end = _complete_size(f)
+            head = None
+            if end > header_end:
+                line = _line_ending_at(f, end)
+                head = _parse_event(line) if line else None
+        return LazyLedger(bolt_path, header, head, header_end, end)
+
+    @staticmethod
+    def load_checkpoint(
+        bolt_path: Path, cache: CheckpointCache
+    ) -> Optional[LedgerCheckpoint]:
+        """
+        Returns the recorded verified prefix of the bolt's ledger, if still valid.
+
+        The checkpoint is only returned if the line ending at its offset in
+        lock.jsonl is still its event (same sequence and event hash), so a
+        rewritten, truncated or replaced ledger falls back to a full check.
+        The cache is local state: `--full` re-checks the whole chain.
+        """
+        lock_path = bolt_path / LOCK_FILE_NAME
+        entry = cache.lookup(_checkpoint_key(lock_path))
+        if entry is None:
+            return None
+        checkpoint = LedgerCheckpoint(*entry)
         try:
-            with open(lock_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return Ledger(**data)
-        except Exception:
-            # If load fails (e.g. empty or corrupted), we treat as None or raise
-            # For now, let's raise to indicate corruption
-            raise
+            with open(lock_path, "rb") as f:
+                line = _line_ending_at(f, checkpoint.offset)
+            data = json.loads(line) if line else None
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("sequence") != checkpoint.sequence
+            or data.get("event_hash") != checkpoint.event_hash
+        ):
+            return None
+        return checkpoint
 
     @staticmethod
-    def save_lock(bolt_path: Path, ledger: Ledger) -> None:
-        """Saves the ledger to lock.json."""
+    def save_checkpoint(
+        bolt_path: Path,
+        ledger: Union[Ledger, "LazyLedger"],
+        cache: CheckpointCache,
+        offset: Optional[int] = None,
+    ) -> None:
+        """
+        Records the ledger's last event as the end of its verified prefix.
+
+        `offset` is where that event's line ends in lock.jsonl (as returned by
+        append_lock); by default, the end of the file's last complete line.
+        Legacy lock.json ledgers get no checkpoint.
+        """
+        if isinstance(ledger, LazyLedger):
+            head = ledger.head
+        else:
+            head = ledger.events[-1] if ledger.events else None
         lock_path = bolt_path / LOCK_FILE_NAME
-        with open(lock_path, "w", encoding="utf-8") as f:
-            f.write(ledger.model_dump_json(indent=2))
+        if head is None or not lock_path.exists():
+            return
+        if offset is None:
+            with open(lock_path, "rb") as f:
+                offset = _complete_size(f)
+        cache.store(_checkpoint_key(lock_path), head.sequence, head.event_hash, offset)
 
     @staticmethod
     def create_genesis_ledger(bolt_id: str) -> Ledger:
@@ -47,7 +224,11 @@ class LedgerManager:
         return Ledger(bolt_id=bolt_id, created_at=datetime.utcnow(), events=[])
 
     @staticmethod
-    def append_event(ledger: Ledger, event_data: LedgerEvent) -> Ledger:
+    def append_event(
+        ledger: Ledger,
+        event_data: LedgerEvent,
+        algorithm: str = DEFAULT_HASH_ALGORITHM,
+    ) -> Ledger:
         """
         Appends a new event to the ledger.
         Updates sequence, prev_hash, and calculates event_hash.
@@ -61,58 +242,37 @@ class LedgerManager:
 
         Let's assume the caller constructs a LedgerEvent BUT we override
         sequence, prev_hash, and event_hash to ensure integrity.
-        """
 
-        # 1. Determine Sequence
-        new_sequence = len(ledger.events) + 1
-
-        # 2. Get Prev Hash
-        prev_hash = ledger.head_hash
-
-        # 3. Update Event fields
-        event_data.sequence = new_sequence
-        event_data.prev_hash = prev_hash
-
-        # 4. Calculate Event Hash
-        # Convert to dict, exclude 'event_hash' for calculation
-        event_dict = event_data.model_dump(mode="json")
-        if "event_hash" in event_dict:
-            del event_dict["event_hash"]
+        The event hash is computed with `algorithm` and carries it as prefix
+        ("<algorithm>:<hex>"), so verification never needs to be told.
+        """
 
-        event_hash = calculate_event_hash(event_dict)
-        event_data.event_hash = event_hash
+        # 1-4. Sequence, link to the head and hash the event
+        _link_event(event_data, len(ledger.events) + 1, ledger.head_hash, algorithm)
 
         # 5. Append and Update Head
         ledger.events.append(event_data)
-        ledger.head_hash = event_hash
+        ledger.head_hash = event_data.event_hash
 
         return ledger
 
     @staticmethod
-    def verify_chain_integrity(ledger: Ledger) -> bool:
+    @profiled("chain_check")
+    def verify_chain_integrity(
+        ledger: Ledger, checkpoint: Optional[LedgerCheckpoint] = None
+    ) -> bool:
         """
         Verifies the hash chain integrity of the ledger.
-        """
-        current_prev_hash = None
-
-        for i, event in enumerate(ledger.events):
-            # Check sequence
-            if event.sequence != i + 1:
-                return False
-
-            # Check prev_hash linking
-            if event.prev_hash != current_prev_hash:
-                return False
 
-            # Check event hash
-            event_dict = event.model_dump(mode="json")
-            if "event_hash" in event_dict:
-                del event_dict["event_hash"]
+        With a checkpoint, the events before it are trusted: only the
+        checkpoint event and the ones after it are re-hashed.
+        """
+        start = resume_index(ledger, checkpoint)
+        current_prev_hash = ledger.events[start - 1].event_hash if start else None
 
-            calculated_hash = calculate_event_hash(event_dict)
-            if calculated_hash != event.event_hash:
+        for i, event in enumerate(ledger.events[start:], start):
+            if not _event_valid(event, i + 1, current_prev_hash):
                 return False
-
             current_prev_hash = event.event_hash
 
         # Check head hash matches last event
@@ -120,3 +280,389 @@ class LedgerManager:
             return False
 
         return True
+
+
+class LazyLedger:
+    """
+    View of a bolt ledger that parses events on demand.
+
+    Opening one (LedgerManager.open_lock) reads only the header and the last
+    event, so the head is known without touching the history. Events are
+    parsed as they are iterated, oldest first or newest first; looking for
+    the latest event of some kind usually reads a few lines from the tail.
+    The view covers the complete lines present when it was opened, plus the
+    events appended through it.
+
+    Legacy lock.json ledgers have no line structure; they are loaded whole
+    and the same interface iterates the in-memory events.
+    """
+
+    def __init__(
+        self,
+        bolt_path: Path,
+        header: Dict[str, Any],
+        head: Optional[LedgerEvent],
+        header_end: int,
+        end: int,
+        ledger: Optional[Ledger] = None,
+    ):
+        self.bolt_path = bolt_path
+        self.version: str = header["version"]
+        self.bolt_id: str = header["bolt_id"]
+        self.created_at: datetime = _DATETIME.validate_python(header["created_at"])
+        self.head = head
+        self._header_end = header_end
+        self._end = end
+        self._ledger = ledger
+
+    @classmethod
+    def from_ledger(cls, bolt_path: Path, ledger: Ledger) -> "LazyLedger":
+        """Wraps an already loaded (e.g. legacy lock.json) ledger."""
+        header = {
+            "version": ledger.version,
+            "bolt_id": ledger.bolt_id,
+            "created_at": ledger.created_at,
+        }
+        head = ledger.events[-1] if ledger.events else None
+        return cls(bolt_path, header, head, 0, 0, ledger)
+
+    @property
+    def head_hash(self) -> Optional[str]:
+        return self.head.event_hash if self.head else None
+
+    def __iter__(self) -> Iterator[LedgerEvent]:
+        """Yields the events oldest first."""
+        if self._ledger is not None:
+            yield from list(self._ledger.events)
+            return
+        with open(self.bolt_path / LOCK_FILE_NAME, "rb") as f:
+            for line in _lines_between(f, self._header_end, self._end):
+                yield _parse_event(line)
+
+    def reversed(self) -> Iterator[LedgerEvent]:
+        """Yields the events newest first, reading the file from the end."""
+        if self._ledger is not None:
+            yield from list(reversed(self._ledger.events))
+            return
+        for line in self._reversed_lines():
+            yield _parse_event(line)
+
+    def find_last(self, action: LedgerAction) -> Optional[LedgerEvent]:
+        """Returns the most recent event with `action`, or None."""
+        if self._ledger is not None:
+            for event in reversed(self._ledger.events):
+                if event.action == action:
+                    return event
+            return None
+
+        # Lines are canonical JSON: skip the ones that cannot match unparsed
+        needle = b'"action":"' + action.value.encode("utf-8") + b'"'
+        for line in self._reversed_lines():
+            if needle in line:
+                event = _parse_event(line)
+                if event.action == action:
+                    return event
+        return None
+
+    @profiled("chain_check")
+    def verify_chain(self, checkpoint: Optional[LedgerCheckpoint] = None) -> bool:
+        """
+        Verifies the hash chain, streaming the events instead of loading them.
+
+        With a checkpoint (see LedgerManager.load_checkpoint), reading starts
+        at the checkpoint event: it is re-hashed and linked to the event
+        before it, then only the events after it are checked.
+        """
+        if self._ledger is not None:
+            return LedgerManager.verify_chain_integrity(self._ledger, checkpoint)
+
+        with open(self.bolt_path / LOCK_FILE_NAME, "rb") as f:
+            start, sequence, prev_hash = self._resume_point(f, checkpoint)
+            try:
+                for line in _lines_between(f, start, self._end):
+                    event = _parse_event(line)
+                    if not _event_valid(event, sequence, prev_hash):
+                        return False
+                    prev_hash = event.event_hash
+                    sequence += 1
+            except ValueError:
+                # An event line that does not parse breaks the chain
+                return False
+        return True
+
+    @profiled("ledger_save")
+    def append(
+        self, event: LedgerEvent, algorithm: str = DEFAULT_HASH_ALGORITHM
+    ) -> int:
+        """
+        Links `event` to the head, hashes it and appends it to the ledger.
+
+        The chain should have been verified first (verify_chain): the new
+        sequence number follows the head's. Returns the offset where the
+        event's line ends. A legacy ledger is migrated to lock.jsonl.
+        """
+        if self._ledger is not None:
+            LedgerManager.append_event(self._ledger, event, algorithm)
+            self.head = event
+            return LedgerManager.append_lock(self.bolt_path, self._ledger)
+
+        sequence = self.head.sequence + 1 if self.head else 1
+        # Written right away: keep the hashed bytes for the line
+        event.keep_canonical_bytes(
+            _link_event(event, sequence, self.head_hash, algorithm)
+        )
+        self._end = _append_lines(self.bolt_path / LOCK_FILE_NAME, _event_line(event))
+        self.head = event
+        return self._end
+
+    def _reversed_lines(self) -> Iterator[bytes]:
+        with open(self.bolt_path / LOCK_FILE_NAME, "rb") as f:
+            yield from _lines_reversed(f, self._header_end, self._end)
+
+    def _resume_point(
+        self, f: IO[bytes], checkpoint: Optional[LedgerCheckpoint]
+    ) -> Tuple[int, int, Optional[str]]:
+        """Returns (offset, sequence, prev_hash) to start the chain check at."""
+        full = (self._header_end, 1, None)
+        if checkpoint is None or not self._header_end < checkpoint.offset <= self._end:
+            return full
+        try:
+            line = _line_ending_at(f, checkpoint.offset)
+            if not line:
+                return full
+            event = _parse_event(line)
+            if (
+                event.sequence != checkpoint.sequence
+                or event.event_hash != checkpoint.event_hash
+            ):
+                return full
+            start = checkpoint.offset - len(line)
+            if event.sequence == 1:
+                return start, 1, None
+            if start <= self._header_end:
+                return full
+            previous_line = _line_ending_at(f, start)
+            if not previous_line:
+                return full
+            previous = _parse_event(previous_line)
+        except ValueError:
+            return full
+        if previous.sequence != event.sequence - 1:
+            return full
+        return start, event.sequence, previous.event_hash
+
+
+def resume_index(ledger: Ledger, checkpoint: Optional[LedgerCheckpoint]) -> int:
+    """
+    Returns the index of the first event a chain check has to cover.
+
+    That is the checkpoint event itself (so it is confirmed unchanged), or
+    0 if there is no checkpoint or the ledger does not contain it.
+    """
+    if checkpoint is None or not 0 < checkpoint.sequence <= len(ledger.events):
+        return 0
+    event = ledger.events[checkpoint.sequence - 1]
+    if (
+        event.sequence != checkpoint.sequence
+        or event.event_hash != checkpoint.event_hash
+    ):
+        return 0
+    return checkpoint.sequence - 1
+
+
+def _link_event(
+    event: LedgerEvent, sequence: int, prev_hash: Optional[str], algorithm: str
+) -> bytes:
+    """
+    Sets the sequence and prev_hash of `event`, then its event_hash.
+
+    Returns the bytes that were hashed.
+    """
+    event.sequence = sequence
+    event.prev_hash = prev_hash
+    # The hash covers every field but 'event_hash' itself
+    canonical = event.canonical_bytes()
+    event.event_hash = hash_event_bytes(canonical, algorithm)
+    return canonical
+
+
+def _event_valid(event: LedgerEvent, sequence: int, prev_hash: Optional[str]) -> bool:
+    """Checks the sequence, the prev_hash link and the recorded hash of `event`."""
+    if event.sequence != sequence or event.prev_hash != prev_hash:
+        return False
+    # Re-hash with the algorithm the event hash was recorded with
+    calculated_hash = hash_event_bytes(
+        event.canonical_bytes(), recorded_algorithm(event.event_hash)
+    )
+    return calculated_hash == event.event_hash
+
+
+def _append_lines(lock_path: Path, data: bytes) -> int:
+    """Appends `data` to lock_path durably and returns the new file size."""
+    with open(lock_path, "r+b") as f:
+        _truncate_torn_tail(f)
+        f.seek(0, os.SEEK_END)
+        f.write(data)
+        size = f.tell()
+        f.flush()
+        os.fsync(f.fileno())
+    return size
+
+
+def _lines_between(f: IO[bytes], start: int, end: int) -> Iterator[bytes]:
+    """Yields the complete lines between two line boundaries."""
+    f.seek(start)
+    pos = start
+    while pos < end:
+        line = f.readline()
+        if not line.endswith(b"\n") or pos + len(line) > end:
+            return
+        if line.strip():
+            yield line
+        pos += len(line)
+
+
+def _lines_reversed(f: IO[bytes], start: int, end: int) -> Iterator[bytes]:
+    """Yields the lines between two line boundaries, last first."""
+    pos = end
+    partial = b""
+    while pos > start:
+        chunk_start = max(start, pos - _TAIL_CHUNK)
+        f.seek(chunk_start)
+        lines = (f.read(pos - chunk_start) + partial).split(b"\n")
+        # The first piece may continue in the previous chunk
+        partial = lines[0]
+        for line in reversed(lines[1:]):
+            if line.strip():
+                yield line
+        pos = chunk_start
+    if partial.strip():
+        yield partial
+
+
+def _header_line(ledger: Ledger) -> bytes:
+    header = {
+        "format": LEDGER_FORMAT,
+        "version": ledger.version,
+        "bolt_id": ledger.bolt_id,
+        "created_at": ledger.model_dump(mode="json")["created_at"],
+    }
+    return canonicalize_json(header) + b"\n"
+
+
+def _event_line(event: LedgerEvent) -> bytes:
+    # JSON escapes newlines inside strings, so an event is always one line.
+    # Keys are sorted: event_hash goes right after action in the hashed bytes
+    canonical = event.canonical_bytes()
+    event.keep_canonical_bytes(canonical)
+    prefix = _action_prefix(event)
+    return prefix + _event_hash_member(event) + canonical[len(prefix) :] + b"\n"
+
+
+def _parse_event(line: bytes) -> LedgerEvent:
+    """
+    Parses an event line, keeping the bytes its hash covers.
+
+    A line written by _event_line minus its event_hash member is exactly
+    event.canonical_bytes(), so verifying it later needs no serialization.
+    The bytes are only kept if they hash to the recorded event_hash;
+    otherwise (e.g. a hand-edited line) they are recomputed from the event.
+    """
+    event = LedgerEvent.model_validate_json(line)
+    prefix = _action_prefix(event)
+    head = prefix + _event_hash_member(event)
+    if line.startswith(head):
+        canonical = prefix + line[len(head) :].rstrip(b"\n")
+        algorithm = recorded_algorithm(event.event_hash)
+        if hash_event_bytes(canonical, algorithm) == event.event_hash:
+            event.keep_canonical_bytes(canonical)
+    return event
+
+
+def _action_prefix(event: LedgerEvent) -> bytes:
+    return b'{"action":' + _encode_string(event.action.value).encode("utf-8")
+
+
+def _event_hash_member(event: LedgerEvent) -> bytes:
+    return b',"event_hash":' + _encode_string(event.event_hash).encode("utf-8")
+
+
+def _lines(f: IO[bytes]) -> Iterator[bytes]:
+    """Yields the complete (newline-terminated) lines left in `f`."""
+    for line in f:
+        if not line.endswith(b"\n"):
+            # Torn by an interrupted append
+            return
+        if line.strip():
+            yield line
+
+
+def _read_header(f: IO[bytes], path: Path) -> Dict[str, Any]:
+    line = f.readline()
+    try:
+        header = json.loads(line) if line.endswith(b"\n") else None
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("format") != LEDGER_FORMAT:
+        raise LedgerIntegrityError(f"{path} is not a GEAS ledger (bad header).")
+    return header
+
+
+def _truncate_torn_tail(f: IO[bytes]) -> None:
+    """Cuts anything after the last newline of `f` (opened r+b)."""
+    end = f.seek(0, os.SEEK_END)
+    cut = _complete_size(f)
+    if 0 < cut < end:
+        f.truncate(cut)
+    # No newline at all: not even a header; leave it for the reader to reject
+
+
+def _complete_size(f: IO[bytes]) -> int:
+    """Returns the offset just after the last newline of `f` (0 if none)."""
+    end = f.seek(0, os.SEEK_END)
+    if end:
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return end
+    return _rfind_newline(f, end) + 1
+
+
+def _rfind_newline(f: IO[bytes], end: int) -> int:
+    """Returns the offset of the last newline before `end` (-1 if none)."""
+    pos = end
+    while pos > 0:
+        start = max(0, pos - _TAIL_CHUNK)
+        f.seek(start)
+        chunk = f.read(pos - start)
+        newline = chunk.rfind(b"\n")
+        if newline != -1:
+            return start + newline
+        pos = start
+    return -1
+
+
+def _line_ending_at(f: IO[bytes], offset: int) -> Optional[bytes]:
+    """Returns the complete line that ends exactly at `offset`, if any."""
+    if offset <= 0:
+        return None
+    f.seek(offset - 1)
+    if f.read(1) != b"\n":
+        return None
+    start = _rfind_newline(f, offset - 1) + 1
+    f.seek(start)
+    return f.read(offset - start)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Makes a rename in `path` durable (directories cannot be opened on Windows)."""
+    if sys.platform != "win32":
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _checkpoint_key(lock_path: Path) -> str:
+    # Commands may see the bolt through a relative or an absolute path
+    return os.fspath(lock_path.resolve())
@@ -1,7 +1,56 @@
-from typing import List, Dict
+import os
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Iterator, List, Dict, Optional
 from datetime import datetime, timezone
-from pydantic import BaseModel
-import hashlib
+from pathlib import Path
+from pydantic import BaseModel, Field
+
+from geas_ai.core.compact import (
+    CompactManifest,
+    is_compact_manifest,
+    write_compact_manifest,
+)
+from geas_ai.core.merkle import (
+    MERKLE_FILE_NAME,
+    InclusionProof,
+    MerkleTree,
+    changed_leaves,
+    load_audit_path,
+)
+from geas_ai.core.timings import TestTimings
+
+MANIFEST_FILE_NAME = "manifest.json"
+COMPACT_MANIFEST_FILE_NAME = "manifest.bin"
+MANIFEST_FORMATS = ("json", "binary")
+
+
+class ResourceUsage(BaseModel):
+    # rusage of the test process and every descendant it waited for
+    user_cpu_seconds: float
+    system_cpu_seconds: float
+    peak_rss_bytes: int  # of the largest single process, not a sum
+    block_input_ops: int
+    block_output_ops: int
+
+
+class TestShardResult(BaseModel):
+    index: int
+    passed: bool
+    exit_code: int
+    duration_seconds: float
+    resources: Optional[ResourceUsage] = None
+
+
+class TestSelection(BaseModel):
+    mode: str  # "full" or "impact"
+    reason: str
+    # Root hash of the previous proof the scope was diffed against
+    base_root: Optional[str] = None
+    # Selected test file -> changed files it imports (directly or transitively)
+    tests: Dict[str, List[str]] = Field(default_factory=dict)
+    # Impact-selected proofs since the last full run (0 for a full run)
+    runs_since_full: int = 0
 
 
 class TestResultInfo(BaseModel):
@@ -9,66 +58,283 @@ class TestResultInfo(BaseModel):
     exit_code: int
     duration_seconds: float
     timestamp: datetime
-    output: str = ""
+    # Tail of the test output, for display only: the full output is in
+    # mrp/tests.log, which the manifest pins by digest and size instead
+    output: str = Field(default="", exclude=True)
+    log_hash: Optional[str] = None  # "<algorithm>:<hex>" of mrp/tests.log
+    log_size: Optional[int] = None
+    # True if the tests were not run again: this passing result was reused
+    # from an earlier proof of the same root, command and scope
+    reused: bool = False
+    # True if the tests were not run at all (--skip-tests). passed stays True
+    # for such proofs, as it always was: check skipped before trusting it
+    skipped: bool = False
+    # Per-shard results when the suite ran as parallel shards (--test-shards)
+    shards: Optional[List[TestShardResult]] = None
+    # Which tests ran and why, when selected by impact analysis (--impact)
+    selection: Optional[TestSelection] = None
+    # Per-test outcomes and durations from the JUnit report, if one was
+    # collected; like the output they are not part of the manifest, but
+    # written to the mrp/tests.timings.json sidecar
+    timings: TestTimings = Field(default_factory=dict, exclude=True)
+    # CPU, memory and block I/O of the test process tree (POSIX only)
+    resources: Optional[ResourceUsage] = None
 
 
 class Manifest(BaseModel):
     bolt_id: str
     generated_at: datetime
     scope: List[str]
-    files: Dict[str, str]  # Path -> SHA256
+    files: Dict[str, str]  # Path -> hex digest
     root_hash: str
     test_result: TestResultInfo
+    # hashlib algorithm of the file digests and of the Merkle tree
+    algorithm: str = "sha256"
 
 
-def calculate_merkle_root(files: Dict[str, str]) -> str:
+def calculate_merkle_root(files: Dict[str, str], algorithm: str = "sha256") -> str:
     """
-    Calculates the Merkle Root from a dictionary of file paths and their SHA256 hashes.
+    Calculates the Merkle Root from a dictionary of file paths and their hashes.
 
     Logic:
     1. Leaves: Sort filepaths -> Extract hashes.
-    2. Leaf Hashing: We use the hash provided in the dict (SHA256 of content).
-    3. Tree Construction:
+    2. Leaf Hashing: We use the hash provided in the dict (digest of content).
+    3. Tree Construction (H = `algorithm`, SHA256 by default):
         - Pair adjacent nodes (A, B).
-        - Parent = SHA256(A + B).
-        - If odd count, Parent = SHA256(Last + Last).
+        - Parent = H(A + B).
+        - If odd count, Parent = H(Last + Last).
         - Repeat until Root.
     """
-    if not files:
-        # Return hash of empty string if no files
-        return hashlib.sha256(b"").hexdigest()
-
     # Sort by filepath to ensure deterministic ordering
     sorted_paths = sorted(files.keys())
-    # Extract hashes
-    leaves = [files[path] for path in sorted_paths]
+    return MerkleTree.build([files[path] for path in sorted_paths], algorithm).root
+
+
+def load_manifest(path: Path) -> Optional[Manifest]:
+    """
+    Loads a manifest if it exists and parses, otherwise returns None.
+
+    Both the JSON and the compact binary format are accepted; the format is
+    detected from the file contents, not its name.
+    """
+    try:
+        if is_compact_manifest(path):
+            with CompactManifest.open(path) as compact:
+                return Manifest.model_validate(
+                    {**compact.header, "files": dict(compact.items())}
+                )
+        with open(path, "r", encoding="utf-8") as f:
+            return Manifest.model_validate_json(f.read())
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def save_manifest(manifest: Manifest, path: Path, fmt: str = "json") -> None:
+    """
+    Writes a manifest as pretty JSON or in the compact binary format.
+
+    The binary format (see core.compact) stores the sorted paths with prefix
+    compression and the digests as packed raw bytes: less than half the size
+    of the JSON, and a single path can be looked up without decoding the
+    table (see lookup_manifest_file). Writing or loading the whole file is
+    slower than the JSON, which is why JSON stays the default.
+    """
+    if fmt == "json":
+        with open(path, "w") as f:
+            f.write(manifest.model_dump_json(indent=2))
+    elif fmt == "binary":
+        header = manifest.model_dump(mode="json", exclude={"files"})
+        write_compact_manifest(path, header, manifest.files)
+    else:
+        raise ValueError(
+            f"Unknown manifest format '{fmt}'. Use: {', '.join(MANIFEST_FORMATS)}"
+        )
+
+
+def find_manifest_path(mrp_dir: Path) -> Path:
+    """Returns the manifest of an mrp/ directory, whichever format it was written in."""
+    compact_path = mrp_dir / COMPACT_MANIFEST_FILE_NAME
+    if compact_path.is_file():
+        return compact_path
+    return mrp_dir / MANIFEST_FILE_NAME
+
+
+def normalize_manifest_path(path: str) -> str:
+    """Normalizes a user-supplied path to the POSIX form used as manifest keys."""
+    return Path(os.path.normpath(path)).as_posix()
+
 
-    current_level = leaves
+@dataclass
+class ManifestLookup:
+    """The root of a manifest, with the inclusion proof of one path."""
+
+    root_hash: str
+    algorithm: str
+    proof: Optional[InclusionProof]  # None if the path is not in the manifest
+
+
+def lookup_manifest_file(mrp_dir: Path, path: str) -> Optional[ManifestLookup]:
+    """
+    Builds the inclusion proof of one path from the manifest of an mrp/ directory.
+
+    Returns None if there is no readable manifest. A compact manifest is
+    searched in place (CompactManifest.index_of) and the audit path is read
+    from the persisted levels (load_audit_path), so neither the path table
+    nor the tree is decoded. A JSON manifest has to be parsed whole, but is
+    not sorted. The tree is only rebuilt when merkle.bin is missing or stale.
+    """
+    manifest_path = find_manifest_path(mrp_dir)
+    merkle_path = mrp_dir / MERKLE_FILE_NAME
+
+    if is_compact_manifest(manifest_path):
+        try:
+            with CompactManifest.open(manifest_path) as compact:
+                header = Manifest.model_validate({**compact.header, "files": {}})
+                index = compact.index_of(path)
+                if index is None:
+                    return ManifestLookup(header.root_hash, header.algorithm, None)
+                proof = _inclusion_proof(
+                    header,
+                    path,
+                    index,
+                    compact.count,
+                    compact.digest_at(index),
+                    merkle_path,
+                    compact.digests,
+                )
+        except (OSError, ValueError, IndexError):
+            return None
+        return ManifestLookup(header.root_hash, header.algorithm, proof)
+
+    manifest = load_manifest(manifest_path)
+    if not manifest:
+        return None
+    if path not in manifest.files:
+        return ManifestLookup(manifest.root_hash, manifest.algorithm, None)
+
+    files = manifest.files
+    # Leaves are ordered by path, so the leaf index is the rank of the path
+    index = sum(1 for p in files if p < path)
+    proof = _inclusion_proof(
+        manifest,
+        path,
+        index,
+        len(files),
+        files[path],
+        merkle_path,
+        lambda: [files[p] for p in sorted(files)],
+    )
+    return ManifestLookup(manifest.root_hash, manifest.algorithm, proof)
+
+
+def _inclusion_proof(
+    manifest: Manifest,
+    path: str,
+    index: int,
+    leaf_count: int,
+    leaf_hash: str,
+    merkle_path: Path,
+    leaves: Callable[[], List[str]],
+) -> InclusionProof:
+    audit_path = load_audit_path(merkle_path, index, leaf_count, manifest.root_hash)
+    if audit_path is None:
+        audit_path = MerkleTree.build(leaves(), manifest.algorithm).audit_path(index)
+    return InclusionProof(
+        path=path,
+        leaf_index=index,
+        leaf_count=leaf_count,
+        leaf_hash=leaf_hash,
+        root_hash=manifest.root_hash,
+        audit_path=audit_path,
+        algorithm=manifest.algorithm,
+    )
 
-    while len(current_level) > 1:
-        next_level = []
-        for i in range(0, len(current_level), 2):
-            left = current_level[i]
-            if i + 1 < len(current_level):
-                right = current_level[i + 1]
-            else:
-                # Odd count, duplicate last
-                right = left
 
-            # Combine hashes and hash again
-            combined = (left + right).encode("utf-8")
-            parent_hash = hashlib.sha256(combined).hexdigest()
-            next_level.append(parent_hash)
-        current_level = next_level
+class ChangeType(str, Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    MODIFIED = "modified"
 
-    return current_level[0]
+
+@dataclass(frozen=True)
+class FileChange:
+    change: ChangeType
+    path: str
+    old_hash: Optional[str] = None
+    new_hash: Optional[str] = None
+
+
+def diff_manifests(
+    old: Dict[str, str],
+    new: Dict[str, str],
+    old_tree: Optional[MerkleTree] = None,
+    new_tree: Optional[MerkleTree] = None,
+) -> Iterator[FileChange]:
+    """
+    Yields the added, removed and modified paths between two file maps, in path order.
+
+    The two sorted path lists are merged in a single pass, and changes are
+    yielded as they are found so callers can stream very large diffs.
+
+    If both Merkle trees are given and the path lists are identical (so leaf
+    positions line up), identical subtrees are skipped entirely and only the
+    differing leaves are visited.
+    """
+    old_paths = sorted(old.keys())
+    new_paths = sorted(new.keys())
+
+    if (
+        old_tree is not None
+        and new_tree is not None
+        and len(old_tree.leaves) == len(old_paths)
+        and len(new_tree.leaves) == len(new_paths)
+        and old_paths == new_paths
+    ):
+        for index in changed_leaves(old_tree, new_tree):
+            path = old_paths[index]
+            yield FileChange(ChangeType.MODIFIED, path, old[path], new[path])
+        return
+
+    i = j = 0
+    while i < len(old_paths) and j < len(new_paths):
+        old_path, new_path = old_paths[i], new_paths[j]
+        if old_path == new_path:
+            if old[old_path] != new[new_path]:
+                yield FileChange(
+                    ChangeType.MODIFIED, old_path, old[old_path], new[new_path]
+                )
+            i += 1
+            j += 1
+        elif old_path < new_path:
+            yield FileChange(ChangeType.REMOVED, old_path, old_hash=old[old_path])
+            i += 1
+        else:
+            yield FileChange(ChangeType.ADDED, new_path, new_hash=new[new_path])
+            j += 1
+
+    for path in old_paths[i:]:
+        yield FileChange(ChangeType.REMOVED, path, old_hash=old[path])
+    for path in new_paths[j:]:
+        yield FileChange(ChangeType.ADDED, path, new_hash=new[path])
 
 
 def generate_manifest(
-    bolt_id: str, scope: List[str], files: Dict[str, str], test_result: TestResultInfo
+    bolt_id: str,
+    scope: List[str],
+    files: Dict[str, str],
+    test_result: TestResultInfo,
+    tree: Optional[MerkleTree] = None,
+    algorithm: str = "sha256",
 ) -> Manifest:
-    """Generates the Manifest object."""
-    root_hash = calculate_merkle_root(files)
+    """Generates the Manifest object.
+
+    If a prebuilt MerkleTree over `files` is given (e.g. an incrementally
+    updated one), its root is used instead of rebuilding the tree.
+    `algorithm` is the hashlib algorithm the file digests were computed with.
+    """
+    root_hash = (
+        tree.root if tree is not None else calculate_merkle_root(files, algorithm)
+    )
 
     return Manifest(
         bolt_id=bolt_id,
@@ -77,4 +343,5 @@ def generate_manifest(
         files=files,
         root_hash=root_hash,
         test_result=test_result,
+        algorithm=algorithm,
     )
@@ -0,0 +1,308 @@
+import hashlib
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Literal, Optional
+
+from pydantic import BaseModel
+
+MERKLE_FILE_NAME = "merkle.bin"
+
+_MAGIC = b"GEASMRK1"
+# magic, level count, digest size (bytes)
+_HEADER = struct.Struct("<8sII")
+_LEVEL_HEADER = struct.Struct("<Q")
+
+
+class ProofStep(BaseModel):
+    hash: str
+    position: Literal["left", "right"]  # Side of the sibling relative to the path
+
+
+class InclusionProof(BaseModel):
+    path: str
+    leaf_index: int
+    leaf_count: int
+    leaf_hash: str
+    root_hash: str
+    audit_path: List[ProofStep]
+    algorithm: str = "sha256"
+
+
+class MerkleTree:
+    """
+    Merkle tree over hex leaf digests that keeps every internal level.
+
+    The construction is the one used by the manifest root:
+    - Parent = H(left_hex + right_hex), as hex, where H is the tree's
+      hashlib algorithm (SHA-256 unless the manifest records another one).
+    - On odd levels, the last node is paired with itself.
+
+    Keeping the levels means a change to k leaves only recomputes the
+    k paths to the root (O(k log n) hashes) instead of the whole tree.
+    """
+
+    def __init__(self, levels: List[List[str]], algorithm: str = "sha256"):
+        self.levels = levels
+        self.algorithm = algorithm
+
+    @classmethod
+    def build(cls, leaves: List[str], algorithm: str = "sha256") -> "MerkleTree":
+        """Builds the full tree bottom-up from the ordered leaf digests."""
+        if not leaves:
+            return cls([], algorithm)
+
+        levels = [list(leaves)]
+        current = levels[0]
+        while len(current) > 1:
+            current = [
+                _parent(current, i, algorithm) for i in range(0, len(current), 2)
+            ]
+            levels.append(current)
+        return cls(levels, algorithm)
+
+    @property
+    def root(self) -> str:
+        """The root hash (the digest of the empty string for an empty tree)."""
+        if not self.levels:
+            return hashlib.new(self.algorithm, b"").hexdigest()
+        return self.levels[-1][0]
+
+    @property
+    def leaves(self) -> List[str]:
+        return self.levels[0] if self.levels else []
+
+    def update(self, changes: Dict[int, str]) -> int:
+        """
+        Replaces leaves in place and recomputes only their ancestors.
+
+        Args:
+            changes: Leaf index -> new leaf digest.
+
+        Returns:
+            The number of parent hashes computed.
+        """
+        if not changes:
+            return 0
+
+        leaves = self.levels[0]
+        for index, digest in changes.items():
+            leaves[index] = digest
+
+        hashed = 0
+        dirty: Iterable[int] = changes.keys()
+        for depth in range(1, len(self.levels)):
+            below = self.levels[depth - 1]
+            level = self.levels[depth]
+            parents = sorted({i // 2 for i in dirty})
+            for p in parents:
+                level[p] = _parent(below, 2 * p, self.algorithm)
+            hashed += len(parents)
+            dirty = parents
+        return hashed
+
+    def audit_path(self, index: int) -> List[ProofStep]:
+        """
+        Returns the sibling hashes from leaf `index` up to the root.
+
+        On odd levels the last node is its own sibling, matching how the
+        tree duplicates it during construction.
+        """
+        steps: List[ProofStep] = []
+        for level in self.levels[:-1]:
+            if index % 2 == 0:
+                sibling = level[index + 1] if index + 1 < len(level) else level[index]
+                steps.append(ProofStep(hash=sibling, position="right"))
+            else:
+                steps.append(ProofStep(hash=level[index - 1], position="left"))
+            index //= 2
+        return steps
+
+    def save(self, path: Path) -> None:
+        """Persists all levels as packed raw digests."""
+        digest_size = len(self.levels[0][0]) // 2 if self.levels else 0
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self.levels), digest_size))
+            for level in self.levels:
+                f.write(_LEVEL_HEADER.pack(len(level)))
+                f.write(bytes.fromhex("".join(level)))
+
+    @classmethod
+    def load(cls, path: Path, algorithm: str = "sha256") -> Optional["MerkleTree"]:
+        """
+        Loads persisted levels. Returns None if the file is missing or malformed.
+
+        The file does not record the algorithm; callers pass the one of the
+        manifest the levels belong to and check the root against it.
+        """
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            magic, level_count, digest_size = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC:
+                return None
+
+            offset = _HEADER.size
+            levels: List[List[str]] = []
+            for _ in range(level_count):
+                (count,) = _LEVEL_HEADER.unpack_from(data, offset)
+                offset += _LEVEL_HEADER.size
+                end = offset + count * digest_size
+                if end > len(data):
+                    return None
+                blob = data[offset:end].hex()
+                width = digest_size * 2
+                levels.append([blob[i : i + width] for i in range(0, len(blob), width)])
+                offset = end
+        except struct.error:
+            return None
+
+        if offset != len(data) or (levels and len(levels[-1]) != 1):
+            return None
+        return cls(levels, algorithm)
+
+
+def load_audit_path(
+    path: Path, index: int, leaf_count: int, root_hash: str
+) -> Optional[List[ProofStep]]:
+    """
+    Reads the audit path of one leaf straight out of persisted levels.
+
+    Only the level headers and one sibling per level are read (O(log n)
+    seeks), instead of loading every level like MerkleTree.load. Returns None
+    if the file is missing, malformed, or not the tree of `root_hash` with
+    `leaf_count` leaves; callers then rebuild the tree.
+    """
+    try:
+        with open(path, "rb") as f:
+            magic, level_count, digest_size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or not 0 <= index < leaf_count:
+                return None
+
+            steps: List[ProofStep] = []
+            offset = _HEADER.size
+            for depth in range(level_count):
+                f.seek(offset)
+                (count,) = _LEVEL_HEADER.unpack(f.read(_LEVEL_HEADER.size))
+                offset += _LEVEL_HEADER.size
+                if (depth == 0 and count != leaf_count) or index >= count:
+                    return None
+
+                if depth == level_count - 1:
+                    f.seek(offset)
+                    top = f.read(digest_size).hex()
+                    if count != 1 or top != root_hash:
+                        return None
+                    return steps
+
+                if index % 2 == 0:
+                    sibling = index + 1 if index + 1 < count else index
+                    position: Literal["left", "right"] = "right"
+                else:
+                    sibling = index - 1
+                    position = "left"
+                f.seek(offset + sibling * digest_size)
+                digest = f.read(digest_size)
+                if len(digest) != digest_size:
+                    return None
+                steps.append(ProofStep(hash=digest.hex(), position=position))
+
+                offset += count * digest_size
+                index //= 2
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+def build_incremental(
+    files: Dict[str, str],
+    previous_files: Optional[Dict[str, str]] = None,
+    previous_tree: Optional[MerkleTree] = None,
+    algorithm: str = "sha256",
+) -> MerkleTree:
+    """
+    Builds the tree for `files`, reusing a previously persisted tree if possible.
+
+    The previous tree is reused when the set of paths is unchanged (so every
+    leaf keeps its position); only the leaves whose digest differs are
+    updated. Otherwise (files added or removed, a different algorithm, a
+    previous tree whose leaves are not previous_files, or no usable previous
+    tree) the tree is rebuilt from scratch. Either way the
+    root is bit-for-bit the one calculate_merkle_root would produce.
+    """
+    sorted_paths = sorted(files.keys())
+    leaves = [files[path] for path in sorted_paths]
+
+    if (
+        previous_tree is not None
+        and previous_files is not None
+        and previous_tree.algorithm == algorithm
+        and len(previous_tree.leaves) == len(leaves)
+        and sorted(previous_files.keys()) == sorted_paths
+        # The saved levels must be the tree of previous_files, or the
+        # unchanged leaves would keep wrong ancestors
+        and previous_tree.leaves == [previous_files[path] for path in sorted_paths]
+    ):
+        changes = {
+            i: digest
+            for i, digest in enumerate(leaves)
+            if previous_tree.leaves[i] != digest
+        }
+        previous_tree.update(changes)
+        return previous_tree
+
+    return MerkleTree.build(leaves, algorithm)
+
+
+def changed_leaves(a: MerkleTree, b: MerkleTree) -> Iterator[int]:
+    """
+    Yields, in order, the leaf indices where two same-shaped trees differ.
+
+    Walks down from the root and skips every subtree whose node hashes are
+    equal, so k changes cost O(k log n) comparisons instead of O(n).
+    """
+    if len(a.levels) != len(b.levels) or len(a.leaves) != len(b.leaves):
+        raise ValueError("Trees must have the same number of leaves.")
+    if not a.levels:
+        return
+
+    top = len(a.levels) - 1
+    stack = [(top, 0)]
+    while stack:
+        depth, index = stack.pop()
+        if a.levels[depth][index] == b.levels[depth][index]:
+            continue
+        if depth == 0:
+            yield index
+            continue
+        below = len(a.levels[depth - 1])
+        # Push right first so the left subtree is visited first
+        for child in (2 * index + 1, 2 * index):
+            if child < below:
+                stack.append((depth - 1, child))
+
+
+def verify_inclusion(
+    leaf_hash: str,
+    audit_path: List[ProofStep],
+    root_hash: str,
+    algorithm: str = "sha256",
+) -> bool:
+    """Folds an audit path over a leaf and checks it lands on root_hash (O(log n))."""
+    current = leaf_hash
+    for step in audit_path:
+        if step.position == "right":
+            combined = current + step.hash
+        else:
+            combined = step.hash + current
+        current = hashlib.new(algorithm, combined.encode("utf-8")).hexdigest()
+    return current == root_hash
+
+
+def _parent(level: List[str], i: int, algorithm: str) -> str:
+    left = level[i]
+    # Odd count, duplicate last
+    right = level[i + 1] if i + 1 < len(level) else left
+    return hashlib.new(algorithm, (left + right).encode("utf-8")).hexdigest()
@@ -0,0 +1,104 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, ParamSpec, TypeVar
+
+PROFILE_ENV = "GEAS_PROFILE"
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class Profiler:
+    """
+    Accumulates wall time and call counts per named phase.
+
+    Phase times are inclusive (a phase that calls another includes its time)
+    and are summed across threads, so phases run from a thread pool (e.g.
+    hashing) can add up to more than the command's wall time.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        # Phase -> [seconds, calls], in the order the phases were first seen
+        self._phases: Dict[str, List[float]] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            totals = self._phases.setdefault(name, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+
+    def report(self, command: Optional[str] = None) -> Dict[str, Any]:
+        """Returns the breakdown as a JSON-serializable dict."""
+        with self._lock:
+            phases = {
+                name: {"seconds": round(seconds, 6), "calls": int(calls)}
+                for name, (seconds, calls) in self._phases.items()
+            }
+        return {
+            "command": command,
+            "total_seconds": round(time.perf_counter() - self.started, 6),
+            "phases": phases,
+        }
+
+    def to_json(self, command: Optional[str] = None) -> str:
+        return json.dumps(self.report(command), indent=2)
+
+
+_active: Optional[Profiler] = None
+
+
+def start() -> Profiler:
+    """Starts collecting phase timings for the rest of the process."""
+    global _active
+    _active = Profiler()
+    return _active
+
+
+def stop() -> Optional[Profiler]:
+    """Stops collecting and returns the profiler that was active, if any."""
+    global _active
+    profiler, _active = _active, None
+    return profiler
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Times the enclosed block as one call of `name` (if profiling is on)."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(name, time.perf_counter() - start_time)
+
+
+def profiled(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator timing every call of the function as phase `name`.
+
+    When profiling is off, the only overhead is a check of a module global.
+    """
+
+    def decorator(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            profiler = _active
+            if profiler is None:
+                return fn(*args, **kwargs)
+            start_time = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.record(name, time.perf_counter() - start_time)
+
+        return wrapper
+
+    return decorator
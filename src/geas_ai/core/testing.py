@@ -1,63 +1,423 @@
+import hashlib
+import os
+import signal
 import subprocess
 import shlex
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from geas_ai.core.manifest import TestResultInfo
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Dict, List, Optional, Tuple
+from geas_ai.core.hashing import DEFAULT_HASH_ALGORITHM
+from geas_ai.core.manifest import ResourceUsage, TestResultInfo, TestShardResult
+from geas_ai.core.timings import TestTimings, junit_command, parse_junit_xml
 
+if TYPE_CHECKING:
+    import resource
 
-def run_tests(command: str = "uv run pytest", timeout: int = 300) -> TestResultInfo:
+# How much of the end of the output is kept in memory (TestResultInfo.output)
+OUTPUT_TAIL_BYTES = 64 * 1024
+_READ_SIZE = 64 * 1024
+# How often a cancellable run checks its cancel event
+_CANCEL_POLL_SECONDS = 0.1
+# Longest sleep between two exit checks of a test process
+_WAIT_POLL_SECONDS = 0.05
+# Every shard of a sharded run gets its position through these variables
+# (and through the {shard_index} / {shard_count} placeholders of the command)
+SHARD_INDEX_ENV = "GEAS_TEST_SHARD_INDEX"
+SHARD_COUNT_ENV = "GEAS_TEST_SHARD_COUNT"
+
+
+class OutputCapture:
+    """
+    Streams test output to a log file and an optional tee, keeping only a tail.
+
+    Memory stays bounded by OUTPUT_TAIL_BYTES however much the suite prints;
+    the full output lives only in the log file, whose digest and size are
+    computed on the fly.
+    """
+
+    def __init__(
+        self,
+        log_path: Optional[Path] = None,
+        tee: Optional[IO[bytes]] = None,
+        algorithm: str = DEFAULT_HASH_ALGORITHM,
+    ):
+        self.algorithm = algorithm
+        self.size = 0
+        self._hasher = hashlib.new(algorithm)
+        self._tail = bytearray()
+        self._tee = tee
+        self.log_path = log_path
+        self._log = open(log_path, "wb") if log_path is not None else None
+
+    def write(self, data: bytes) -> None:
+        if self._log is not None:
+            self._log.write(data)
+        if self._tee is not None:
+            self._tee.write(data)
+            self._tee.flush()
+        self._hasher.update(data)
+        self.size += len(data)
+
+        self._tail += data
+        if len(self._tail) > OUTPUT_TAIL_BYTES:
+            del self._tail[: len(self._tail) - OUTPUT_TAIL_BYTES]
+
+    def drain(self, stream: IO[bytes]) -> None:
+        """Copies `stream` until EOF (run on a reader thread)."""
+        fd = stream.fileno()
+        while True:
+            # os.read returns whatever is available, so the tee stays live
+            chunk = os.read(fd, _READ_SIZE)
+            if not chunk:
+                break
+            self.write(chunk)
+
+    @property
+    def tail(self) -> str:
+        # The tail may start mid-character; errors="replace" keeps it decodable
+        return self._tail.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def result(
+        self,
+        passed: bool,
+        exit_code: int,
+        start_time: float,
+        resources: Optional[ResourceUsage] = None,
+    ) -> TestResultInfo:
+        if resources is not None:
+            # Part of the log (and of its digest), after the suite's own output
+            self.write(f"\n{format_resources(resources)}\n".encode())
+        self.close()
+        return TestResultInfo(
+            passed=passed,
+            exit_code=exit_code,
+            duration_seconds=time.time() - start_time,
+            timestamp=datetime.now(timezone.utc),
+            output=self.tail,
+            log_hash=(
+                f"{self.algorithm}:{self._hasher.hexdigest()}"
+                if self.log_path is not None
+                else None
+            ),
+            log_size=self.size if self.log_path is not None else None,
+            resources=resources,
+        )
+
+
+def run_tests(
+    command: str = "uv run pytest",
+    timeout: int = 300,
+    log_path: Optional[Path] = None,
+    tee: Optional[IO[bytes]] = None,
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+    cancel: Optional[threading.Event] = None,
+    shards: int = 1,
+    env: Optional[Dict[str, str]] = None,
+    junit_path: Optional[Path] = None,
+) -> TestResultInfo:
     """
     Executes the test command and captures the result.
 
+    stdout and stderr are merged (in the order the suite wrote them) and
+    streamed as they arrive: to `log_path`, and to `tee` (e.g. the console)
+    if given. Only the last OUTPUT_TAIL_BYTES are kept in memory.
+
     Args:
         command: The shell command to run tests.
         timeout: Maximum execution time in seconds.
+        log_path: File the full output is written to (e.g. mrp/tests.log).
+        tee: Optional binary stream that also receives the output live.
+        algorithm: hashlib algorithm for the log digest.
+        cancel: If set while the tests run, the process is killed and a
+            failed result is returned (used to abandon a speculative run).
+        shards: Number of test processes to run in parallel (see run_sharded_tests).
+        env: Extra environment variables for the test process.
+        junit_path: If given, the command also writes a JUnit XML report
+            there (see timings.junit_command); it is parsed into
+            `timings` and removed.
 
     Returns:
-        TestResultInfo object containing execution details.
+        TestResultInfo with the output tail and, if logged, the log's digest and size.
     """
+    if shards > 1:
+        return run_sharded_tests(
+            command, shards, timeout, log_path, tee, algorithm, cancel, junit_path
+        )
+    if junit_path is None:
+        return _run_process(command, timeout, log_path, tee, algorithm, cancel, env)
+
+    junit_path.unlink(missing_ok=True)
+    result = _run_process(
+        junit_command(command, junit_path),
+        timeout,
+        log_path,
+        tee,
+        algorithm,
+        cancel,
+        env,
+    )
+    result.timings = parse_junit_xml(junit_path)
+    junit_path.unlink(missing_ok=True)
+    return result
+
+
+def _run_process(
+    command: str,
+    timeout: int,
+    log_path: Optional[Path],
+    tee: Optional[IO[bytes]],
+    algorithm: str,
+    cancel: Optional[threading.Event],
+    env: Optional[Dict[str, str]],
+) -> TestResultInfo:
     start_time = time.time()
+    capture = OutputCapture(log_path, tee, algorithm)
 
     try:
-        # Run the command
-        # using shlex.split to properly parse command arguments
-        # capture_output=True captures stdout and stderr
-        # text=True decodes output as string
-        result = subprocess.run(
-            shlex.split(command), timeout=timeout, capture_output=True, text=True
+        try:
+            # using shlex.split to properly parse command arguments
+            process = subprocess.Popen(
+                shlex.split(command),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env={**os.environ, **env} if env else None,
+                # Own process group, so a timeout also kills what the runner
+                # spawned (e.g. `uv run` -> pytest -> xdist workers)
+                start_new_session=sys.platform != "win32",
+            )
+        except Exception as e:
+            # Fallback for other errors (e.g. command not found)
+            capture.write(str(e).encode("utf-8"))
+            return capture.result(False, 1, start_time)
+
+        assert process.stdout is not None
+        reader = threading.Thread(
+            target=capture.drain, args=(process.stdout,), daemon=True
         )
+        reader.start()
 
-        duration = time.time() - start_time
-        passed = result.returncode == 0
+        deadline = start_time + timeout
+        while True:
+            remaining = deadline - time.time()
+            if cancel is not None:
+                remaining = min(remaining, _CANCEL_POLL_SECONDS)
+            try:
+                exit_code, resources = _wait(process, max(remaining, 0))
+                break
+            except subprocess.TimeoutExpired:
+                if time.time() >= deadline:
+                    resources = _kill(process, reader)
+                    capture.write(
+                        f"\nTimeout expired after {timeout} seconds.\n".encode()
+                    )
+                    return capture.result(
+                        False, 124, start_time, resources
+                    )  # Standard timeout code
+                if cancel is not None and cancel.is_set():
+                    resources = _kill(process, reader)
+                    capture.write(b"\nCancelled.\n")
+                    return capture.result(False, 1, start_time, resources)
 
-        return TestResultInfo(
-            passed=passed,
-            exit_code=result.returncode,
-            duration_seconds=duration,
-            timestamp=datetime.now(timezone.utc),
-            output=result.stdout + "\n" + result.stderr,
+        reader.join()
+        process.stdout.close()
+        return capture.result(exit_code == 0, exit_code, start_time, resources)
+    finally:
+        capture.close()
+
+
+def run_sharded_tests(
+    command: str,
+    shards: int,
+    timeout: int = 300,
+    log_path: Optional[Path] = None,
+    tee: Optional[IO[bytes]] = None,
+    algorithm: str = DEFAULT_HASH_ALGORITHM,
+    cancel: Optional[threading.Event] = None,
+    junit_path: Optional[Path] = None,
+) -> TestResultInfo:
+    """
+    Runs the test command as `shards` parallel processes and combines them.
+
+    Shard i of N gets GEAS_TEST_SHARD_INDEX=i and GEAS_TEST_SHARD_COUNT=N,
+    and {shard_index} / {shard_count} in the command are replaced, so the
+    runner can select its part of the suite (e.g. pytest-shard's
+    `--shard-id={shard_index} --num-shards={shard_count}`).
+
+    All shards start together and share one deadline: when `timeout` expires
+    every shard still running is killed. Each shard streams to its own log
+    next to `log_path`; once all have finished they are concatenated, in
+    shard order, into `log_path`, which the combined result pins. Likewise
+    each shard writes its own JUnit report, and their timings are merged.
+
+    Returns:
+        TestResultInfo that passed only if every shard passed, with the
+        exit code of the first failing shard (124 if any timed out), the
+        wall-clock duration and the per-shard results.
+    """
+    start_time = time.time()
+    shard_logs = [_shard_path(log_path, i) for i in range(shards)]
+    shard_reports = [_shard_path(junit_path, i) for i in range(shards)]
+
+    def run_shard(index: int) -> TestResultInfo:
+        return run_tests(
+            shard_command(command, index, shards),
+            timeout,
+            log_path=shard_logs[index],
+            # Shards write to the tee as their output arrives (interleaved)
+            tee=tee,
+            algorithm=algorithm,
+            cancel=cancel,
+            env={SHARD_INDEX_ENV: str(index), SHARD_COUNT_ENV: str(shards)},
+            junit_path=shard_reports[index],
         )
 
-    except subprocess.TimeoutExpired as e:
-        duration = time.time() - start_time
-        # Use errors="replace" to prevent crash on non-utf8 output
-        output = e.stdout.decode(errors="replace") if e.stdout else ""
-        output += "\n" + (e.stderr.decode(errors="replace") if e.stderr else "")
-        output += f"\nTimeout expired after {timeout} seconds."
-        return TestResultInfo(
-            passed=False,
-            exit_code=124,  # Standard timeout exit code
-            duration_seconds=duration,
-            timestamp=datetime.now(timezone.utc),
-            output=output,
+    with ThreadPoolExecutor(max_workers=shards) as executor:
+        results = list(executor.map(run_shard, range(shards)))
+
+    failed = [r for r in results if not r.passed]
+    if any(r.exit_code == 124 for r in failed):
+        exit_code = 124
+    else:
+        exit_code = failed[0].exit_code if failed else 0
+
+    capture = OutputCapture(log_path, None, algorithm)
+    try:
+        for index, (result, shard_log) in enumerate(zip(results, shard_logs)):
+            capture.write(
+                f"===== shard {index} of {shards} (exit code {result.exit_code}) =====\n".encode()
+            )
+            if shard_log is None:
+                capture.write(result.output.encode("utf-8"))
+                continue
+            with open(shard_log, "rb") as f:
+                while chunk := f.read(_READ_SIZE):
+                    capture.write(chunk)
+            shard_log.unlink()
+
+        combined = capture.result(
+            not failed,
+            exit_code,
+            start_time,
+            combine_resources(
+                [r.resources for r in results if r.resources is not None]
+            ),
         )
-    except Exception as e:
-        # Fallback for other errors (e.g. command not found)
-        duration = time.time() - start_time
-        return TestResultInfo(
-            passed=False,
-            exit_code=1,
-            duration_seconds=duration,
-            timestamp=datetime.now(timezone.utc),
-            output=str(e),
+    finally:
+        capture.close()
+
+    combined.shards = [
+        TestShardResult(
+            index=index,
+            passed=r.passed,
+            exit_code=r.exit_code,
+            duration_seconds=r.duration_seconds,
+            resources=r.resources,
         )
+        for index, r in enumerate(results)
+    ]
+    timings: TestTimings = {}
+    for result in results:
+        timings.update(result.timings)
+    combined.timings = timings
+    return combined
+
+
+def _shard_path(path: Optional[Path], index: int) -> Optional[Path]:
+    if path is None:
+        return None
+    return path.with_name(f"{path.stem}.shard{index}{path.suffix}")
+
+
+def shard_command(command: str, index: int, count: int) -> str:
+    """Fills the {shard_index} and {shard_count} placeholders of a test command."""
+    return command.replace("{shard_index}", str(index)).replace(
+        "{shard_count}", str(count)
+    )
+
+
+def combine_resources(usages: List[ResourceUsage]) -> Optional[ResourceUsage]:
+    """Totals the resource usage of parallel runs (peak RSS is the largest one)."""
+    if not usages:
+        return None
+    return ResourceUsage(
+        user_cpu_seconds=sum(u.user_cpu_seconds for u in usages),
+        system_cpu_seconds=sum(u.system_cpu_seconds for u in usages),
+        peak_rss_bytes=max(u.peak_rss_bytes for u in usages),
+        block_input_ops=sum(u.block_input_ops for u in usages),
+        block_output_ops=sum(u.block_output_ops for u in usages),
+    )
+
+
+def format_resources(usage: ResourceUsage) -> str:
+    return (
+        f"Resources: {usage.user_cpu_seconds:.2f}s user, "
+        f"{usage.system_cpu_seconds:.2f}s sys, "
+        f"peak RSS {usage.peak_rss_bytes / (1024 * 1024):.1f} MiB, "
+        f"block I/O {usage.block_input_ops} in / {usage.block_output_ops} out"
+    )
+
+
+def _wait(
+    process: "subprocess.Popen[bytes]", timeout: float
+) -> Tuple[int, Optional[ResourceUsage]]:
+    """
+    Like process.wait(timeout), but reaps the process with os.wait4 where
+    available, which also returns the rusage of the process and of every
+    descendant it waited for. (getrusage(RUSAGE_CHILDREN) would not do: it
+    covers all children of geas, including concurrently running shards.)
+    """
+    if sys.platform == "win32":
+        return process.wait(timeout=timeout), None
+
+    deadline = time.monotonic() + timeout
+    delay = 0.0005
+    while True:
+        pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            process.returncode = os.waitstatus_to_exitcode(status)
+            return process.returncode, _resource_usage(rusage)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        delay = min(delay * 2, remaining, _WAIT_POLL_SECONDS)
+        time.sleep(delay)
+
+
+def _resource_usage(rusage: "resource.struct_rusage") -> ResourceUsage:
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return ResourceUsage(
+        user_cpu_seconds=rusage.ru_utime,
+        system_cpu_seconds=rusage.ru_stime,
+        peak_rss_bytes=rusage.ru_maxrss * rss_unit,
+        block_input_ops=rusage.ru_inblock,
+        block_output_ops=rusage.ru_oublock,
+    )
+
+
+def _kill(
+    process: "subprocess.Popen[bytes]", reader: threading.Thread
+) -> Optional[ResourceUsage]:
+    resources = None
+    if sys.platform != "win32":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        _, resources = _wait(process, float("inf"))
+    else:
+        process.kill()
+        process.wait()
+    reader.join()
+    if process.stdout is not None:
+        process.stdout.close()
+    return resources
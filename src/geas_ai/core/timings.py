@@ -0,0 +1,121 @@
+import json
+import os
+import shlex
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+TIMINGS_FILE_NAME = "tests.timings.json"
+TIMINGS_VERSION = 1
+JUNIT_FILE_NAME = "tests.junit.xml"
+# Placeholder for the report path in the test command; without it, pytest's
+# --junitxml option is appended
+JUNIT_PLACEHOLDER = "{junit_xml}"
+
+# A test is flagged as slower than in the previous proof if it takes at least
+# this many times as long, and at least SLOWDOWN_MIN_SECONDS longer
+SLOWDOWN_FACTOR = 1.5
+SLOWDOWN_MIN_SECONDS = 0.1
+
+# Test id -> (outcome, duration in seconds)
+TestTimings = Dict[str, Tuple[str, float]]
+
+
+def junit_command(command: str, junit_path: Path) -> str:
+    """Makes the test command write a JUnit XML report to `junit_path`."""
+    quoted = shlex.quote(os.fspath(junit_path))
+    if JUNIT_PLACEHOLDER in command:
+        return command.replace(JUNIT_PLACEHOLDER, quoted)
+    return f"{command} --junitxml={quoted}"
+
+
+def parse_junit_xml(path: Path) -> TestTimings:
+    """
+    Reads the per-test outcomes and durations of a JUnit XML report.
+
+    The report is parsed incrementally and every <testcase> is discarded once
+    read, so memory does not grow with the size of the suite. A truncated
+    report (e.g. from a killed run) yields the tests recorded before the cut.
+    """
+    timings: TestTimings = {}
+    try:
+        for _, elem in ET.iterparse(path, events=("end",)):
+            if elem.tag != "testcase":
+                continue
+            classname = elem.get("classname", "")
+            name = elem.get("name", "")
+            test_id = f"{classname}::{name}" if classname else name
+
+            outcome = "passed"
+            for child in elem:
+                if child.tag in ("failure", "error", "skipped"):
+                    outcome = "failed" if child.tag == "failure" else child.tag
+                    break
+            try:
+                duration = float(elem.get("time", 0.0))
+            except ValueError:
+                duration = 0.0
+            timings[test_id] = (outcome, duration)
+            elem.clear()
+    except (OSError, ET.ParseError):
+        pass
+    return timings
+
+
+def save_timings(timings: TestTimings, path: Path) -> None:
+    """Writes the compact timings sidecar (test id -> [outcome, seconds])."""
+    tests = {
+        test_id: [outcome, round(duration, 6)]
+        for test_id, (outcome, duration) in sorted(timings.items())
+    }
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": TIMINGS_VERSION, "tests": tests}, f, separators=(",", ":")
+        )
+    os.replace(tmp_path, path)
+
+
+def load_timings(path: Path) -> TestTimings:
+    """Reads a timings sidecar (empty if missing or unreadable)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != TIMINGS_VERSION:
+            return {}
+        return {
+            test_id: (str(outcome), float(duration))
+            for test_id, (outcome, duration) in data["tests"].items()
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+
+def slowest_tests(timings: TestTimings, count: int = 5) -> List[Tuple[str, float]]:
+    """Returns the `count` slowest tests, slowest first."""
+    ranked = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)
+    return [(test_id, duration) for test_id, (_, duration) in ranked[:count]]
+
+
+def find_slowdowns(
+    current: TestTimings, previous: TestTimings
+) -> List[Tuple[str, float, float]]:
+    """
+    Returns (test id, previous seconds, current seconds) of the tests that got slower.
+
+    Only tests that passed in both runs are compared, and a test must exceed
+    both SLOWDOWN_FACTOR and SLOWDOWN_MIN_SECONDS to be flagged, so that
+    noise on very fast tests is not reported. Largest slowdowns first.
+    """
+    slowdowns = []
+    for test_id, (outcome, duration) in current.items():
+        before = previous.get(test_id)
+        if outcome != "passed" or before is None or before[0] != "passed":
+            continue
+        if (
+            duration >= before[1] * SLOWDOWN_FACTOR
+            and duration - before[1] >= SLOWDOWN_MIN_SECONDS
+        ):
+            slowdowns.append((test_id, before[1], duration))
+    slowdowns.sort(key=lambda item: item[2] - item[1], reverse=True)
+    return slowdowns
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 
@@ -10,29 +10,42 @@ from geas_ai.schemas.verification import (
     SignatureValidationResult,
     WorkflowValidationResult,
     ContentValidationResult,
+    LedgerVerificationResult,
 )
 from geas_ai.schemas.workflow import WorkflowConfig
 from geas_ai.schemas.identity import IdentityStore
-from geas_ai.core.hashing import calculate_event_hash, file_sha256
+from geas_ai.core.cache import HashCache
+from geas_ai.core.hashing import file_hash, hash_event_bytes, recorded_algorithm
+from geas_ai.core.ledger import LedgerCheckpoint, resume_index
+from geas_ai.core.profiling import phase, profiled
 from geas_ai.utils.crypto import canonicalize_json, verify
 
+# Each check below visits the events one at a time, so `verify_ledger` can
+# feed all of them from a single pass over the ledger. The validate_*
+# functions run one check on its own.
+
 # --- Chain Integrity ---
 
 
-def validate_chain_integrity(ledger: Ledger) -> ChainValidationResult:
-    """
-    Validate the hash chain integrity of the ledger.
-    """
-    violations: List[Violation] = []
+class _ChainCheck:
+    def __init__(
+        self, ledger: Ledger, checkpoint: Optional[LedgerCheckpoint] = None
+    ) -> None:
+        self.ledger = ledger
+        self.start = resume_index(ledger, checkpoint)
+        self.index = 0
+        self.violations: List[Violation] = []
 
-    if not ledger.events:
-        return ChainValidationResult(valid=True, violations=[], event_count=0)
+    def visit(self, event: LedgerEvent) -> None:
+        i = self.index
+        self.index += 1
+        # Events before the checkpoint are trusted
+        if i < self.start:
+            return
 
-    # 1. Iterate events
-    for i, event in enumerate(ledger.events):
         # Sequence check
         if event.sequence != i + 1:
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.SEQUENCE_GAP,
                     message=f"Event at index {i} has sequence {event.sequence}, expected {i + 1}.",
@@ -40,10 +53,10 @@ def validate_chain_integrity(ledger: Ledger) -> ChainValidationResult:
                 )
             )
 
-        # 2. Check prev_hash
+        # Check prev_hash
         if i == 0:
             if event.prev_hash is not None:
-                violations.append(
+                self.violations.append(
                     Violation(
                         code=ViolationCode.CHAIN_BROKEN,
                         message="First event must have null prev_hash.",
@@ -51,9 +64,9 @@ def validate_chain_integrity(ledger: Ledger) -> ChainValidationResult:
                     )
                 )
         else:
-            prev_event = ledger.events[i - 1]
+            prev_event = self.ledger.events[i - 1]
             if event.prev_hash != prev_event.event_hash:
-                violations.append(
+                self.violations.append(
                     Violation(
                         code=ViolationCode.CHAIN_BROKEN,
                         message=f"Event {event.sequence} prev_hash ({event.prev_hash}) does not match previous event hash ({prev_event.event_hash}).",
@@ -65,15 +78,16 @@ def validate_chain_integrity(ledger: Ledger) -> ChainValidationResult:
                     )
                 )
 
-        # 3. Recalculate event_hash
-        # Use model_dump(mode='json') to get ISO format strings for datetimes, matching what json.dump does (mostly)
-        # Note: ledger.py logic is: event_dict = event.model_dump(mode='json'); del event_dict['event_hash']
-        event_dict = event.model_dump(mode="json")
-        stored_hash = event_dict.pop("event_hash")
+        # Recalculate event_hash over every field but event_hash itself
+        # (the bytes kept when the event was loaded or appended)
+        stored_hash = event.event_hash
 
-        calculated_hash = calculate_event_hash(event_dict)
+        # Re-hash with the algorithm the event hash was recorded with
+        calculated_hash = hash_event_bytes(
+            event.canonical_bytes(), recorded_algorithm(stored_hash)
+        )
         if calculated_hash != stored_hash:
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.EVENT_TAMPERED,
                     message=f"Event {event.sequence} hash mismatch.",
@@ -82,65 +96,87 @@ def validate_chain_integrity(ledger: Ledger) -> ChainValidationResult:
                 )
             )
 
-    # 4. Check head_hash matches last event
-    if ledger.head_hash != ledger.events[-1].event_hash:
-        violations.append(
-            Violation(
-                code=ViolationCode.HEAD_MISMATCH,
-                message=f"Ledger head_hash ({ledger.head_hash}) does not match last event hash ({ledger.events[-1].event_hash}).",
-                details={
-                    "expected": ledger.events[-1].event_hash,
-                    "actual": ledger.head_hash,
-                },
+    def result(self) -> ChainValidationResult:
+        ledger = self.ledger
+        if not ledger.events:
+            return ChainValidationResult(valid=True, violations=[], event_count=0)
+
+        violations = list(self.violations)
+        # Check head_hash matches last event
+        if ledger.head_hash != ledger.events[-1].event_hash:
+            violations.append(
+                Violation(
+                    code=ViolationCode.HEAD_MISMATCH,
+                    message=f"Ledger head_hash ({ledger.head_hash}) does not match last event hash ({ledger.events[-1].event_hash}).",
+                    details={
+                        "expected": ledger.events[-1].event_hash,
+                        "actual": ledger.head_hash,
+                    },
+                )
             )
+
+        return ChainValidationResult(
+            valid=len(violations) == 0,
+            violations=violations,
+            event_count=len(ledger.events),
+            resumed_from=ledger.events[self.start].sequence if self.start else None,
         )
 
-    return ChainValidationResult(
-        valid=len(violations) == 0,
-        violations=violations,
-        event_count=len(ledger.events),
-    )
+
+@profiled("chain_check")
+def validate_chain_integrity(
+    ledger: Ledger, checkpoint: Optional[LedgerCheckpoint] = None
+) -> ChainValidationResult:
+    """
+    Validate the hash chain integrity of the ledger.
+
+    With a checkpoint (see LedgerManager.load_checkpoint), the events before
+    it are trusted and only the checkpoint event onwards is re-checked.
+    """
+    check = _ChainCheck(ledger, checkpoint)
+    # Skip the trusted events without visiting them
+    check.index = check.start
+    for event in ledger.events[check.start :]:
+        check.visit(event)
+    return check.result()
 
 
 # --- Signature Verification ---
 
 
-def validate_signatures(
-    ledger: Ledger, identities: IdentityStore
-) -> SignatureValidationResult:
-    """
-    Validate all event signatures in the ledger.
-    """
-    violations: List[Violation] = []
-    verified_count = 0
+class _SignatureCheck:
+    def __init__(self, identities: IdentityStore) -> None:
+        self.identities = identities
+        self.verified_count = 0
+        self.violations: List[Violation] = []
 
-    for event in ledger.events:
+    def visit(self, event: LedgerEvent) -> None:
         if not event.identity:
             # Assuming unsigned events are not allowed in this strict mode
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.IDENTITY_NOT_FOUND,
                     message=f"Event {event.sequence} missing identity information.",
                     event_sequence=event.sequence,
                 )
             )
-            continue
+            return
 
         signer_id = event.identity.signer_id
         public_key_hex = event.identity.public_key
         signature_b64 = event.identity.signature
 
         # Look up identity
-        identity_record = identities.get_by_name(signer_id)
+        identity_record = self.identities.get_by_name(signer_id)
         if not identity_record:
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.IDENTITY_NOT_FOUND,
                     message=f"Identity '{signer_id}' not found in store.",
                     event_sequence=event.sequence,
                 )
             )
-            continue
+            return
 
         # Check Revocation
         is_revoked = False
@@ -149,26 +185,26 @@ def validate_signatures(
                 is_revoked = True
 
         if is_revoked:
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.KEY_REVOKED,
                     message=f"Key for identity '{signer_id}' is revoked.",
                     event_sequence=event.sequence,
                 )
             )
-            continue
+            return
 
         # Check Active Key Match
         # In a real system we might allow old non-revoked keys, but here we strict check against active
         if public_key_hex != identity_record.active_key:
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.KEY_MISMATCH,
                     message=f"Key for identity '{signer_id}' does not match active key.",
                     event_sequence=event.sequence,
                 )
             )
-            continue
+            return
 
         # Reconstruct Canonical Payload
         # Logic derived from geas_ai.commands.seal
@@ -217,10 +253,12 @@ def validate_signatures(
 
             canonical_bytes = canonicalize_json(data_to_sign)
 
-            if verify(public_key_hex, signature_b64, canonical_bytes):
-                verified_count += 1
+            with phase("signature_verify"):
+                signature_valid = verify(public_key_hex, signature_b64, canonical_bytes)
+            if signature_valid:
+                self.verified_count += 1
             else:
-                violations.append(
+                self.violations.append(
                     Violation(
                         code=ViolationCode.INVALID_SIGNATURE,
                         message=f"Signature verification failed for event {event.sequence}.",
@@ -229,7 +267,7 @@ def validate_signatures(
                 )
 
         except Exception as e:
-            violations.append(
+            self.violations.append(
                 Violation(
                     code=ViolationCode.INVALID_SIGNATURE,
                     message=f"Signature verification error: {str(e)}",
@@ -237,90 +275,120 @@ def validate_signatures(
                 )
             )
 
-    return SignatureValidationResult(
-        valid=len(violations) == 0, violations=violations, verified_count=verified_count
-    )
+    def result(self) -> SignatureValidationResult:
+        return SignatureValidationResult(
+            valid=len(self.violations) == 0,
+            violations=list(self.violations),
+            verified_count=self.verified_count,
+        )
+
+
+@profiled("signature_check")
+def validate_signatures(
+    ledger: Ledger, identities: IdentityStore
+) -> SignatureValidationResult:
+    """
+    Validate all event signatures in the ledger.
+    """
+    check = _SignatureCheck(identities)
+    for event in ledger.events:
+        check.visit(event)
+    return check.result()
 
 
 # --- Workflow Compliance ---
 
 
-def validate_workflow_compliance(
-    ledger: Ledger, workflow: WorkflowConfig, identities: IdentityStore
-) -> WorkflowValidationResult:
-    """
-    Validate Bolt against workflow requirements.
-    """
-    violations: List[Violation] = []
-    completed_stages: List[str] = []
-    missing_stages: List[str] = []
+class _WorkflowCheck:
+    def __init__(self, workflow: WorkflowConfig, identities: IdentityStore) -> None:
+        self.workflow = workflow
+        self.identities = identities
+        # Map actions to events (use latest event for each action)
+        self.events_by_action: Dict[str, LedgerEvent] = {}
 
-    # Map actions to events (use latest event for each action)
-    events_by_action: Dict[str, LedgerEvent] = {}
-    for event in ledger.events:
-        events_by_action[event.action.value] = event
+    def visit(self, event: LedgerEvent) -> None:
+        self.events_by_action[event.action.value] = event
 
-    for stage in workflow.stages:
-        # Check existence
-        if stage.action not in events_by_action:
-            missing_stages.append(stage.id)
-            violations.append(
-                Violation(
-                    code=ViolationCode.STAGE_MISSING,
-                    message=f"Required stage '{stage.id}' ({stage.action}) not found in ledger.",
+    def result(self) -> WorkflowValidationResult:
+        violations: List[Violation] = []
+        completed_stages: List[str] = []
+        missing_stages: List[str] = []
+
+        for stage in self.workflow.stages:
+            # Check existence
+            if stage.action not in self.events_by_action:
+                missing_stages.append(stage.id)
+                violations.append(
+                    Violation(
+                        code=ViolationCode.STAGE_MISSING,
+                        message=f"Required stage '{stage.id}' ({stage.action}) not found in ledger.",
+                    )
                 )
-            )
-            continue
+                continue
+
+            event = self.events_by_action[stage.action]
+            completed_stages.append(stage.id)
 
-        event = events_by_action[stage.action]
-        completed_stages.append(stage.id)
+            # Check Role
+            if event.identity:
+                signer = self.identities.get_by_name(event.identity.signer_id)
+                if signer:
+                    if signer.role != stage.required_role:
+                        violations.append(
+                            Violation(
+                                code=ViolationCode.ROLE_VIOLATION,
+                                message=f"Stage '{stage.id}' requires role '{stage.required_role}', signed by '{signer.role.value}' ({signer.name}).",
+                                event_sequence=event.sequence,
+                            )
+                        )
 
-        # Check Role
-        if event.identity:
-            signer = identities.get_by_name(event.identity.signer_id)
-            if signer:
-                if signer.role != stage.required_role:
+            # Check Prerequisite
+            if stage.prerequisite:
+                if stage.prerequisite not in completed_stages:
                     violations.append(
                         Violation(
-                            code=ViolationCode.ROLE_VIOLATION,
-                            message=f"Stage '{stage.id}' requires role '{stage.required_role}', signed by '{signer.role.value}' ({signer.name}).",
+                            code=ViolationCode.PREREQUISITE_MISSING,
+                            message=f"Stage '{stage.id}' completed before prerequisite '{stage.prerequisite}'.",
                             event_sequence=event.sequence,
                         )
                     )
 
-        # Check Prerequisite
-        if stage.prerequisite:
-            if stage.prerequisite not in completed_stages:
-                violations.append(
-                    Violation(
-                        code=ViolationCode.PREREQUISITE_MISSING,
-                        message=f"Stage '{stage.id}' completed before prerequisite '{stage.prerequisite}'.",
-                        event_sequence=event.sequence,
-                    )
-                )
+        return WorkflowValidationResult(
+            valid=len(violations) == 0,
+            violations=violations,
+            completed_stages=completed_stages,
+            missing_stages=missing_stages,
+        )
 
-    return WorkflowValidationResult(
-        valid=len(violations) == 0,
-        violations=violations,
-        completed_stages=completed_stages,
-        missing_stages=missing_stages,
-    )
+
+@profiled("workflow_check")
+def validate_workflow_compliance(
+    ledger: Ledger, workflow: WorkflowConfig, identities: IdentityStore
+) -> WorkflowValidationResult:
+    """
+    Validate Bolt against workflow requirements.
+    """
+    check = _WorkflowCheck(workflow, identities)
+    for event in ledger.events:
+        check.visit(event)
+    return check.result()
 
 
 # --- Content Integrity ---
 
 
-def validate_content_integrity(
-    ledger: Ledger, bolt_path: Path
-) -> ContentValidationResult:
-    """
-    Verify sealed files have not been modified.
-    """
-    violations: List[Violation] = []
-    checked_files = 0
-    modified_files = 0
+class _ContentCheck:
+    def __init__(self, bolt_path: Path, cache: Optional[HashCache] = None) -> None:
+        self.bolt_path = bolt_path
+        self.cache = cache
+        self.checked_files = 0
+        self.modified_files = 0
+        self.violations: List[Violation] = []
+
+    def visit(self, event: LedgerEvent) -> None:
+        bolt_path = self.bolt_path
+        cache = self.cache
 
-    for event in ledger.events:
         # Check SEAL_INTENT (payload.hashes map)
         if event.action == LedgerAction.SEAL_INTENT and "hashes" in event.payload:
             hashes = event.payload["hashes"]
@@ -328,20 +396,22 @@ def validate_content_integrity(
                 for filename, stored_hash in hashes.items():
                     file_path = bolt_path / filename
                     if not file_path.exists():
-                        violations.append(
+                        self.violations.append(
                             Violation(
                                 code=ViolationCode.FILE_MISSING,
                                 message=f"Sealed file '{filename}' (from intent) is missing.",
                                 event_sequence=event.sequence,
                             )
                         )
-                        modified_files += 1
+                        self.modified_files += 1
                         continue
 
-                    current_hash = file_sha256(file_path)
-                    checked_files += 1
+                    current_hash = file_hash(
+                        file_path, recorded_algorithm(stored_hash), cache
+                    )
+                    self.checked_files += 1
                     if current_hash != stored_hash:
-                        violations.append(
+                        self.violations.append(
                             Violation(
                                 code=ViolationCode.FILE_MODIFIED,
                                 message=f"File '{filename}' (from intent) has been modified.",
@@ -352,7 +422,7 @@ def validate_content_integrity(
                                 },
                             )
                         )
-                        modified_files += 1
+                        self.modified_files += 1
 
         # Check Artifacts (SEAL_REQ, etc) -> payload.file + payload.hash
         elif event.action in [
@@ -367,20 +437,22 @@ def validate_content_integrity(
                 file_path = bolt_path / filename
 
                 if not file_path.exists():
-                    violations.append(
+                    self.violations.append(
                         Violation(
                             code=ViolationCode.FILE_MISSING,
                             message=f"Sealed file '{filename}' is missing.",
                             event_sequence=event.sequence,
                         )
                     )
-                    modified_files += 1
-                    continue
+                    self.modified_files += 1
+                    return
 
-                current_hash = file_sha256(file_path)
-                checked_files += 1
+                current_hash = file_hash(
+                    file_path, recorded_algorithm(stored_hash), cache
+                )
+                self.checked_files += 1
                 if current_hash != stored_hash:
-                    violations.append(
+                    self.violations.append(
                         Violation(
                             code=ViolationCode.FILE_MODIFIED,
                             message=f"File '{filename}' has been modified.",
@@ -388,7 +460,7 @@ def validate_content_integrity(
                             details={"expected": stored_hash, "actual": current_hash},
                         )
                     )
-                    modified_files += 1
+                    self.modified_files += 1
 
         # Check SEAL_MRP (payload.files map) if it exists (legacy/future)
         if "files" in event.payload and isinstance(event.payload["files"], dict):
@@ -397,21 +469,23 @@ def validate_content_integrity(
                 file_path = bolt_path / rel_path
 
                 if not file_path.exists():
-                    violations.append(
+                    self.violations.append(
                         Violation(
                             code=ViolationCode.FILE_MISSING,
                             message=f"Sealed file '{rel_path}' is missing.",
                             event_sequence=event.sequence,
                         )
                     )
-                    modified_files += 1
+                    self.modified_files += 1
                     continue
 
-                current_hash = file_sha256(file_path)
-                checked_files += 1
+                current_hash = file_hash(
+                    file_path, recorded_algorithm(stored_hash), cache
+                )
+                self.checked_files += 1
 
                 if current_hash != stored_hash:
-                    violations.append(
+                    self.violations.append(
                         Violation(
                             code=ViolationCode.FILE_MODIFIED,
                             message=f"File '{rel_path}' has been modified.",
@@ -419,11 +493,68 @@ def validate_content_integrity(
                             details={"expected": stored_hash, "actual": current_hash},
                         )
                     )
-                    modified_files += 1
+                    self.modified_files += 1
+
+    def result(self) -> ContentValidationResult:
+        return ContentValidationResult(
+            valid=len(self.violations) == 0,
+            violations=list(self.violations),
+            checked_files=self.checked_files,
+            modified_files=self.modified_files,
+        )
+
+
+@profiled("content_check")
+def validate_content_integrity(
+    ledger: Ledger, bolt_path: Path, cache: Optional[HashCache] = None
+) -> ContentValidationResult:
+    """
+    Verify sealed files have not been modified.
+
+    Each file is re-hashed with the algorithm named in its recorded digest
+    prefix (e.g. "blake2b:"), so older "sha256:" seals stay verifiable.
+    If a HashCache is given, files whose stat data is unchanged since they
+    were last hashed are not re-read.
+    """
+    check = _ContentCheck(bolt_path, cache)
+    for event in ledger.events:
+        check.visit(event)
+    return check.result()
+
 
-    return ContentValidationResult(
-        valid=len(violations) == 0,
-        violations=violations,
-        checked_files=checked_files,
-        modified_files=modified_files,
+# --- Single Pass ---
+
+
+@profiled("ledger_check")
+def verify_ledger(
+    ledger: Ledger,
+    workflow: WorkflowConfig,
+    identities: IdentityStore,
+    bolt_path: Optional[Path] = None,
+    cache: Optional[HashCache] = None,
+    checkpoint: Optional[LedgerCheckpoint] = None,
+) -> LedgerVerificationResult:
+    """
+    Run the chain, signature, workflow and (if bolt_path is given) content
+    checks in a single pass over the ledger events.
+
+    The results are the same as those of the separate validate_* functions.
+    """
+    chain = _ChainCheck(ledger, checkpoint)
+    signatures = _SignatureCheck(identities)
+    flow = _WorkflowCheck(workflow, identities)
+    content = _ContentCheck(bolt_path, cache) if bolt_path is not None else None
+
+    for event in ledger.events:
+        chain.visit(event)
+        signatures.visit(event)
+        flow.visit(event)
+        if content is not None:
+            content.visit(event)
+
+    return LedgerVerificationResult(
+        chain=chain.result(),
+        signatures=signatures.result(),
+        workflow=flow.result(),
+        content=content.result() if content is not None else None,
     )
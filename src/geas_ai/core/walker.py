@@ -1,79 +1,264 @@
+import hashlib
 import os
 import pathspec
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
+from geas_ai.core.cache import GitWalkCache
+from geas_ai.core.gitindex import find_common_dir, find_git_dir, read_git_index
+from geas_ai.core.profiling import profiled
+
+WALKER_BACKENDS = ("fs", "git")
+GITIGNORE_FILE_NAME = ".gitignore"
+
+# Always ignore these
+DEFAULT_IGNORES = [".geas/", "__pycache__/", ".git/", "*.pyc"]
+
+
+class IgnoreRules:
+    """
+    The compiled ignore rules in effect for one directory.
+
+    Git applies a `.gitignore` relative to the directory it lives in, and
+    deeper files take precedence over shallower ones. We rebase every nested
+    pattern onto the project root and append it after its ancestors' patterns,
+    so a single gitwildmatch PathSpec (where the last matching pattern wins)
+    reproduces that precedence and each path is matched with one call.
+
+    A directory without its own `.gitignore` reuses its parent's IgnoreRules
+    object, so only directories that add patterns compile anything.
+    """
+
+    def __init__(self, lines: List[str], key: Tuple[Any, ...]):
+        self.lines = lines
+        self.key = key
+        self.spec = pathspec.PathSpec.from_lines("gitwildmatch", lines)
+        self.digest = hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+    def ignores_dir(self, rel_path: str) -> bool:
+        # Appending "/" lets directory-only patterns (ending with /) match
+        return bool(self.spec.match_file(rel_path + "/"))
+
+    def ignores_file(self, rel_path: str) -> bool:
+        return bool(self.spec.match_file(rel_path))
+
+    def child(self, root_dir: Path, rel_dir: str) -> "IgnoreRules":
+        """Returns the rules for `rel_dir`, adding its .gitignore (cached by stat)."""
+        gitignore = os.path.join(root_dir, rel_dir, GITIGNORE_FILE_NAME)
+        try:
+            st = os.stat(gitignore)
+        except OSError:
+            return self
+
+        key = (self.key, rel_dir, st.st_size, st.st_mtime_ns)
+        cached = _RULES_CACHE.get(key)
+        if cached is None:
+            lines = [_rebase_pattern(line, rel_dir) for line in _read_lines(gitignore)]
+            cached = IgnoreRules(self.lines + [ln for ln in lines if ln], key)
+            _RULES_CACHE[key] = cached
+        return cached
+
+
+# Compiled matchers, reused across walks in the same process
+_RULES_CACHE: Dict[Tuple[Any, ...], IgnoreRules] = {}
+
 
 def load_gitignore_patterns(root_dir: Path) -> pathspec.PathSpec:
     """
-    Loads .gitignore patterns from the root directory if it exists.
+    Loads the root-level ignore patterns: .git/info/exclude and the root .gitignore.
     Always includes default ignore patterns for .geas, __pycache__, and .git.
+
+    Nested .gitignore files are applied per directory by walk_source_files.
     """
-    gitignore_path = root_dir / ".gitignore"
-    patterns = []
+    return _root_rules(root_dir).spec
+
 
-    # Always ignore these
-    default_ignores = [".geas/", "__pycache__/", ".git/", "*.pyc"]
-    patterns.extend(default_ignores)
+def _root_rules(root_dir: Path) -> IgnoreRules:
+    sources: List[str] = []
+    git_dir = find_git_dir(root_dir)
+    if git_dir is not None:
+        # Shared by every worktree of the repository
+        sources.append(os.path.join(find_common_dir(git_dir), "info", "exclude"))
+    sources.append(os.path.join(root_dir, GITIGNORE_FILE_NAME))
 
-    if gitignore_path.exists():
-        with open(gitignore_path, "r") as f:
-            patterns.extend(f.readlines())
+    key: Tuple[Any, ...] = (os.path.abspath(root_dir),)
+    for source in sources:
+        try:
+            st = os.stat(source)
+            key += (source, st.st_size, st.st_mtime_ns)
+        except OSError:
+            continue
 
-    return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    cached = _RULES_CACHE.get(key)
+    if cached is None:
+        patterns = list(DEFAULT_IGNORES)
+        for source in sources:
+            patterns.extend(_read_lines(source))
+        cached = IgnoreRules(patterns, key)
+        _RULES_CACHE[key] = cached
+    return cached
 
 
-def walk_source_files(root_dir: Path, scope_dirs: List[str]) -> List[str]:
+@profiled("walk")
+def walk_source_files(
+    root_dir: Path, scope_dirs: List[str], backend: str = "fs"
+) -> List[str]:
     """
-    Recursively walks the specified scope directories, filtering files based on .gitignore
-    and default ignore patterns.
+    Recursively walks the specified scope directories, filtering files based on
+    .gitignore files (nested ones included), .git/info/exclude and default
+    ignore patterns.
+
+    The walk uses os.scandir and plain string paths. Ignored directories
+    (e.g. node_modules/) are pruned before they are descended into.
 
     Args:
         root_dir: The root directory of the project.
         scope_dirs: List of directory names (relative to root) to include in the walk.
+        backend: "fs" walks the filesystem. "git" additionally uses .git/index
+            to skip ignore matching for tracked files (see _tracked_ignored)
+            and behaves like "fs" when root_dir is not a git checkout. Both
+            return the same list.
 
     Returns:
         List of file paths relative to root_dir.
     """
-    spec = load_gitignore_patterns(root_dir)
-    collected_files = set()
+    if backend not in WALKER_BACKENDS:
+        raise ValueError(
+            f"Unknown walker backend '{backend}'. Use: {', '.join(WALKER_BACKENDS)}"
+        )
+
+    root_rules = _root_rules(root_dir)
 
     # Ensure scope directories exist
     valid_scope_dirs = []
     for d in scope_dirs:
         p = root_dir / d
         if p.exists() and p.is_dir():
-            valid_scope_dirs.append(d)
-        # We silently skip missing directories as per previous discussion ("just raise a warning" handled by caller or implied here)
-        # Actually, the user said "just raise a warning" for missing scope.
-        # I will let the caller handle warnings if needed, here I just walk what exists.
+            valid_scope_dirs.append(Path(d).as_posix())
+        # Missing scope directories are skipped; the caller warns about them.
+
+    index: Optional[Set[str]] = None
+    if backend == "git":
+        git_dir = find_git_dir(root_dir)
+        # Not a git checkout (or unreadable index): plain filesystem walk
+        index = read_git_index(git_dir) if git_dir else None
+
+    collected: List[str] = []
+    tracked_seen: List[Tuple[str, IgnoreRules]] = []
 
     for scope_dir in valid_scope_dirs:
-        # Walk logic
-        base_path = root_dir / scope_dir
-
-        # We walk everything under the scope_dir
-        for root, dirs, files in os.walk(base_path):
-            # Calculate relative path from project root for filtering
-            rel_root = Path(root).relative_to(root_dir)
-
-            # Filter directories to prevent traversing into ignored ones
-            # pathspec.match_file returns True if it matches an ignore pattern
-            # We need to modify 'dirs' in-place to prune the walk
-
-            # Filter dirs
-            # We must check each dir against the spec.
-            # The spec expects paths relative to the root of the gitignore context (project root)
-            dirs[:] = [
-                d
-                for d in dirs
-                if not spec.match_file(str(rel_root / d) + "/")
-                # appending "/" helps pathspec identify it as directory if the pattern ends with /
-            ]
-
-            for file in files:
-                file_rel_path = rel_root / file
-                if not spec.match_file(str(file_rel_path)):
-                    collected_files.add(str(file_rel_path))
-
-    return sorted(list(collected_files))
+        rules = root_rules
+        # Rules from .gitignore files between the root and the scope directory
+        parts = [] if scope_dir == "." else scope_dir.split("/")
+        for depth in range(1, len(parts)):
+            rules = rules.child(root_dir, "/".join(parts[:depth]))
+
+        _scan(root_dir, scope_dir, rules, index, collected, tracked_seen)
+
+    if tracked_seen:
+        ignored = _tracked_ignored(root_dir, tracked_seen)
+        collected.extend(p for p, _ in tracked_seen if p not in ignored)
+
+    return sorted(set(collected))
+
+
+def _scan(
+    root_dir: Path,
+    scope_dir: str,
+    scope_rules: IgnoreRules,
+    index: Optional[Set[str]],
+    collected: List[str],
+    tracked_seen: List[Tuple[str, IgnoreRules]],
+) -> None:
+    """
+    Iterative scandir walk of one scope directory.
+
+    Mirrors os.walk: symlinked directories are listed but not descended into,
+    and unreadable directories are skipped. Files tracked in `index` are not
+    matched here but deferred to `tracked_seen` with the rules in effect.
+    """
+    stack = [(scope_dir, scope_rules)]
+    while stack:
+        rel_dir, parent_rules = stack.pop()
+        try:
+            with os.scandir(os.path.join(root_dir, rel_dir)) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        rules = parent_rules
+        # The root .gitignore is already part of the root rules
+        if rel_dir != "." and any(e.name == GITIGNORE_FILE_NAME for e in entries):
+            rules = parent_rules.child(root_dir, rel_dir)
+
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        for entry in entries:
+            rel_path = prefix + entry.name
+            if entry.is_dir():
+                if not entry.is_symlink() and not rules.ignores_dir(rel_path):
+                    stack.append((rel_path, rules))
+            elif index is not None and rel_path in index:
+                tracked_seen.append((rel_path, rules))
+            elif not rules.ignores_file(rel_path):
+                collected.append(rel_path)
+
+
+def _tracked_ignored(
+    root_dir: Path, tracked_seen: List[Tuple[str, IgnoreRules]]
+) -> Set[str]:
+    """
+    Returns the tracked files matched by the ignore rules in effect for them.
+
+    The answer only depends on the tracked paths and their rules, so it is
+    cached in .geas/cache/gitwalk.json and reused until either changes; a
+    tracked file then costs a set lookup instead of an ignore match.
+    """
+    # Which rules apply to a path is a function of its directory and of the
+    # ignore files on the way there, so the paths plus the set of distinct
+    # rule sets identify the answer
+    key_hash = hashlib.sha256("\0".join(p for p, _ in tracked_seen).encode("utf-8"))
+    for digest in sorted({rules.digest for _, rules in tracked_seen}):
+        key_hash.update(digest.encode("ascii"))
+    key = key_hash.hexdigest()
+
+    geas_dir = root_dir / ".geas"
+    cache = GitWalkCache.load(geas_dir)
+    ignored = cache.lookup(key)
+    if ignored is not None:
+        return ignored
+
+    ignored = {p for p, rules in tracked_seen if rules.ignores_file(p)}
+
+    if geas_dir.is_dir():
+        cache.store(key, ignored)
+        cache.save()
+    return ignored
+
+
+def _read_lines(path: str) -> List[str]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return [line.rstrip("\r\n") for line in f]
+    except OSError:
+        return []
+
+
+def _rebase_pattern(line: str, rel_dir: str) -> str:
+    """
+    Rewrites a pattern from `<rel_dir>/.gitignore` relative to the project root.
+
+    - A pattern with a slash (other than a trailing one) is anchored to its
+      directory: `/build` or `a/b` -> `<rel_dir>/build`, `<rel_dir>/a/b`.
+    - Otherwise it matches at any depth below it: `*.log` -> `<rel_dir>/**/*.log`.
+    Comments and blank lines become empty strings.
+    """
+    if not line.strip() or line.startswith("#"):
+        return ""
+
+    negate = ""
+    if line.startswith("!"):
+        negate, line = "!", line[1:]
+
+    if "/" in line.rstrip("/"):
+        return f"{negate}{rel_dir}/{line.lstrip('/')}"
+    return f"{negate}{rel_dir}/**/{line}"
@@ -2,6 +2,8 @@ from pathlib import Path
 from typing import Optional
 from ruamel.yaml import YAML
 from geas_ai.schemas.workflow import WorkflowConfig, WorkflowStage, IntentConfig
+from geas_ai.core.hashing import validate_algorithm
+from geas_ai.core.profiling import profiled
 
 
 class WorkflowManager:
@@ -59,6 +61,7 @@ class WorkflowManager:
     )
 
     @staticmethod
+    @profiled("yaml_parse")
     def load_workflow(config_path: Optional[Path] = None) -> WorkflowConfig:
         """
         Loads the workflow configuration.
@@ -76,3 +79,12 @@ class WorkflowManager:
                 pass
 
         return WorkflowManager.DEFAULT_WORKFLOW
+
+    @staticmethod
+    def load_hash_algorithm(geas_dir: Path) -> str:
+        """
+        Returns the hash algorithm configured in <geas_dir>/config/workflow.yaml
+        (sha256 if unset). Raises ValueError if it is not in HASH_ALGORITHMS.
+        """
+        config = WorkflowManager.load_workflow(geas_dir / "config" / "workflow.yaml")
+        return validate_algorithm(config.hash_algorithm)
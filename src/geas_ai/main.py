@@ -1,3 +1,8 @@
+import cProfile
+import sys
+from pathlib import Path
+from typing import Optional
+
 import typer
 from geas_ai.commands.init import init
 from geas_ai.commands import seal
@@ -8,6 +13,8 @@ from geas_ai.commands import lifecycle
 from geas_ai.commands import agents
 from geas_ai.commands import identity
 from geas_ai.commands import prove
+from geas_ai.commands import manifest
+from geas_ai.core import profiling
 
 app = typer.Typer(
     name="geas",
@@ -16,6 +23,51 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def profile_options(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        envvar=profiling.PROFILE_ENV,
+        help="Print a per-phase timing breakdown (JSON) to stderr when the command ends",
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        "--profile-output",
+        help="Write the timing breakdown to this file instead of stderr (implies --profile)",
+    ),
+    cprofile: Optional[Path] = typer.Option(
+        None,
+        "--cprofile",
+        help="Also dump cProfile statistics of the main thread to this .prof file",
+    ),
+) -> None:
+    """Governance Enforcement for Agentic Systems (GEAS) - CLI Tool"""
+    if profile or profile_output:
+        profiler = profiling.start()
+
+        def report() -> None:
+            profiling.stop()
+            data = profiler.to_json(ctx.invoked_subcommand)
+            if profile_output:
+                profile_output.write_text(data + "\n", encoding="utf-8")
+            else:
+                sys.stderr.write(data + "\n")
+
+        ctx.call_on_close(report)
+
+    if cprofile:
+        stats = cProfile.Profile()
+
+        def dump() -> None:
+            stats.disable()
+            stats.dump_stats(cprofile)
+
+        ctx.call_on_close(dump)
+        stats.enable()
+
+
 def version() -> None:
     """Show the currently installed GEAS version.
 
@@ -40,6 +92,7 @@ app.command(name="list")(lifecycle.list_bolts)
 app.command(name="agents")(agents.agents)
 app.command(name="version")(version)
 app.add_typer(identity.app, name="identity")
+app.add_typer(manifest.app, name="manifest")
 
 
 def main() -> None:
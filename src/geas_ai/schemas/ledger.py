@@ -1,7 +1,18 @@
 from enum import Enum
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Mapping, Optional, Dict, Any, TypeVar
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    ValidationInfo,
+    model_validator,
+)
+
+from geas_ai.utils.crypto import canonicalize_json
+
+_E = TypeVar("_E", bound="LedgerEvent")
 
 
 class LedgerAction(str, Enum):
@@ -20,6 +31,8 @@ class EventIdentity(BaseModel):
 
 
 class LedgerEvent(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
     sequence: int
     timestamp: datetime
     action: LedgerAction
@@ -28,6 +41,53 @@ class LedgerEvent(BaseModel):
     identity: Optional[EventIdentity] = None
     event_hash: str
 
+    # Bytes the event hash covers, as read from or written to lock.jsonl
+    # (see canonical_bytes)
+    _canonical: Optional[bytes] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _forget_canonical_bytes(self, info: ValidationInfo) -> "LedgerEvent":
+        # Runs on every field assignment (validate_assignment), with the
+        # assigned field's name; also when an event is put in a Ledger, with
+        # the Ledger's field name, where the kept bytes are still valid
+        if info.field_name in LedgerEvent.model_fields:
+            self._canonical = None
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        # The kept bytes are a cache, not part of the event
+        if isinstance(other, LedgerEvent):
+            return self.__dict__ == other.__dict__
+        return NotImplemented
+
+    def model_copy(
+        self: _E, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> _E:
+        # `update` bypasses validation, so the kept bytes would go stale
+        copied = super().model_copy(update=update, deep=deep)
+        copied._canonical = None
+        return copied
+
+    def canonical_bytes(self) -> bytes:
+        """
+        Returns the bytes the event hash covers: the canonical JSON of every
+        field but event_hash.
+
+        Events read from or written to lock.jsonl keep the bytes of their
+        line, so they are not serialized again. Assigning a field drops
+        them; edit a kept event's payload or identity through assignment or
+        model_copy(update=...), not in place.
+        """
+        if self._canonical is not None:
+            return self._canonical
+        event_dict = self.model_dump(mode="json")
+        event_dict.pop("event_hash", None)
+        return canonicalize_json(event_dict)
+
+    def keep_canonical_bytes(self, data: bytes) -> None:
+        """Keeps `data` (the event's bytes in lock.jsonl) as canonical_bytes()."""
+        self._canonical = data
+
 
 class Ledger(BaseModel):
     version: str = "3.1"
@@ -39,6 +39,8 @@ class ValidationResult(BaseModel):
 
 class ChainValidationResult(ValidationResult):
     event_count: int
+    # Sequence of the verified checkpoint the check resumed from (None: full check)
+    resumed_from: Optional[int] = None
 
 
 class SignatureValidationResult(ValidationResult):
@@ -53,3 +55,20 @@ class WorkflowValidationResult(ValidationResult):
 class ContentValidationResult(ValidationResult):
     checked_files: int
     modified_files: int
+
+
+class LedgerVerificationResult(BaseModel):
+    """Results of all checks from a single pass over the ledger."""
+
+    chain: ChainValidationResult
+    signatures: SignatureValidationResult
+    workflow: WorkflowValidationResult
+    # None when content was not checked
+    content: Optional[ContentValidationResult] = None
+
+    @property
+    def valid(self) -> bool:
+        results: List[ValidationResult] = [self.chain, self.signatures, self.workflow]
+        if self.content is not None:
+            results.append(self.content)
+        return all(result.valid for result in results)
@@ -22,3 +22,5 @@ class WorkflowConfig(BaseModel):
     stages: List[WorkflowStage]
     test_command: str = "pytest"
     test_timeout: int = 300
+    # hashlib algorithm for new seals, event hashes and proof manifests
+    hash_algorithm: str = "sha256"
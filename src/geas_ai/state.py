@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Dict, Optional, Any, cast
 from rich.console import Console
 from geas_ai import utils
+from geas_ai.core.profiling import profiled
 
 console = Console()
 
@@ -32,6 +33,7 @@ class StateManager:
                 }
             )
 
+    @profiled("state_load")
     def _load_state(self) -> Dict[str, Any]:
         """Loads state from JSON file."""
         try:
@@ -40,6 +42,7 @@ class StateManager:
         except (FileNotFoundError, json.JSONDecodeError):
             return {"version": "1.0", "active_bolt": None, "bolts": {}}
 
+    @profiled("state_save")
     def _save_state(self, state: Dict[str, Any]) -> None:
         """Saves state to JSON file."""
         state["last_updated"] = datetime.utcnow().isoformat()
@@ -36,3 +36,14 @@ def test_init_creates_workflow(tmp_path):
 
     assert stages["approve"]["action"] == "APPROVE"
     assert stages["approve"]["required_role"] == "human"
+
+
+def test_init_ignores_cache(tmp_path):
+    """The committed .geas/ tree keeps its machine-local cache out of git."""
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["init"])
+    assert result.exit_code == 0
+
+    gitignore = tmp_path / ".geas" / ".gitignore"
+    assert "cache/" in gitignore.read_text().splitlines()
@@ -0,0 +1,102 @@
+import json
+import hashlib
+from datetime import datetime, timezone
+from typer.testing import CliRunner
+
+from geas_ai.main import app
+from geas_ai.core.manifest import TestResultInfo, generate_manifest
+from geas_ai.core.merkle import MerkleTree
+
+runner = CliRunner()
+
+
+def _write_manifest(mrp_dir, files, with_tree=True):
+    mrp_dir.mkdir(parents=True, exist_ok=True)
+    result = TestResultInfo(
+        passed=True,
+        exit_code=0,
+        duration_seconds=0.1,
+        timestamp=datetime.now(timezone.utc),
+    )
+    manifest = generate_manifest("bolt", ["src"], files, result)
+    (mrp_dir / "manifest.json").write_text(manifest.model_dump_json(indent=2))
+    if with_tree:
+        MerkleTree.build([files[p] for p in sorted(files)]).save(mrp_dir / "merkle.bin")
+
+
+def _h(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def test_manifest_diff_between_bolts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    bolts = tmp_path / ".geas" / "bolts"
+    _write_manifest(bolts / "one" / "mrp", {"a.py": _h("a"), "b.py": _h("b")})
+    _write_manifest(bolts / "two" / "mrp", {"b.py": _h("b2"), "c.py": _h("c")})
+
+    result = runner.invoke(app, ["manifest", "diff", "one", "two"])
+
+    assert result.exit_code == 0
+    assert "D  a.py" in result.stdout
+    assert "M  b.py" in result.stdout
+    assert "A  c.py" in result.stdout
+    assert "1 added, 1 removed, 1 modified" in result.stdout
+
+
+def test_manifest_diff_json_lines(tmp_path):
+    files = {f"f{i}.py": _h(str(i)) for i in range(10)}
+    changed = dict(files, **{"f3.py": _h("changed")})
+    _write_manifest(tmp_path / "a", files)
+    _write_manifest(tmp_path / "b", changed)
+
+    result = runner.invoke(
+        app,
+        [
+            "manifest",
+            "diff",
+            str(tmp_path / "a" / "manifest.json"),
+            str(tmp_path / "b"),
+            "--json",
+        ],
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines == [
+        {
+            "change": "modified",
+            "path": "f3.py",
+            "old_hash": files["f3.py"],
+            "new_hash": changed["f3.py"],
+        }
+    ]
+
+
+def test_manifest_diff_missing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["manifest", "diff", "nope", "other"])
+    assert result.exit_code == 1
+    assert "Manifest not found" in result.stdout
+
+
+def test_manifest_convert_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    files = {f"src/f{i}.py": _h(str(i)) for i in range(100)}
+    _write_manifest(tmp_path / ".geas" / "bolts" / "one" / "mrp", files)
+
+    result = runner.invoke(app, ["manifest", "convert", "one", "manifest.bin"])
+    assert result.exit_code == 0
+    assert (tmp_path / "manifest.bin").read_bytes().startswith(b"GEASMAN1")
+
+    result = runner.invoke(
+        app, ["manifest", "convert", "manifest.bin", "back.out", "--to", "json"]
+    )
+    assert result.exit_code == 0
+    original = json.loads(
+        (tmp_path / ".geas" / "bolts" / "one" / "mrp" / "manifest.json").read_text()
+    )
+    assert json.loads((tmp_path / "back.out").read_text()) == original
+
+    result = runner.invoke(app, ["manifest", "diff", "one", "manifest.bin"])
+    assert result.exit_code == 0
+    assert "0 added, 0 removed, 0 modified" in result.stdout
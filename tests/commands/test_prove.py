@@ -1,7 +1,12 @@
+import hashlib
+import json
+import sys
+import threading
 from typer.testing import CliRunner
 from unittest.mock import patch
 from geas_ai.main import app
-from geas_ai.core.manifest import TestResultInfo
+from geas_ai.core.manifest import TestResultInfo, calculate_merkle_root
+from geas_ai.core.merkle import MerkleTree
 from datetime import datetime, timezone
 
 runner = CliRunner()
@@ -140,4 +145,432 @@ def test_prove_command_skip_tests(tmp_path):
 
     assert result.exit_code == 0
     assert "Skipping tests" in result.stdout
+    manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+    assert manifest["test_result"]["skipped"] is True
+    assert manifest["test_result"]["passed"] is True
+
+
+def test_prove_command_jobs_same_root(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(10):
+        (src_dir / f"mod_{i}.py").write_text(f"x = {i}")
+
+    roots = []
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            for jobs in ("1", "4"):
+                result = runner.invoke(
+                    app, ["prove", "--scope", "src", "--skip-tests", "--jobs", jobs]
+                )
+                assert result.exit_code == 0
+                manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+                roots.append((list(manifest["files"]), manifest["root_hash"]))
+
+    assert roots[0] == roots[1]
+
+
+def test_prove_command_incremental_tree(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(9):
+        (src_dir / f"mod_{i}.py").write_text(f"x = {i}")
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(app, ["prove", "--scope", "src", "--skip-tests"])
+            assert result.exit_code == 0
+            assert (bolt_dir / "mrp" / "merkle.bin").exists()
+
+            (src_dir / "mod_4.py").write_text("x = 'changed'")
+            result = runner.invoke(app, ["prove", "--scope", "src", "--skip-tests"])
+            assert result.exit_code == 0
+
+    manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+    assert manifest["root_hash"] == calculate_merkle_root(manifest["files"])
+    assert (
+        MerkleTree.load(bolt_dir / "mrp" / "merkle.bin").root == manifest["root_hash"]
+    )
+
+
+def test_prove_inclusion_proof_and_verify_file(tmp_path, monkeypatch):
+    setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(5):
+        (src_dir / f"mod_{i}.py").write_text(f"x = {i}")
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(app, ["prove", "--scope", "src", "--skip-tests"])
+            assert result.exit_code == 0
+
+            result = runner.invoke(app, ["prove", "--inclusion-proof", "src/mod_3.py"])
+            assert result.exit_code == 0
+            proof = json.loads(result.stdout)
+            assert proof["path"] == "src/mod_3.py"
+            assert proof["leaf_index"] == 3
+            assert len(proof["audit_path"]) == 3
+
+            result = runner.invoke(app, ["prove", "--inclusion-proof", "src/nope.py"])
+            assert result.exit_code == 1
+
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        app, ["verify", "--bolt", "test-bolt", "--file", "./src/mod_3.py", "--json"]
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["valid"] is True
+
+    (src_dir / "mod_3.py").write_text("x = 'tampered'")
+    result = runner.invoke(
+        app, ["verify", "--bolt", "test-bolt", "--file", "src/mod_3.py"]
+    )
+    assert result.exit_code == 1
+    assert "modified" in result.stdout
+
+    # From a subdirectory the path is still resolved against the project root
+    monkeypatch.chdir(src_dir)
+    with (
+        patch("geas_ai.commands.verify.utils.ensure_geas_root", return_value=tmp_path),
+        patch(
+            "geas_ai.commands.verify.utils.get_geas_root",
+            return_value=tmp_path / ".geas",
+        ),
+    ):
+        result = runner.invoke(
+            app, ["verify", "--bolt", "test-bolt", "--file", "src/mod_2.py", "--json"]
+        )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["valid"] is True
+
+
+def test_prove_command_invalid_walker(tmp_path):
+    setup_bolt(tmp_path)
+    (tmp_path / "src").mkdir()
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(
+                app, ["prove", "--scope", "src", "--skip-tests", "--walker", "svn"]
+            )
+
+    assert result.exit_code == 1
+    assert "Invalid walker" in result.stdout
+
+
+def test_prove_command_binary_manifest(tmp_path, monkeypatch):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(5):
+        (src_dir / f"mod_{i}.py").write_text(f"x = {i}")
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(app, ["prove", "--scope", "src", "--skip-tests"])
+            assert result.exit_code == 0
+
+            result = runner.invoke(
+                app,
+                [
+                    "prove",
+                    "--scope",
+                    "src",
+                    "--skip-tests",
+                    "--manifest-format",
+                    "binary",
+                ],
+            )
+            assert result.exit_code == 0
+
+            result = runner.invoke(app, ["prove", "--inclusion-proof", "src/mod_2.py"])
+            assert result.exit_code == 0
+            assert json.loads(result.stdout)["leaf_index"] == 2
+
+    mrp_dir = bolt_dir / "mrp"
+    assert (mrp_dir / "manifest.bin").exists()
+    assert not (mrp_dir / "manifest.json").exists()
+
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        app, ["verify", "--bolt", "test-bolt", "--file", "src/mod_2.py", "--json"]
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["valid"] is True
+
+
+def test_prove_command_hash_algorithm(tmp_path, monkeypatch):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for i in range(5):
+        (src_dir / f"mod_{i}.py").write_text(f"x = {i}")
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(app, ["prove", "--scope", "src", "--skip-tests"])
+            assert result.exit_code == 0
+
+            args = ["prove", "--scope", "src", "--skip-tests"]
+            result = runner.invoke(app, args + ["--hash-algorithm", "blake2b"])
+            assert result.exit_code == 0
+
+            result = runner.invoke(app, args + ["--hash-algorithm", "md5"])
+            assert result.exit_code == 1
+            assert "Invalid hash algorithm" in result.stdout
+
+    manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+    assert manifest["algorithm"] == "blake2b"
+    assert len(manifest["files"]["src/mod_1.py"]) == 128
+    assert manifest["root_hash"] == calculate_merkle_root(manifest["files"], "blake2b")
+
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        app, ["verify", "--bolt", "test-bolt", "--file", "src/mod_1.py", "--json"]
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["valid"] is True
+
+
+def test_prove_command_tests_run_concurrently(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("print('hello')")
+
+    hashing_started = threading.Event()
+
+    def slow_tests(command, timeout, **kwargs):
+        # Only finishes once hashing is under way, i.e. both run at once
+        overlapped = hashing_started.wait(timeout=10)
+        return TestResultInfo(
+            passed=overlapped,
+            exit_code=0 if overlapped else 1,
+            duration_seconds=0.1,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    from geas_ai.commands import prove as prove_module
+
+    real_hash_files = prove_module.hash_files
+
+    def tracking_hash_files(*args, **kwargs):
+        hashing_started.set()
+        return real_hash_files(*args, **kwargs)
+
+    with patch("geas_ai.commands.prove.run_tests", side_effect=slow_tests):
+        with patch(
+            "geas_ai.commands.prove.hash_files", side_effect=tracking_hash_files
+        ):
+            with patch(
+                "geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path
+            ):
+                with patch(
+                    "geas_ai.commands.prove.get_active_bolt_name",
+                    return_value="test-bolt",
+                ):
+                    result = runner.invoke(app, ["prove", "--scope", "src"])
+
+    assert result.exit_code == 0
+    assert "Tests Passed" in result.stdout
     assert (bolt_dir / "mrp" / "manifest.json").exists()
+
+
+def test_prove_command_streams_test_log(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("print('hello')")
+
+    command = f"{sys.executable} -c \"print('streamed output')\""
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(
+                app, ["prove", "--scope", "src", "--command", command]
+            )
+
+    assert result.exit_code == 0
+    assert "Resources:" in result.stdout
+    log = (bolt_dir / "mrp" / "tests.log").read_bytes()
+    assert b"streamed output" in log
+
+    manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+    assert "output" not in manifest["test_result"]
+    assert manifest["test_result"]["log_size"] == len(log)
+    assert manifest["test_result"]["resources"]["user_cpu_seconds"] > 0
+    assert (
+        manifest["test_result"]["log_hash"]
+        == f"sha256:{hashlib.sha256(log).hexdigest()}"
+    )
+
+
+def test_prove_command_reuses_cached_test_result(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("print('hello')")
+
+    counter = tmp_path / "runs.txt"
+    command = f"{sys.executable} -c \"open('{counter.as_posix()}', 'a').write('x')\""
+    args = ["prove", "--scope", "src", "--command", command]
+
+    def manifest():
+        return json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            assert runner.invoke(app, args).exit_code == 0
+            assert manifest()["test_result"]["reused"] is False
+
+            # Same root, command and scope: the cached pass is reused
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert "Tests were NOT run" in result.stdout
+            assert manifest()["test_result"]["reused"] is True
+            assert "Reused" in (bolt_dir / "mrp" / "tests.log").read_text()
+
+            result = runner.invoke(app, args + ["--force-tests"])
+            assert result.exit_code == 0
+            assert manifest()["test_result"]["reused"] is False
+
+            # A changed root misses the cache
+            (src_dir / "main.py").write_text("print('changed')")
+            assert runner.invoke(app, args).exit_code == 0
+            assert manifest()["test_result"]["reused"] is False
+
+    # The reused run may have started speculatively, but the first, forced
+    # and changed-root runs always complete
+    assert counter.read_text().count("x") >= 3
+
+
+def test_prove_command_test_shards(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("print('hello')")
+
+    command = f"{sys.executable} -c \"import os; print('ran', os.environ['GEAS_TEST_SHARD_INDEX'])\""
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(
+                app,
+                ["prove", "--scope", "src", "--command", command, "--test-shards", "2"],
+            )
+
+    assert result.exit_code == 0
+    log = (bolt_dir / "mrp" / "tests.log").read_text()
+    assert "ran 0" in log and "ran 1" in log
+
+    manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+    assert [s["index"] for s in manifest["test_result"]["shards"]] == [0, 1]
+
+
+def test_prove_command_impact_selection(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "src" / "lib.py").write_text("VALUE = 1\n")
+    (tmp_path / "src" / "other.py").write_text("OTHER = 1\n")
+    (tmp_path / "tests" / "test_lib.py").write_text("import lib\n")
+    (tmp_path / "tests" / "test_other.py").write_text("import other\n")
+
+    args_file = tmp_path / "args.txt"
+    command = f"{sys.executable} -c \"import sys; open('{args_file.as_posix()}', 'w').write(' '.join(sys.argv[1:]))\""
+    args = ["prove", "--command", command, "--impact"]
+
+    def selection():
+        manifest = json.loads((bolt_dir / "mrp" / "manifest.json").read_text())
+        return manifest["test_result"]["selection"]
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            # No previous proof: full run
+            assert runner.invoke(app, args).exit_code == 0
+            assert selection()["mode"] == "full"
+            assert args_file.read_text() == ""
+
+            (tmp_path / "src" / "lib.py").write_text("VALUE = 2\n")
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert "Impact analysis: impact run" in result.stdout
+            assert selection()["tests"] == {"tests/test_lib.py": ["src/lib.py"]}
+            assert args_file.read_text() == "tests/test_lib.py"
+
+            # The selected subset is not reused as a full run of this root
+            result = runner.invoke(app, args[:-1])
+            assert result.exit_code == 0
+            assert "Tests were NOT run" not in result.stdout
+            assert args_file.read_text() == ""
+
+
+def test_prove_command_timings(tmp_path):
+    bolt_dir = setup_bolt(tmp_path)
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.py").write_text("print('hello')")
+
+    duration = tmp_path / "duration.txt"
+    duration.write_text("0.5")
+    writer = tmp_path / "write_junit.py"
+    writer.write_text(
+        "import sys\n"
+        f"seconds = open({str(duration)!r}).read()\n"
+        "open(sys.argv[1], 'w').write(\n"
+        '    f\'<testsuite><testcase classname="t" name="test_a" time="{seconds}"/></testsuite>\'\n'
+        ")\n"
+    )
+    args = [
+        "prove",
+        "--scope",
+        "src",
+        "--command",
+        f"{sys.executable} {writer} {{junit_xml}}",
+        "--timings",
+        "--force-tests",
+    ]
+    timings_path = bolt_dir / "mrp" / "tests.timings.json"
+
+    with patch("geas_ai.commands.prove.ensure_geas_root", return_value=tmp_path):
+        with patch(
+            "geas_ai.commands.prove.get_active_bolt_name", return_value="test-bolt"
+        ):
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert "Slowest of 1 tests" in result.stdout
+            assert json.loads(timings_path.read_text())["tests"] == {
+                "t::test_a": ["passed", 0.5]
+            }
+
+            duration.write_text("2.0")
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert "slower than in the previous proof" in result.stdout
+            assert "0.50s -> 2.00s" in result.stdout
+
+            # Without a report, no stale sidecar is left behind
+            result = runner.invoke(app, args[:-2] + ["--skip-tests"])
+            assert result.exit_code == 0
+            assert not timings_path.exists()
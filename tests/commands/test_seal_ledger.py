@@ -1,8 +1,10 @@
+import json
 import os
 import pytest
 from typer.testing import CliRunner
 from geas_ai.main import app
 from geas_ai.core import ledger
+from geas_ai.core.cache import CheckpointCache
 from geas_ai.schemas.ledger import LedgerAction
 
 runner = CliRunner()
@@ -24,8 +26,8 @@ def test_seal_flow_new_ledger(setup_geas):
     assert result.exit_code == 0
     bolt_path = setup_geas / ".geas/bolts/test-bolt"
 
-    # Check lock.json initialized
-    lock_file = bolt_path / "lock.json"
+    # Check lock.jsonl initialized
+    lock_file = bolt_path / "lock.jsonl"
     assert lock_file.exists()
 
     # 2. Seal Req
@@ -63,3 +65,124 @@ def test_seal_intent_no_identity(setup_geas):
     result = runner.invoke(app, ["seal", "intent"])
     assert result.exit_code == 1
     assert "--identity is required" in result.stdout
+
+
+def test_seal_uses_configured_hash_algorithm(setup_geas):
+    workflow_path = setup_geas / ".geas/config/workflow.yaml"
+    workflow_path.write_text(
+        workflow_path.read_text().replace(
+            "hash_algorithm: sha256", "hash_algorithm: blake2b"
+        )
+    )
+    runner.invoke(app, ["new", "test-bolt"])
+    bolt_path = setup_geas / ".geas/bolts/test-bolt"
+
+    result = runner.invoke(app, ["seal", "req"])
+    assert result.exit_code == 0
+
+    l = ledger.LedgerManager.load_lock(bolt_path)  # noqa: E741
+    assert l.events[0].payload["hash"].startswith("blake2b:")
+    assert l.events[0].event_hash.startswith("blake2b:")
+    assert ledger.LedgerManager.verify_chain_integrity(l)
+
+    result = runner.invoke(
+        app, ["verify", "--bolt", "test-bolt", "--content", "--json"]
+    )
+    report = json.loads(result.stdout)
+    assert report["chain"]["valid"]
+    assert report["content"]["valid"]
+    assert report["content"]["checked_files"] == 1
+
+
+def test_seal_rejects_unknown_hash_algorithm(setup_geas):
+    workflow_path = setup_geas / ".geas/config/workflow.yaml"
+    workflow_path.write_text(
+        workflow_path.read_text().replace(
+            "hash_algorithm: sha256", "hash_algorithm: md5"
+        )
+    )
+    runner.invoke(app, ["new", "test-bolt"])
+
+    result = runner.invoke(app, ["seal", "req"])
+    assert result.exit_code == 1
+    assert "Unsupported hash algorithm" in result.stdout
+
+
+def test_seal_profile_reports_phases(setup_geas):
+    runner.invoke(app, ["new", "test-bolt"])
+    profile_path = setup_geas / "profile.json"
+
+    result = runner.invoke(app, ["--profile-output", str(profile_path), "seal", "req"])
+    assert result.exit_code == 0
+
+    report = json.loads(profile_path.read_text())
+    assert report["command"] == "seal"
+    for phase in ("state_load", "ledger_load", "hashing", "ledger_save"):
+        assert report["phases"][phase]["calls"] >= 1
+        assert report["phases"][phase]["seconds"] >= 0
+
+
+def test_profile_env_var_writes_to_stderr(setup_geas):
+    result = runner.invoke(app, ["list"], env={"GEAS_PROFILE": "1"})
+    assert result.exit_code == 0
+    report = json.loads(result.stderr)
+    assert report["command"] == "list"
+    assert report["phases"]["state_load"]["calls"] >= 1
+
+
+def test_seal_records_checkpoint_and_full_recheck(setup_geas):
+    runner.invoke(app, ["new", "test-bolt"])
+    bolt_path = setup_geas / ".geas/bolts/test-bolt"
+    assert runner.invoke(app, ["seal", "req"]).exit_code == 0
+
+    cache = CheckpointCache.load(setup_geas / ".geas")
+    checkpoint = ledger.LedgerManager.load_checkpoint(bolt_path, cache)
+    assert checkpoint.sequence == 1
+
+    # Tamper with the checkpointed event without changing its line length
+    lock_path = bolt_path / "lock.jsonl"
+    lock_path.write_bytes(lock_path.read_bytes().replace(b"SEAL_REQ", b"SEAL_MRP"))
+
+    result = runner.invoke(app, ["seal", "specs"])
+    assert "chain is broken" in result.stdout
+    result = runner.invoke(app, ["verify", "--full"])
+    assert result.exit_code == 1
+
+
+def test_verify_checks_full_chain_by_default(setup_geas):
+    runner.invoke(app, ["new", "test-bolt"])
+    bolt_path = setup_geas / ".geas/bolts/test-bolt"
+    (bolt_path / "02_specs.md").write_text("specs content")
+    assert runner.invoke(app, ["seal", "req"]).exit_code == 0
+    assert runner.invoke(app, ["seal", "specs"]).exit_code == 0
+
+    # Rewrite an event before the checkpoint (same line length)
+    lock_path = bolt_path / "lock.jsonl"
+    lock_path.write_bytes(
+        lock_path.read_bytes().replace(b'"SEAL_REQ"', b'"SEAL_MRP"', 1)
+    )
+
+    resumed = json.loads(runner.invoke(app, ["verify", "--resume", "--json"]).stdout)
+    assert resumed["chain"]["valid"] is True
+    assert resumed["chain"]["resumed_from"] == 2
+
+    result = runner.invoke(app, ["verify", "--json"])
+    assert result.exit_code == 1
+    assert json.loads(result.stdout)["chain"]["valid"] is False
+
+
+def test_status_last_events(setup_geas):
+    runner.invoke(app, ["new", "test-bolt"])
+    bolt_path = setup_geas / ".geas/bolts/test-bolt"
+    (bolt_path / "02_specs.md").write_text("specs content")
+    runner.invoke(app, ["seal", "req"])
+    runner.invoke(app, ["seal", "specs"])
+
+    result = runner.invoke(app, ["status"])
+    assert "SEAL_REQ" in result.stdout
+    assert "Current State: SEAL_SPECS" in result.stdout
+
+    result = runner.invoke(app, ["status", "--last", "1"])
+    assert result.exit_code == 0
+    assert "SEAL_REQ" not in result.stdout
+    assert "SEAL_SPECS" in result.stdout
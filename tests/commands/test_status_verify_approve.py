@@ -1,13 +1,16 @@
+import json
 from typer.testing import CliRunner
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 from geas_ai.main import app
+from geas_ai.core.ledger import LazyLedger
 from geas_ai.schemas.ledger import Ledger, LedgerEvent, LedgerAction, EventIdentity
 from geas_ai.schemas.verification import (
     ChainValidationResult,
     SignatureValidationResult,
     WorkflowValidationResult,
     ContentValidationResult,
+    LedgerVerificationResult,
 )
 from geas_ai.schemas.identity import Identity, IdentityRole
 from datetime import datetime, timezone
@@ -25,7 +28,7 @@ def test_status_no_bolt(mock_utils, mock_bolt_path, mock_ledger_manager):
     mock_utils.return_value = Path("/mock/root")
     mock_bolt_path.return_value = Path("/mock/root/bolts/test-bolt")
 
-    mock_ledger_manager.load_lock.return_value = None
+    mock_ledger_manager.open_lock.return_value = None
 
     result = runner.invoke(app, ["status"])
     assert result.exit_code == 0
@@ -50,7 +53,9 @@ def test_status_with_events(mock_utils, mock_bolt_path, mock_ledger_manager):
     ledger = Ledger(
         bolt_id="test-bolt", created_at=datetime.now(timezone.utc), events=[event]
     )
-    mock_ledger_manager.load_lock.return_value = ledger
+    mock_ledger_manager.open_lock.return_value = LazyLedger.from_ledger(
+        mock_bolt_path.return_value, ledger
+    )
 
     result = runner.invoke(app, ["status"])
     assert result.exit_code == 0
@@ -80,19 +85,17 @@ def test_verify_success(
     mock_ledger_manager.load_lock.return_value = ledger
 
     # Mock Verification Results (All Valid)
-    mock_verification.validate_chain_integrity.return_value = ChainValidationResult(
-        valid=True, violations=[], event_count=1
-    )
-    mock_verification.validate_signatures.return_value = SignatureValidationResult(
-        valid=True, violations=[], verified_count=1
-    )
-    mock_verification.validate_workflow_compliance.return_value = (
-        WorkflowValidationResult(
+    mock_verification.verify_ledger.return_value = LedgerVerificationResult(
+        chain=ChainValidationResult(valid=True, violations=[], event_count=1),
+        signatures=SignatureValidationResult(
+            valid=True, violations=[], verified_count=1
+        ),
+        workflow=WorkflowValidationResult(
             valid=True, violations=[], completed_stages=["req"], missing_stages=[]
-        )
-    )
-    mock_verification.validate_content_integrity.return_value = ContentValidationResult(
-        valid=True, violations=[], checked_files=0, modified_files=0
+        ),
+        content=ContentValidationResult(
+            valid=True, violations=[], checked_files=0, modified_files=0
+        ),
     )
 
     result = runner.invoke(app, ["verify"])
@@ -120,18 +123,18 @@ def test_verify_fail(
 
     from geas_ai.schemas.verification import Violation, ViolationCode
 
-    mock_verification.validate_chain_integrity.return_value = ChainValidationResult(
-        valid=False,
-        violations=[Violation(code=ViolationCode.CHAIN_BROKEN, message="Broken")],
-        event_count=1,
-    )
-    mock_verification.validate_signatures.return_value = SignatureValidationResult(
-        valid=True, violations=[], verified_count=1
-    )
-    mock_verification.validate_workflow_compliance.return_value = (
-        WorkflowValidationResult(
+    mock_verification.verify_ledger.return_value = LedgerVerificationResult(
+        chain=ChainValidationResult(
+            valid=False,
+            violations=[Violation(code=ViolationCode.CHAIN_BROKEN, message="Broken")],
+            event_count=1,
+        ),
+        signatures=SignatureValidationResult(
+            valid=True, violations=[], verified_count=1
+        ),
+        workflow=WorkflowValidationResult(
             valid=True, violations=[], completed_stages=[], missing_stages=[]
-        )
+        ),
     )
 
     result = runner.invoke(app, ["verify"])
@@ -158,21 +161,29 @@ def test_verify_json(
     ledger = MagicMock(spec=Ledger)
     mock_ledger_manager.load_lock.return_value = ledger
 
-    mock_verification.validate_chain_integrity.return_value = ChainValidationResult(
-        valid=True, violations=[], event_count=1
-    )
-    mock_verification.validate_signatures.return_value = SignatureValidationResult(
-        valid=True, violations=[], verified_count=1
-    )
-    mock_verification.validate_workflow_compliance.return_value = (
-        WorkflowValidationResult(
+    mock_verification.verify_ledger.return_value = LedgerVerificationResult(
+        chain=ChainValidationResult(valid=True, violations=[], event_count=1),
+        signatures=SignatureValidationResult(
+            valid=True, violations=[], verified_count=1
+        ),
+        workflow=WorkflowValidationResult(
             valid=True, violations=[], completed_stages=[], missing_stages=[]
-        )
+        ),
     )
 
     result = runner.invoke(app, ["verify", "--json"])
     assert result.exit_code == 0
     assert '"valid": true' in result.stdout
+    # A full check keeps the chain keys it always had
+    assert set(json.loads(result.stdout)["chain"]) == {
+        "valid",
+        "violations",
+        "event_count",
+    }
+
+    mock_verification.verify_ledger.return_value.chain.resumed_from = 3
+    result = runner.invoke(app, ["verify", "--json"])
+    assert json.loads(result.stdout)["chain"]["resumed_from"] == 3
 
 
 # --- Approve Tests ---
@@ -207,7 +218,9 @@ def test_approve_success(
     ledger = Ledger(
         bolt_id="test", created_at=datetime.now(timezone.utc), events=[event]
     )
-    mock_ledger_manager.load_lock.return_value = ledger
+    mock_ledger_manager.open_lock.return_value = LazyLedger.from_ledger(
+        mock_bolt_path.return_value, ledger
+    )
 
     # Mock Identity
     mock_store = MagicMock()
@@ -235,7 +248,9 @@ def test_approve_fail_no_mrp(mock_utils, mock_bolt_path, mock_ledger_manager):
     mock_bolt_path.return_value = Path("/mock/root/bolts/test-bolt")
 
     ledger = Ledger(bolt_id="test", created_at=datetime.now(timezone.utc), events=[])
-    mock_ledger_manager.load_lock.return_value = ledger
+    mock_ledger_manager.open_lock.return_value = LazyLedger.from_ledger(
+        mock_bolt_path.return_value, ledger
+    )
 
     result = runner.invoke(app, ["approve", "--identity", "human"])
     assert result.exit_code == 1
@@ -263,7 +278,9 @@ def test_approve_fail_wrong_role(
     ledger = Ledger(
         bolt_id="test", created_at=datetime.now(timezone.utc), events=[event]
     )
-    mock_ledger_manager.load_lock.return_value = ledger
+    mock_ledger_manager.open_lock.return_value = LazyLedger.from_ledger(
+        mock_bolt_path.return_value, ledger
+    )
 
     mock_store = MagicMock()
     mock_store.get_by_name.return_value = Identity(
@@ -9,7 +9,7 @@ def test_bolt_creation(setup_geas_environment):
 
     assert bolt.name == "feature-x"
     assert bolt.path.exists()
-    assert (bolt.path / "lock.json").exists()
+    assert (bolt.path / "lock.jsonl").exists()
 
     # Check state
     manager = StateManager()
@@ -0,0 +1,178 @@
+import os
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from geas_ai.core import cache as cache_module
+from geas_ai.core.cache import HashCache, TestResultCache
+from geas_ai.core.manifest import TestResultInfo
+from geas_ai.core.hashing import file_sha256, hash_files
+
+
+def _age(path, seconds=60):
+    """Backdates a file so it is outside the racy-clean window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_cache_roundtrip(tmp_path):
+    target = tmp_path / "a.txt"
+    target.write_text("hello")
+    _age(target)
+    st = os.stat(target)
+
+    cache = HashCache.load(tmp_path / ".geas")
+    assert cache.lookup("a.txt", st) is None
+
+    cache.store("a.txt", st, "abc")
+    cache.save()
+    assert (tmp_path / ".geas" / "cache" / "hashes.json").exists()
+
+    reloaded = HashCache.load(tmp_path / ".geas")
+    assert reloaded.lookup("a.txt", st) == "abc"
+    assert reloaded.lookup("a.txt", st, algorithm="blake2b") is None
+
+
+def test_cache_miss_on_stat_change(tmp_path):
+    target = tmp_path / "a.txt"
+    target.write_text("hello")
+    _age(target)
+
+    cache = HashCache.load(tmp_path / ".geas")
+    cache.store("a.txt", os.stat(target), "abc")
+
+    target.write_text("hello world")
+    _age(target, seconds=30)
+    assert cache.lookup("a.txt", os.stat(target)) is None
+
+
+def test_cache_skips_racily_clean_files(tmp_path):
+    target = tmp_path / "a.txt"
+    target.write_text("fresh")
+
+    cache = HashCache.load(tmp_path / ".geas")
+    cache.store("a.txt", os.stat(target), "abc")
+    assert cache.lookup("a.txt", os.stat(target)) is None
+
+
+def test_cache_corrupted_file_is_cold(tmp_path):
+    cache_file = tmp_path / ".geas" / "cache" / "hashes.json"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text("{not json")
+
+    cache = HashCache.load(tmp_path / ".geas")
+    assert cache.entries == {}
+
+
+def test_hash_files_uses_cache(tmp_path):
+    (tmp_path / "src").mkdir()
+    files = []
+    for i in range(4):
+        path = tmp_path / "src" / f"f{i}.py"
+        path.write_text(f"x = {i}")
+        _age(path)
+        files.append(f"src/f{i}.py")
+
+    cache = HashCache.load(tmp_path / ".geas")
+    first = hash_files(tmp_path, files, jobs=2, cache=cache)
+
+    with patch("geas_ai.core.hashing.digest_file") as mock_hash:
+        second = hash_files(tmp_path, files, jobs=2, cache=cache)
+        mock_hash.assert_not_called()
+
+    assert second == first
+
+
+def test_file_sha256_with_cache(tmp_path):
+    target = tmp_path / "doc.md"
+    target.write_text("content")
+    _age(target)
+
+    cache = HashCache.load(tmp_path / ".geas")
+    expected = file_sha256(target)
+    assert file_sha256(target, cache) == expected
+    # Keyed by the path relative to the project root, like hash_files
+    assert cache.lookup("doc.md", os.stat(target)) == expected[7:]
+    assert cache.key(target) == cache.key(tmp_path / "sub" / ".." / "doc.md")
+    assert list(cache.entries) == ["doc.md"]
+
+    with patch("geas_ai.core.hashing.digest_file") as mock_hash:
+        assert hash_files(tmp_path, ["doc.md"], cache=cache) == {"doc.md": expected[7:]}
+        mock_hash.assert_not_called()
+
+
+def test_hash_files_keys_are_relative_to_project_root(tmp_path):
+    (tmp_path / "src").mkdir()
+    target = tmp_path / "src" / "a.py"
+    target.write_text("x = 1")
+    _age(target)
+
+    cache = HashCache.load(tmp_path / ".geas")
+    hash_files(tmp_path / "src", ["a.py"], cache=cache)
+    assert list(cache.entries) == ["src/a.py"]
+
+
+def test_prune_drops_deleted_files(tmp_path):
+    kept = tmp_path / "kept.py"
+    gone = tmp_path / "gone.py"
+    for path in (kept, gone):
+        path.write_text("x")
+        _age(path)
+
+    cache = HashCache.load(tmp_path / ".geas")
+    hash_files(tmp_path, ["kept.py", "gone.py"], cache=cache)
+    cache.save()
+
+    gone.unlink()
+    cache = HashCache.load(tmp_path / ".geas")
+    assert cache.prune() == 1
+    assert list(cache.entries) == ["kept.py"]
+    cache.save()
+    assert list(HashCache.load(tmp_path / ".geas").entries) == ["kept.py"]
+
+
+def test_other_cache_version_is_cold(tmp_path):
+    cache_file = tmp_path / ".geas" / "cache" / "hashes.json"
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text('{"version": 0, "entries": {"a.txt": {}}}')
+
+    assert HashCache.load(tmp_path / ".geas").entries == {}
+
+
+def _result(passed=True):
+    return TestResultInfo(
+        passed=passed,
+        exit_code=0 if passed else 1,
+        duration_seconds=1.5,
+        timestamp=datetime.now(timezone.utc),
+        output="not cached",
+    )
+
+
+def test_test_result_cache_roundtrip(tmp_path):
+    cache = TestResultCache.load(tmp_path / ".geas")
+    key = TestResultCache.key("root", "pytest", ["tests", "src"])
+    assert key == TestResultCache.key("root", "pytest", ["src", "tests"])
+    assert key != TestResultCache.key("root", "pytest -x", ["src", "tests"])
+    assert key != TestResultCache.key("other", "pytest", ["src", "tests"])
+
+    cache.store(key, _result())
+    cache.store("failed", _result(passed=False))
+    cache.store("skipped", _result().model_copy(update={"skipped": True}))
+    cache.save()
+
+    reloaded = TestResultCache.load(tmp_path / ".geas")
+    hit = reloaded.lookup(key)
+    assert hit is not None and hit.passed
+    assert hit.output == ""
+    assert reloaded.lookup("failed") is None
+    assert reloaded.lookup("skipped") is None
+
+
+def test_test_result_cache_is_bounded(tmp_path):
+    cache = TestResultCache.load(tmp_path / ".geas")
+    with patch.object(cache_module, "TEST_CACHE_MAX_ENTRIES", 3):
+        for i in range(5):
+            cache.store(str(i), _result())
+
+    assert list(cache.entries) == ["2", "3", "4"]
@@ -0,0 +1,95 @@
+import hashlib
+import mmap
+import pytest
+from datetime import datetime, timezone
+from geas_ai.core.compact import (
+    RESTART_INTERVAL,
+    CompactManifest,
+    is_compact_manifest,
+    write_compact_manifest,
+)
+from geas_ai.core.manifest import (
+    TestResultInfo,
+    generate_manifest,
+    load_manifest,
+    save_manifest,
+)
+
+
+def _files(count):
+    return {
+        f"src/pkg{i % 7}/module_{i:05d}.py": hashlib.sha256(str(i).encode()).hexdigest()
+        for i in range(count)
+    }
+
+
+@pytest.mark.parametrize("count", [0, 1, RESTART_INTERVAL, RESTART_INTERVAL * 3 + 5])
+def test_roundtrip_and_lookup(tmp_path, count):
+    files = _files(count)
+    path = tmp_path / "manifest.bin"
+    write_compact_manifest(path, {"root_hash": "abc"}, files)
+
+    with CompactManifest.open(path) as compact:
+        assert compact.header == {"root_hash": "abc"}
+        assert len(compact) == count
+        assert list(compact.items()) == sorted(files.items())
+        assert compact.digests() == [files[p] for p in sorted(files)]
+        for p, digest in files.items():
+            assert compact.get(p) == digest
+        assert compact.get("src/missing.py") is None
+        assert compact.get("") is None
+        assert compact.get("zzz") is None
+
+
+def test_is_smaller_than_json(tmp_path):
+    files = _files(2000)
+    manifest = generate_manifest(
+        "bolt",
+        ["src"],
+        files,
+        TestResultInfo(
+            passed=True,
+            exit_code=0,
+            duration_seconds=1.0,
+            timestamp=datetime.now(timezone.utc),
+        ),
+    )
+    save_manifest(manifest, tmp_path / "manifest.json")
+    save_manifest(manifest, tmp_path / "manifest.bin", "binary")
+
+    json_size = (tmp_path / "manifest.json").stat().st_size
+    assert (tmp_path / "manifest.bin").stat().st_size < json_size / 2
+
+    assert is_compact_manifest(tmp_path / "manifest.bin")
+    assert not is_compact_manifest(tmp_path / "manifest.json")
+    assert load_manifest(tmp_path / "manifest.bin") == manifest
+    assert load_manifest(tmp_path / "manifest.json") == manifest
+
+
+def test_rejects_mixed_digest_sizes(tmp_path):
+    with pytest.raises(ValueError):
+        write_compact_manifest(tmp_path / "m.bin", {}, {"a": "00" * 32, "b": "00" * 20})
+
+
+def test_truncated_file_does_not_load(tmp_path):
+    path = tmp_path / "manifest.bin"
+    write_compact_manifest(path, {}, _files(10))
+    path.write_bytes(path.read_bytes()[:20])
+    assert load_manifest(path) is None
+
+
+def test_open_closes_mapping_of_invalid_file(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.bin"
+    path.write_bytes(b"not a compact manifest at all")
+
+    mappings = []
+    real_mmap = mmap.mmap
+
+    def tracking_mmap(*args, **kwargs):
+        mappings.append(real_mmap(*args, **kwargs))
+        return mappings[-1]
+
+    monkeypatch.setattr(mmap, "mmap", tracking_mmap)
+    with pytest.raises(ValueError):
+        CompactManifest.open(path)
+    assert len(mappings) == 1 and mappings[0].closed
@@ -0,0 +1,143 @@
+import shutil
+import subprocess
+import pytest
+
+from geas_ai.core.cache import GitWalkCache
+from geas_ai.core.gitindex import find_common_dir, find_git_dir, read_git_index
+from geas_ai.core.walker import walk_source_files
+
+requires_git = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git executable not available"
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+def _make_repo(tmp_path):
+    """A checkout with tracked, untracked, ignored and tracked-but-ignored files."""
+    (tmp_path / ".gitignore").write_text("*.log\nbuild/\n")
+    (tmp_path / "src" / "pkg" / "deep").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").write_text("print('main')")
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("x = 1")
+    (tmp_path / "src" / "pkg" / "deep" / "leaf.py").write_text("y = 2")
+    (tmp_path / "src" / "tracked.log").write_text("forced")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_main.py").write_text("def test(): pass")
+
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "add", "-f", "src/tracked.log")
+
+    # Untracked, ignored and deleted files after the index was written
+    (tmp_path / "src" / "untracked.py").write_text("z = 3")
+    (tmp_path / "src" / "debug.log").write_text("ignored")
+    (tmp_path / "src" / "build").mkdir()
+    (tmp_path / "src" / "build" / "out.py").write_text("generated")
+    (tmp_path / "src" / "pkg" / "mod.py").unlink()
+    (tmp_path / ".geas").mkdir()
+
+
+@requires_git
+@pytest.mark.parametrize("version", ["2", "3", "4"])
+def test_read_git_index_versions(tmp_path, version):
+    _make_repo(tmp_path)
+    _git(tmp_path, "update-index", "--index-version", version)
+
+    entries = read_git_index(find_git_dir(tmp_path))
+
+    assert entries is not None
+    assert set(entries) == {
+        ".gitignore",
+        "src/main.py",
+        "src/pkg/mod.py",
+        "src/pkg/deep/leaf.py",
+        "src/tracked.log",
+        "tests/test_main.py",
+    }
+
+
+@requires_git
+def test_git_backend_matches_fs_walk(tmp_path):
+    _make_repo(tmp_path)
+
+    fs_files = walk_source_files(tmp_path, ["src", "tests"])
+    git_files = walk_source_files(tmp_path, ["src", "tests"], backend="git")
+
+    assert git_files == fs_files
+    assert "src/untracked.py" in git_files
+    assert "src/pkg/mod.py" not in git_files  # Deleted since indexed
+    assert "src/tracked.log" not in git_files  # Tracked but ignored
+    assert (tmp_path / ".geas" / "cache" / "gitwalk.json").exists()
+
+    # Second run is answered from the tracked-ignore cache
+    assert walk_source_files(tmp_path, ["src", "tests"], backend="git") == fs_files
+
+    # A malformed cache entry is a miss, not a set of characters
+    cache = GitWalkCache.load(tmp_path / ".geas")
+    cache.entries["ignored"] = "src/main.py"
+    cache._dirty = True
+    cache.save()
+    assert walk_source_files(tmp_path, ["src", "tests"], backend="git") == fs_files
+    assert GitWalkCache.load(tmp_path / ".geas").entries["ignored"] == [
+        "src/tracked.log"
+    ]
+
+
+@requires_git
+def test_linked_worktree_uses_common_dir(tmp_path):
+    main = tmp_path / "main"
+    main.mkdir()
+    _make_repo(main)
+    _git(main, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+    (main / ".git" / "info").mkdir(exist_ok=True)
+    (main / ".git" / "info" / "exclude").write_text("*.secret\n")
+
+    linked = tmp_path / "linked"
+    _git(main, "worktree", "add", "-q", str(linked))
+    (linked / "src" / "key.secret").write_text("hidden")
+
+    git_dir = find_git_dir(linked)
+    assert git_dir is not None and git_dir != main / ".git"
+    assert find_common_dir(git_dir).resolve() == (main / ".git").resolve()
+    assert "src/main.py" in (read_git_index(git_dir) or set())
+
+    for backend in ("fs", "git"):
+        assert "src/key.secret" not in walk_source_files(
+            linked, ["src"], backend=backend
+        )
+
+
+def test_git_backend_falls_back_without_repo(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").touch()
+
+    assert walk_source_files(tmp_path, ["src"], backend="git") == ["src/a.py"]
+
+
+def test_read_git_index_rejects_garbage(tmp_path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    assert read_git_index(git_dir) is None
+
+    (git_dir / "index").write_bytes(b"DIRC\x00\x00\x00\x02\x00\x00\x00\x05junk")
+    assert read_git_index(git_dir) is None
+
+
+def test_unknown_backend(tmp_path):
+    with pytest.raises(ValueError):
+        walk_source_files(tmp_path, ["src"], backend="svn")
+
+
+@requires_git
+def test_git_backend_matches_fs_walk_with_nested_ignores(tmp_path):
+    _make_repo(tmp_path)
+    (tmp_path / "src" / "pkg" / ".gitignore").write_text("deep/\n")
+    (tmp_path / "src" / "pkg" / "new.py").write_text("w = 4")
+
+    fs_files = walk_source_files(tmp_path, ["src", "tests"])
+    git_files = walk_source_files(tmp_path, ["src", "tests"], backend="git")
+
+    assert git_files == fs_files
+    assert "src/pkg/deep/leaf.py" not in git_files
@@ -0,0 +1,102 @@
+import hashlib
+from unittest.mock import patch
+import pytest
+from geas_ai.core.hashing import (
+    digest_file,
+    file_hash,
+    file_sha256,
+    hash_files,
+    split_digest,
+    validate_algorithm,
+)
+from geas_ai.core.manifest import calculate_merkle_root
+
+
+def _make_tree(tmp_path, count=20):
+    files = []
+    for i in range(count):
+        rel = f"src/pkg{i % 3}/mod_{i}.py"
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(f"value = {i}\n".encode() * (i + 1))
+        files.append(rel)
+    return sorted(files)
+
+
+def test_hash_files_matches_sha256(tmp_path):
+    files = _make_tree(tmp_path, count=3)
+    hashes = hash_files(tmp_path, files, jobs=1)
+
+    for rel in files:
+        expected = hashlib.sha256((tmp_path / rel).read_bytes()).hexdigest()
+        assert hashes[rel] == expected
+
+
+def test_hash_files_parallel_matches_serial(tmp_path):
+    files = _make_tree(tmp_path)
+
+    serial = hash_files(tmp_path, files, jobs=1)
+    parallel = hash_files(tmp_path, files, jobs=4)
+
+    # Same order, same digests, same root
+    assert list(parallel.items()) == list(serial.items())
+    assert calculate_merkle_root(parallel) == calculate_merkle_root(serial)
+
+
+def test_hash_files_default_jobs(tmp_path):
+    files = _make_tree(tmp_path, count=5)
+    assert hash_files(tmp_path, files) == hash_files(tmp_path, files, jobs=1)
+
+
+def test_hash_files_empty(tmp_path):
+    assert hash_files(tmp_path, [], jobs=4) == {}
+
+
+def test_digest_file_empty(tmp_path):
+    target = tmp_path / "empty"
+    target.touch()
+    assert digest_file(target) == hashlib.sha256(b"").hexdigest()
+
+
+def test_digest_file_spans_multiple_buffers(tmp_path):
+    data = bytes(range(256)) * (10 * 1024 + 7)  # ~2.5 MiB, not buffer aligned
+    target = tmp_path / "medium.bin"
+    target.write_bytes(data)
+
+    assert digest_file(target) == hashlib.sha256(data).hexdigest()
+    assert file_sha256(target) == f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+def test_digest_file_mmap_path(tmp_path):
+    data = b"x" * 4096 + b"y" * 123
+    target = tmp_path / "huge.bin"
+    target.write_bytes(data)
+
+    with patch("geas_ai.core.hashing.MMAP_THRESHOLD", 1024):
+        assert digest_file(target) == hashlib.sha256(data).hexdigest()
+
+
+def test_digest_file_other_algorithm(tmp_path):
+    target = tmp_path / "a.txt"
+    target.write_bytes(b"abc")
+    assert digest_file(target, "blake2b") == hashlib.blake2b(b"abc").hexdigest()
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b", "sha3_256"])
+def test_hash_files_algorithm(tmp_path, algorithm):
+    files = _make_tree(tmp_path, count=3)
+    hashes = hash_files(tmp_path, files, jobs=2, algorithm=algorithm)
+
+    for rel in files:
+        data = (tmp_path / rel).read_bytes()
+        assert hashes[rel] == hashlib.new(algorithm, data).hexdigest()
+        assert file_hash(tmp_path / rel, algorithm) == f"{algorithm}:{hashes[rel]}"
+
+
+def test_split_digest_and_validation():
+    assert split_digest("blake2b:abcd") == ("blake2b", "abcd")
+    # Unprefixed digests are legacy SHA-256
+    assert split_digest("abcd") == ("sha256", "abcd")
+    assert validate_algorithm("sha3_256") == "sha3_256"
+    with pytest.raises(ValueError):
+        validate_algorithm("md5")
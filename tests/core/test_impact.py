@@ -0,0 +1,145 @@
+from datetime import datetime, timezone
+
+from geas_ai.core.cache import ImportCache
+from geas_ai.core.impact import (
+    build_import_graph,
+    module_names,
+    parse_imports,
+    plan_tests,
+    select_tests,
+    selection_command,
+)
+from geas_ai.core.manifest import (
+    Manifest,
+    TestResultInfo,
+    TestSelection,
+    calculate_merkle_root,
+)
+
+SOURCES = {
+    "src/pkg/__init__.py": "",
+    "src/pkg/core.py": "import os\n",
+    "src/pkg/api.py": "from . import core\n",
+    "src/pkg/cli.py": "from .api import main\n",
+    "tests/test_api.py": "from pkg.api import main\n",
+    "tests/test_core.py": "import pkg.core\n",
+    "tests/test_other.py": "import json\n",
+}
+
+
+def _write(tmp_path, sources):
+    files = {}
+    for path, source in sources.items():
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(source)
+        files[path] = f"digest-of-{hash(source)}"
+    return files
+
+
+def _manifest(files, selection=None):
+    return Manifest(
+        bolt_id="bolt",
+        generated_at=datetime.now(timezone.utc),
+        scope=["src", "tests"],
+        files=files,
+        root_hash=calculate_merkle_root(files),
+        test_result=TestResultInfo(
+            passed=True,
+            exit_code=0,
+            duration_seconds=1.0,
+            timestamp=datetime.now(timezone.utc),
+            selection=selection,
+        ),
+    )
+
+
+def test_module_names():
+    modules = module_names(set(SOURCES))
+    assert modules["pkg"] == "src/pkg/__init__.py"
+    assert modules["pkg.api"] == "src/pkg/api.py"
+    assert modules["test_api"] == "tests/test_api.py"
+
+
+def test_parse_imports_resolves_relative_imports():
+    source = b"from . import core\nfrom ..other import thing\nimport a.b\n"
+    assert parse_imports(source, "pkg.sub.mod", is_package=False) == [
+        "a.b",
+        "pkg.other",
+        "pkg.other.thing",
+        "pkg.sub",
+        "pkg.sub.core",
+    ]
+    assert parse_imports(b"def broken(:", "mod", is_package=False) == []
+
+
+def test_select_tests_follows_transitive_imports(tmp_path):
+    files = _write(tmp_path, SOURCES)
+    graph = build_import_graph(tmp_path, files)
+
+    assert select_tests(["src/pkg/core.py"], graph) == {
+        "tests/test_api.py": ["src/pkg/core.py"],
+        "tests/test_core.py": ["src/pkg/core.py"],
+    }
+    assert select_tests(["src/pkg/cli.py"], graph) == {}
+    assert select_tests(["tests/test_other.py"], graph) == {
+        "tests/test_other.py": ["tests/test_other.py"]
+    }
+
+
+def test_import_graph_is_cached(tmp_path):
+    files = _write(tmp_path, SOURCES)
+    cache = ImportCache.load(tmp_path / ".geas")
+    graph = build_import_graph(tmp_path, files, cache)
+    cache.save()
+
+    # Unchanged digests are not parsed again, even if the file is gone
+    (tmp_path / "src" / "pkg" / "api.py").unlink()
+    cached = ImportCache.load(tmp_path / ".geas")
+    assert build_import_graph(tmp_path, files, cached) == graph
+
+
+def test_plan_tests(tmp_path):
+    previous_files = _write(tmp_path, SOURCES)
+    files = _write(tmp_path, {**SOURCES, "src/pkg/api.py": "from . import core\n#"})
+    previous = _manifest(previous_files)
+
+    selection = plan_tests(tmp_path, files, ["src", "tests"], "sha256", previous)
+    assert selection.mode == "impact"
+    assert selection.base_root == previous.root_hash
+    assert selection.tests == {"tests/test_api.py": ["src/pkg/api.py"]}
+    assert selection.runs_since_full == 1
+    assert selection_command("pytest", selection) == "pytest tests/test_api.py"
+
+
+def test_plan_tests_falls_back_to_full_runs(tmp_path):
+    files = _write(tmp_path, SOURCES)
+
+    def plan(previous_files, previous_selection=None, full_every=10):
+        previous = _manifest(previous_files, previous_selection)
+        return plan_tests(
+            tmp_path, files, ["src", "tests"], "sha256", previous, full_every
+        )
+
+    assert plan_tests(tmp_path, files, ["src"], "sha256", None).mode == "full"
+
+    # Non-Python changes, test configuration and removed modules
+    assert plan({**files, "src/data.json": "x"}).mode == "full"
+    assert plan({**files, "tests/conftest.py": "x"}).mode == "full"
+    assert plan({**files, "src/pkg/gone.py": "x"}).mode == "full"
+
+    # Every Nth proof runs everything
+    streak = TestSelection(mode="impact", reason="", runs_since_full=2)
+    selection = plan(files, streak, full_every=3)
+    assert selection.mode == "full"
+    assert "periodic" in selection.reason
+    assert plan(files, streak, full_every=0).mode == "impact"
+    assert selection_command("pytest", selection) == "pytest"
+
+    # A proof that skipped the tests is no base for a selection
+    skipped = _manifest(files)
+    skipped.test_result.passed = False
+    skipped.test_result.skipped = True
+    selection = plan_tests(tmp_path, files, ["src", "tests"], "sha256", skipped)
+    assert selection.mode == "full"
+    assert "skipped" in selection.reason
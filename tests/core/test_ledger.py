@@ -0,0 +1,320 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from geas_ai.core import ledger as ledger_module
+from geas_ai.core.cache import CheckpointCache
+from geas_ai.core.ledger import (
+    LEGACY_LOCK_FILE_NAME,
+    LOCK_FILE_NAME,
+    LedgerIntegrityError,
+    LedgerManager,
+)
+from geas_ai.schemas.ledger import EventIdentity, LedgerAction, LedgerEvent
+from geas_ai.utils.crypto import canonicalize_json
+
+
+def make_event(n):
+    return LedgerEvent(
+        sequence=0,
+        timestamp=datetime(2025, 1, 1, 12, n, tzinfo=timezone.utc),
+        action=LedgerAction.SEAL_REQ,
+        payload={"file": "01_request.md", "hash": f"sha256:{n:064x}", "note": "a\nb"},
+        identity=EventIdentity(signer_id="lead", public_key="key", signature="sig"),
+        event_hash="",
+    )
+
+
+def make_ledger(count):
+    ledger = LedgerManager.create_genesis_ledger("bolt")
+    for n in range(count):
+        LedgerManager.append_event(ledger, make_event(n))
+    return ledger
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    ledger = make_ledger(3)
+    LedgerManager.save_lock(tmp_path, ledger)
+
+    lines = (tmp_path / LOCK_FILE_NAME).read_bytes().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[0])["bolt_id"] == "bolt"
+
+    loaded = LedgerManager.load_lock(tmp_path)
+    assert loaded == ledger
+    assert loaded.head_hash == ledger.events[-1].event_hash
+    assert LedgerManager.verify_chain_integrity(loaded)
+
+
+def test_load_missing_returns_none(tmp_path):
+    assert LedgerManager.load_lock(tmp_path) is None
+
+
+def test_append_lock_appends_only_new_events(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+    before = (tmp_path / LOCK_FILE_NAME).read_bytes()
+
+    LedgerManager.append_event(ledger, make_event(2))
+    LedgerManager.append_lock(tmp_path, ledger)
+
+    after = (tmp_path / LOCK_FILE_NAME).read_bytes()
+    assert after.startswith(before)
+    assert after[len(before) :].count(b"\n") == 1
+    assert LedgerManager.load_lock(tmp_path) == ledger
+
+
+def test_torn_tail_is_ignored_and_cut_by_next_append(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+    lock_path = tmp_path / LOCK_FILE_NAME
+    with open(lock_path, "ab") as f:
+        f.write(b'{"sequence":3,"torn')
+
+    loaded = LedgerManager.load_lock(tmp_path)
+    assert len(loaded.events) == 2
+    assert LedgerManager.verify_chain_integrity(loaded)
+
+    LedgerManager.append_event(loaded, make_event(2))
+    LedgerManager.append_lock(tmp_path, loaded)
+    assert b"torn" not in lock_path.read_bytes()
+    assert LedgerManager.load_lock(tmp_path) == loaded
+
+
+def test_bad_header_raises(tmp_path):
+    (tmp_path / LOCK_FILE_NAME).write_text('{"bolt_id": "bolt"}\n')
+    with pytest.raises(LedgerIntegrityError):
+        LedgerManager.load_lock(tmp_path)
+
+
+def test_legacy_lock_is_read_and_migrated_on_append(tmp_path):
+    ledger = make_ledger(2)
+    legacy_path = tmp_path / LEGACY_LOCK_FILE_NAME
+    legacy_path.write_text(ledger.model_dump_json(indent=2))
+
+    loaded = LedgerManager.load_lock(tmp_path)
+    assert loaded == ledger
+
+    LedgerManager.append_event(loaded, make_event(2))
+    LedgerManager.append_lock(tmp_path, loaded)
+
+    assert not legacy_path.exists()
+    assert (tmp_path / LOCK_FILE_NAME).exists()
+    migrated = LedgerManager.load_lock(tmp_path)
+    assert migrated == loaded
+    assert LedgerManager.verify_chain_integrity(migrated)
+
+
+def test_checkpoint_roundtrip_and_resume(tmp_path):
+    ledger = make_ledger(3)
+    LedgerManager.save_lock(tmp_path, ledger)
+    cache = CheckpointCache.load(tmp_path / ".geas")
+    LedgerManager.save_checkpoint(tmp_path, ledger, cache)
+    cache.save()
+
+    cache = CheckpointCache.load(tmp_path / ".geas")
+    checkpoint = LedgerManager.load_checkpoint(tmp_path, cache)
+    assert checkpoint.sequence == 3
+    assert checkpoint.event_hash == ledger.events[-1].event_hash
+    assert checkpoint.offset == (tmp_path / LOCK_FILE_NAME).stat().st_size
+
+    # Events before the checkpoint are trusted, the rest is re-checked
+    loaded = LedgerManager.load_lock(tmp_path)
+    first = loaded.events[0]
+    loaded.events[0] = first.model_copy(
+        update={"payload": {**first.payload, "note": "edited"}}
+    )
+    assert LedgerManager.verify_chain_integrity(loaded, checkpoint)
+    assert not LedgerManager.verify_chain_integrity(loaded)
+
+    LedgerManager.append_event(loaded, make_event(3))
+    loaded.events[-1].payload["note"] = "edited"
+    assert not LedgerManager.verify_chain_integrity(loaded, checkpoint)
+
+
+def test_checkpoint_follows_appends(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+    cache = CheckpointCache.load(tmp_path / ".geas")
+
+    LedgerManager.append_event(ledger, make_event(2))
+    offset = LedgerManager.append_lock(tmp_path, ledger)
+    LedgerManager.save_checkpoint(tmp_path, ledger, cache, offset)
+
+    checkpoint = LedgerManager.load_checkpoint(tmp_path, cache)
+    assert checkpoint.sequence == 3
+    assert checkpoint.offset == (tmp_path / LOCK_FILE_NAME).stat().st_size
+
+
+def test_stale_checkpoint_is_ignored(tmp_path):
+    ledger = make_ledger(3)
+    LedgerManager.save_lock(tmp_path, ledger)
+    cache = CheckpointCache.load(tmp_path / ".geas")
+    LedgerManager.save_checkpoint(tmp_path, ledger, cache)
+
+    # The ledger is replaced by another one with the same length
+    other = make_ledger(2)
+    other.events[0].payload["note"] = "other"
+    LedgerManager.save_lock(tmp_path, other)
+    assert LedgerManager.load_checkpoint(tmp_path, cache) is None
+
+    (tmp_path / LOCK_FILE_NAME).unlink()
+    assert LedgerManager.load_checkpoint(tmp_path, cache) is None
+
+
+def make_mixed_ledger(count):
+    ledger = LedgerManager.create_genesis_ledger("bolt")
+    for n in range(count):
+        event = make_event(n)
+        if n % 3 == 2:
+            event.action = LedgerAction.SEAL_MRP
+        LedgerManager.append_event(ledger, event)
+    return ledger
+
+
+def test_open_lock_reads_header_and_head(tmp_path):
+    ledger = make_mixed_ledger(5)
+    LedgerManager.save_lock(tmp_path, ledger)
+
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert lazy.bolt_id == "bolt"
+    assert lazy.created_at == ledger.created_at
+    assert lazy.head == ledger.events[-1]
+    assert lazy.head_hash == ledger.head_hash
+
+
+def test_open_lock_empty_and_missing(tmp_path):
+    assert LedgerManager.open_lock(tmp_path) is None
+
+    LedgerManager.save_lock(tmp_path, make_ledger(0))
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert lazy.head is None
+    assert list(lazy) == []
+    assert lazy.find_last(LedgerAction.SEAL_REQ) is None
+    assert lazy.verify_chain()
+
+
+def test_lazy_iteration_both_ways(tmp_path, monkeypatch):
+    # Tiny chunks: lines span several reads from the tail
+    monkeypatch.setattr(ledger_module, "_TAIL_CHUNK", 7)
+    ledger = make_mixed_ledger(6)
+    LedgerManager.save_lock(tmp_path, ledger)
+    with open(tmp_path / LOCK_FILE_NAME, "ab") as f:
+        f.write(b'{"torn')
+
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert list(lazy) == ledger.events
+    assert list(lazy.reversed()) == ledger.events[::-1]
+    assert lazy.find_last(LedgerAction.SEAL_MRP) == ledger.events[5]
+    assert lazy.find_last(LedgerAction.SEAL_REQ) == ledger.events[4]
+    assert lazy.find_last(LedgerAction.APPROVE) is None
+
+
+def test_lazy_verify_chain_with_checkpoint(tmp_path):
+    ledger = make_ledger(4)
+    LedgerManager.save_lock(tmp_path, ledger)
+    cache = CheckpointCache.load(tmp_path / ".geas")
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert lazy.verify_chain()
+    LedgerManager.save_checkpoint(tmp_path, lazy, cache)
+    checkpoint = LedgerManager.load_checkpoint(tmp_path, cache)
+
+    # Tamper with an event before the checkpoint, keeping the line length
+    lock_path = tmp_path / LOCK_FILE_NAME
+    data = lock_path.read_bytes()
+    lock_path.write_bytes(data.replace(b"12:01:00", b"12:01:09"))
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert lazy.verify_chain(checkpoint)
+    assert not lazy.verify_chain()
+
+    # The checkpoint event itself is always re-checked
+    lock_path.write_bytes(data.replace(b"12:03:00", b"12:03:09"))
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert not lazy.verify_chain(checkpoint)
+
+
+def test_lazy_append(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+
+    lazy = LedgerManager.open_lock(tmp_path)
+    offset = lazy.append(make_event(2))
+    assert offset == (tmp_path / LOCK_FILE_NAME).stat().st_size
+    assert lazy.head.sequence == 3
+    assert lazy.head.prev_hash == ledger.head_hash
+
+    LedgerManager.append_event(ledger, make_event(2))
+    assert LedgerManager.load_lock(tmp_path) == ledger
+    assert LedgerManager.open_lock(tmp_path).verify_chain()
+
+
+def test_lazy_legacy_ledger(tmp_path):
+    ledger = make_mixed_ledger(3)
+    (tmp_path / LEGACY_LOCK_FILE_NAME).write_text(ledger.model_dump_json(indent=2))
+
+    lazy = LedgerManager.open_lock(tmp_path)
+    assert lazy.head == ledger.events[-1]
+    assert list(lazy) == ledger.events
+    assert lazy.find_last(LedgerAction.SEAL_MRP) == ledger.events[2]
+    assert lazy.verify_chain()
+
+    lazy.append(make_event(3))
+    assert not (tmp_path / LEGACY_LOCK_FILE_NAME).exists()
+    assert len(LedgerManager.load_lock(tmp_path).events) == 4
+
+
+def fresh_bytes(event):
+    data = event.model_dump(mode="json")
+    del data["event_hash"]
+    return canonicalize_json(data)
+
+
+def test_canonical_bytes_are_kept_and_dropped(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+    event = LedgerManager.load_lock(tmp_path).events[1]
+
+    # Read from the line, not serialized again
+    assert event._canonical is not None
+    assert event.canonical_bytes() == fresh_bytes(event)
+    assert ledger_module._event_line(event) == (
+        canonicalize_json(event.model_dump(mode="json")) + b"\n"
+    )
+
+    event.sequence = 7
+    assert event._canonical is None
+    assert event.canonical_bytes() == fresh_bytes(event)
+
+
+def test_model_copy_with_update_changes_the_hash(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+    event = LedgerManager.load_lock(tmp_path).events[0]
+
+    copied = event.model_copy(update={"sequence": 7, "prev_hash": "sha256:x"})
+    assert copied.canonical_bytes() == fresh_bytes(copied)
+    assert b'"sequence":7' in copied.canonical_bytes()
+
+    def rehash(e):
+        return ledger_module.hash_event_bytes(e.canonical_bytes(), "sha256")
+
+    assert rehash(copied) != rehash(event) == event.event_hash
+
+
+def test_non_canonical_line_is_hashed_from_the_event(tmp_path):
+    ledger = make_ledger(2)
+    LedgerManager.save_lock(tmp_path, ledger)
+    lock_path = tmp_path / LOCK_FILE_NAME
+    header, *lines = lock_path.read_bytes().splitlines(keepends=True)
+
+    # Same events, reformatted by hand
+    spaced = [
+        json.dumps(json.loads(line), indent=None).encode() + b"\n" for line in lines
+    ]
+    lock_path.write_bytes(header + b"".join(spaced))
+
+    loaded = LedgerManager.load_lock(tmp_path)
+    assert loaded.events[0]._canonical is None
+    assert loaded == ledger
+    assert LedgerManager.verify_chain_integrity(loaded)
@@ -1,8 +1,15 @@
 import hashlib
+import pytest
 from datetime import datetime, timezone
+from geas_ai.core.compact import CompactManifest
+from geas_ai.core.merkle import MERKLE_FILE_NAME, MerkleTree, verify_inclusion
 from geas_ai.core.manifest import (
+    ChangeType,
+    diff_manifests,
     calculate_merkle_root,
     generate_manifest,
+    lookup_manifest_file,
+    save_manifest,
     TestResultInfo,
     Manifest,
 )
@@ -71,3 +78,85 @@ def test_generate_manifest():
     assert m.files == files
     assert m.test_result == test_result
     assert m.root_hash == "abc"  # Single file
+
+
+def _h(value):
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def test_diff_manifests_merge():
+    old = {"a.py": _h("a"), "b.py": _h("b"), "c.py": _h("c")}
+    new = {"b.py": _h("b2"), "c.py": _h("c"), "d.py": _h("d")}
+
+    changes = [(c.change, c.path) for c in diff_manifests(old, new)]
+
+    assert changes == [
+        (ChangeType.REMOVED, "a.py"),
+        (ChangeType.MODIFIED, "b.py"),
+        (ChangeType.ADDED, "d.py"),
+    ]
+
+
+def test_diff_manifests_skips_identical_subtrees():
+    old = {f"f{i:03d}.py": _h(str(i)) for i in range(100)}
+    new = dict(old)
+    new["f010.py"] = _h("x")
+    new["f077.py"] = _h("y")
+
+    old_tree = MerkleTree.build([old[p] for p in sorted(old)])
+    new_tree = MerkleTree.build([new[p] for p in sorted(new)])
+
+    with_trees = list(diff_manifests(old, new, old_tree, new_tree))
+    merged = list(diff_manifests(old, new))
+
+    assert with_trees == merged
+    assert [c.path for c in with_trees] == ["f010.py", "f077.py"]
+
+
+@pytest.mark.parametrize("fmt", ["json", "binary"])
+def test_lookup_manifest_file(tmp_path, monkeypatch, fmt):
+    files = {f"src/m{i:03d}.py": _h(str(i)) for i in range(150)}
+    test_result = TestResultInfo(
+        passed=True,
+        exit_code=0,
+        duration_seconds=1.0,
+        timestamp=datetime.now(timezone.utc),
+    )
+    manifest = generate_manifest("bolt", ["src"], files, test_result)
+    name = "manifest.bin" if fmt == "binary" else "manifest.json"
+    save_manifest(manifest, tmp_path / name, fmt)
+    MerkleTree.build([files[p] for p in sorted(files)]).save(
+        tmp_path / MERKLE_FILE_NAME
+    )
+
+    # Neither the path table nor the whole tree is decoded for one file
+    def no_full_decode(*args):
+        raise AssertionError("full decode")
+
+    monkeypatch.setattr(CompactManifest, "paths", no_full_decode)
+    monkeypatch.setattr(MerkleTree, "load", no_full_decode)
+    monkeypatch.setattr(MerkleTree, "build", no_full_decode)
+
+    lookup = lookup_manifest_file(tmp_path, "src/m042.py")
+    assert lookup is not None
+    assert lookup.root_hash == manifest.root_hash
+    assert lookup.proof is not None
+    assert lookup.proof.leaf_index == 42
+    assert lookup.proof.leaf_count == 150
+    assert lookup.proof.leaf_hash == files["src/m042.py"]
+    assert verify_inclusion(
+        lookup.proof.leaf_hash, lookup.proof.audit_path, lookup.root_hash
+    )
+
+    missing = lookup_manifest_file(tmp_path, "src/other.py")
+    assert missing is not None and missing.proof is None
+
+    # A stale merkle.bin falls back to rebuilding the tree from the manifest
+    monkeypatch.undo()
+    MerkleTree.build([_h("x")]).save(tmp_path / MERKLE_FILE_NAME)
+    rebuilt = lookup_manifest_file(tmp_path, "src/m042.py")
+    assert rebuilt is not None and rebuilt.proof == lookup.proof
+
+
+def test_lookup_manifest_file_without_manifest(tmp_path):
+    assert lookup_manifest_file(tmp_path, "a.py") is None
@@ -0,0 +1,154 @@
+import hashlib
+import pytest
+from geas_ai.core.manifest import calculate_merkle_root
+from geas_ai.core.merkle import (
+    MerkleTree,
+    build_incremental,
+    load_audit_path,
+    verify_inclusion,
+)
+
+
+def _files(count, salt=""):
+    return {
+        f"src/f{i:04d}.py": hashlib.sha256(f"{salt}{i}".encode()).hexdigest()
+        for i in range(count)
+    }
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 7, 8, 9, 33])
+def test_tree_root_matches_calculate_merkle_root(count):
+    files = _files(count)
+    leaves = [files[p] for p in sorted(files)]
+    assert MerkleTree.build(leaves).root == calculate_merkle_root(files)
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 64, 100])
+def test_update_matches_full_rebuild(count):
+    files = _files(count)
+    tree = build_incremental(files)
+
+    changed = dict(files)
+    for path in sorted(changed)[:: max(1, count // 3)]:
+        changed[path] = hashlib.sha256(path.encode()).hexdigest()
+
+    updated = build_incremental(changed, files, tree)
+    assert updated.root == calculate_merkle_root(changed)
+    assert (
+        updated.levels == MerkleTree.build([changed[p] for p in sorted(changed)]).levels
+    )
+
+
+def test_update_hash_count_is_logarithmic():
+    files = _files(1024)
+    tree = MerkleTree.build([files[p] for p in sorted(files)])
+
+    # One changed leaf in a 1024-leaf tree touches exactly log2(1024) parents
+    assert tree.update({500: "0" * 64}) == 10
+
+
+def test_incremental_falls_back_when_tree_is_out_of_sync():
+    files = _files(10)
+    stale_tree = build_incremental(_files(10, salt="stale"))
+
+    changed = dict(files)
+    changed["src/f0003.py"] = hashlib.sha256(b"changed").hexdigest()
+
+    # The saved levels are not the tree of `files`: rebuild instead of patching
+    tree = build_incremental(changed, files, stale_tree)
+    assert tree is not stale_tree
+    assert tree.root == calculate_merkle_root(changed)
+
+
+def test_incremental_falls_back_when_paths_change():
+    files = _files(10)
+    tree = build_incremental(files)
+
+    grown = dict(files)
+    grown["src/new.py"] = hashlib.sha256(b"new").hexdigest()
+
+    rebuilt = build_incremental(grown, files, tree)
+    assert rebuilt is not tree
+    assert rebuilt.root == calculate_merkle_root(grown)
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    files = _files(13)
+    tree = build_incremental(files)
+    path = tmp_path / "merkle.bin"
+    tree.save(path)
+
+    loaded = MerkleTree.load(path)
+    assert loaded is not None
+    assert loaded.levels == tree.levels
+    assert loaded.root == tree.root
+
+
+def test_load_rejects_garbage(tmp_path):
+    path = tmp_path / "merkle.bin"
+    assert MerkleTree.load(path) is None
+
+    path.write_bytes(b"not a merkle file")
+    assert MerkleTree.load(path) is None
+
+    tree = build_incremental(_files(4))
+    tree.save(path)
+    path.write_bytes(path.read_bytes()[:-5])  # Truncated
+    assert MerkleTree.load(path) is None
+
+
+def test_empty_tree_roundtrip(tmp_path):
+    path = tmp_path / "merkle.bin"
+    MerkleTree.build([]).save(path)
+
+    loaded = MerkleTree.load(path)
+    assert loaded is not None
+    assert loaded.root == hashlib.sha256(b"").hexdigest()
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+def test_audit_path_verifies_every_leaf(count):
+    files = _files(count)
+    leaves = [files[p] for p in sorted(files)]
+    tree = MerkleTree.build(leaves)
+
+    for index, leaf in enumerate(leaves):
+        path = tree.audit_path(index)
+        assert verify_inclusion(leaf, path, tree.root)
+        assert not verify_inclusion("0" * 64, path, tree.root)
+
+
+def test_algorithm_changes_root_and_verifies():
+    files = _files(11)
+    leaves = [files[p] for p in sorted(files)]
+    tree = MerkleTree.build(leaves, "blake2b")
+
+    assert tree.root != MerkleTree.build(leaves).root
+    assert len(tree.root) == 128
+    assert tree.root == calculate_merkle_root(files, "blake2b")
+    for index in (0, 5, 10):
+        path = tree.audit_path(index)
+        assert verify_inclusion(leaves[index], path, tree.root, "blake2b")
+        assert not verify_inclusion(leaves[index], path, tree.root)
+
+    # A tree of another algorithm is never updated in place
+    rebuilt = build_incremental(files, files, tree, "sha256")
+    assert rebuilt.root == calculate_merkle_root(files)
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+def test_load_audit_path_reads_single_leaf(tmp_path, count):
+    files = _files(count)
+    tree = MerkleTree.build([files[p] for p in sorted(files)])
+    path = tmp_path / "merkle.bin"
+    tree.save(path)
+
+    for index in range(count):
+        assert load_audit_path(path, index, count, tree.root) == tree.audit_path(index)
+
+    # Another root, leaf count or index, or a truncated file: rebuild instead
+    assert load_audit_path(path, 0, count, "0" * 64) is None
+    assert load_audit_path(path, 0, count + 1, tree.root) is None
+    assert load_audit_path(path, count, count, tree.root) is None
+    path.write_bytes(path.read_bytes()[:-5])
+    assert load_audit_path(path, 0, count, tree.root) is None
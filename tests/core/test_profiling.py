@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from geas_ai.core import profiling
+
+
+@pytest.fixture(autouse=True)
+def stop_profiler():
+    yield
+    profiling.stop()
+
+
+@profiling.profiled("double")
+def double(x):
+    """Doubles x."""
+    return x * 2
+
+
+def test_profiled_is_noop_when_inactive():
+    assert profiling._active is None
+    assert double(3) == 6
+    assert double.__doc__ == "Doubles x."
+
+
+def test_profiled_records_calls_and_time():
+    profiler = profiling.start()
+    double(1)
+    double(2)
+    with profiling.phase("block"):
+        pass
+
+    report = profiler.report("cmd")
+    assert report["command"] == "cmd"
+    assert list(report["phases"]) == ["double", "block"]
+    assert report["phases"]["double"]["calls"] == 2
+    assert report["phases"]["block"]["calls"] == 1
+    assert report["total_seconds"] >= report["phases"]["double"]["seconds"] >= 0
+
+
+def test_phase_records_time_when_body_raises():
+    profiler = profiling.start()
+    with pytest.raises(ValueError):
+        with profiling.phase("failing"):
+            raise ValueError("boom")
+    assert profiler.report()["phases"]["failing"]["calls"] == 1
+
+
+def test_stop_returns_profiler_and_disables_recording():
+    profiler = profiling.start()
+    assert profiling.stop() is profiler
+    assert profiling.stop() is None
+
+    double(1)
+    assert json.loads(profiler.to_json())["phases"] == {}
@@ -1,65 +1,189 @@
-from unittest.mock import patch, MagicMock
-import subprocess
+import hashlib
+import io
+import shlex
+import sys
+import threading
+import time
+from geas_ai.core import testing
 from geas_ai.core.testing import run_tests
 
 
-def test_run_tests_success():
-    with patch("subprocess.run") as mock_run:
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Test Output"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+def _python(code):
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
 
-        result = run_tests("echo test")
 
-        assert result.passed is True
-        assert result.exit_code == 0
-        assert "Test Output" in result.output
+def test_run_tests_success():
+    result = run_tests(_python("print('Test Output')"))
 
+    assert result.passed is True
+    assert result.exit_code == 0
+    assert "Test Output" in result.output
+    assert result.log_hash is None
 
-def test_run_tests_failure():
-    with patch("subprocess.run") as mock_run:
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error"
-        mock_run.return_value = mock_result
 
-        result = run_tests("bad command")
+def test_run_tests_failure():
+    result = run_tests(
+        _python("import sys; sys.stderr.write('Error'); sys.exit(1)"),
+    )
 
-        assert result.passed is False
-        assert result.exit_code == 1
-        assert "Error" in result.output
+    assert result.passed is False
+    assert result.exit_code == 1
+    assert "Error" in result.output
 
 
 def test_run_tests_timeout():
-    with patch("subprocess.run") as mock_run:
-        mock_run.side_effect = subprocess.TimeoutExpired(
-            cmd="sleep", timeout=1, output=b"Part", stderr=b"Err"
-        )
-
-        result = run_tests("sleep", timeout=1)
-
-        assert result.passed is False
-        assert result.exit_code == 124
-        assert "Timeout expired" in result.output
-        assert "Part" in result.output  # stdout decoded
-
-
-def test_run_tests_timeout_invalid_utf8():
-    with patch("subprocess.run") as mock_run:
-        # Simulate invalid UTF-8 in stdout/stderr during timeout
-        # \x80 is invalid start byte in UTF-8
-        mock_run.side_effect = subprocess.TimeoutExpired(
-            cmd="bad_output", timeout=1, output=b"Valid\n\x80Invalid", stderr=b"Err\xff"
-        )
-
-        result = run_tests("bad_output", timeout=1)
-
-        assert result.passed is False
-        assert result.exit_code == 124
-        # Should contain replacement character
-        assert "Valid" in result.output
-        assert "\ufffd" in result.output  # Replacement char
-        assert "Timeout expired" in result.output
+    result = run_tests(
+        _python("import time; print('Part', flush=True); time.sleep(30)"),
+        timeout=1,
+    )
+
+    assert result.passed is False
+    assert result.exit_code == 124
+    assert "Timeout expired" in result.output
+    assert "Part" in result.output
+
+
+def test_run_tests_invalid_utf8():
+    result = run_tests(
+        _python(r"import sys; sys.stdout.buffer.write(b'Valid\n\x80Invalid')"),
+    )
+
+    assert "Valid" in result.output
+    assert "�" in result.output  # Replacement char
+
+
+def test_run_tests_command_not_found():
+    result = run_tests("definitely-not-a-test-runner")
+
+    assert result.passed is False
+    assert result.exit_code == 1
+
+
+def test_run_tests_streams_to_log_with_bounded_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(testing, "OUTPUT_TAIL_BYTES", 1024)
+    log_path = tmp_path / "tests.log"
+    tee = io.BytesIO()
+
+    result = run_tests(
+        _python("for i in range(5000): print(f'line {i}')"),
+        log_path=log_path,
+        tee=tee,
+    )
+
+    log = log_path.read_bytes()
+    assert log.startswith(b"line 0\n")
+    # The suite's output is followed by its resource usage
+    assert b"line 4999\n\nResources: " in log
+    assert tee.getvalue() == log
+
+    # Only the tail is kept in memory, the log is pinned by digest and size
+    assert len(result.output) <= 1024
+    assert "line 4999\n" in result.output
+    assert result.log_size == len(log)
+    assert result.log_hash == f"sha256:{hashlib.sha256(log).hexdigest()}"
+    assert "output" not in result.model_dump()
+
+
+def test_run_tests_cancel():
+    cancel = threading.Event()
+    threading.Timer(0.3, cancel.set).start()
+
+    start = time.time()
+    result = run_tests(_python("import time; time.sleep(30)"), cancel=cancel)
+
+    assert time.time() - start < 10
+    assert result.passed is False
+    assert "Cancelled" in result.output
+
+
+def test_run_tests_timeout_kills_process_group():
+    # The grandchild keeps stdout open; killing only the child would hang
+    code = (
+        "import subprocess, sys, time;"
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']);"
+        "time.sleep(30)"
+    )
+    start = time.time()
+    result = run_tests(_python(code), timeout=1)
+
+    assert time.time() - start < 10
+    assert result.exit_code == 124
+
+
+def test_run_sharded_tests(tmp_path):
+    code = (
+        "import os, sys;"
+        "i = int(os.environ['GEAS_TEST_SHARD_INDEX']);"
+        "print(f'shard {i} of {os.environ[\"GEAS_TEST_SHARD_COUNT\"]} arg ' + sys.argv[1]);"
+        "sys.exit(3 if i == 2 else 0)"
+    )
+    log_path = tmp_path / "tests.log"
+    result = run_tests(
+        _python(code) + " {shard_index}/{shard_count}", log_path=log_path, shards=3
+    )
+
+    assert result.passed is False
+    assert result.exit_code == 3
+    assert [(s.index, s.passed, s.exit_code) for s in result.shards] == [
+        (0, True, 0),
+        (1, True, 0),
+        (2, False, 3),
+    ]
+
+    # Shard logs are merged in shard order and pinned as one log
+    log = log_path.read_text()
+    assert log.index("shard 0 of 3 arg 0/3") < log.index("shard 2 of 3 arg 2/3")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tests.log"]
+    assert result.log_size == len(log.encode())
+
+
+def test_run_sharded_tests_global_timeout():
+    start = time.time()
+    result = run_tests(_python("import time; time.sleep(30)"), timeout=1, shards=2)
+
+    assert time.time() - start < 10
+    assert result.exit_code == 124
+    assert all(s.exit_code == 124 for s in result.shards)
+
+
+JUNIT_WRITER = (
+    "import os, sys;"
+    "i = os.environ.get('GEAS_TEST_SHARD_INDEX', '0');"
+    "open(sys.argv[1], 'w').write("
+    'f\'<testsuite><testcase classname="t" name="test_{i}" time="0.{i}"/></testsuite>\')'
+)
+
+
+def test_run_tests_collects_junit_timings(tmp_path):
+    junit_path = tmp_path / "tests.junit.xml"
+    result = run_tests(_python(JUNIT_WRITER) + " {junit_xml}", junit_path=junit_path)
+
+    assert result.passed is True
+    assert result.timings == {"t::test_0": ("passed", 0.0)}
+    assert "timings" not in result.model_dump()
+    assert not junit_path.exists()
+
+
+def test_run_sharded_tests_merges_junit_timings(tmp_path):
+    result = run_tests(
+        _python(JUNIT_WRITER) + " {junit_xml}",
+        shards=2,
+        junit_path=tmp_path / "tests.junit.xml",
+    )
+
+    assert result.timings == {
+        "t::test_0": ("passed", 0.0),
+        "t::test_1": ("passed", 0.1),
+    }
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_tests_records_resource_usage(tmp_path):
+    code = "x = bytearray(64 * 1024 * 1024); sum(range(10 ** 6))"
+    result = run_tests(_python(code), log_path=tmp_path / "tests.log")
+
+    usage = result.resources
+    assert usage is not None
+    assert usage.user_cpu_seconds + usage.system_cpu_seconds > 0
+    assert usage.peak_rss_bytes >= 64 * 1024 * 1024
+    assert (tmp_path / "tests.log").read_text().startswith("\nResources: ")
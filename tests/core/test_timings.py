@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from geas_ai.core.timings import (
+    find_slowdowns,
+    junit_command,
+    load_timings,
+    parse_junit_xml,
+    save_timings,
+    slowest_tests,
+)
+
+REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="4">
+<testcase classname="tests.test_a" name="test_ok" time="0.5" />
+<testcase classname="tests.test_a" name="test_bad" time="1.25"><failure message="x">trace</failure></testcase>
+<testcase classname="tests.test_a" name="test_skip" time="0"><skipped message="y" /></testcase>
+<testcase classname="" name="test_error" time="2.0"><error message="z" /></testcase>
+</testsuite></testsuites>
+"""
+
+
+def test_junit_command():
+    path = Path("/tmp/out dir/report.xml")
+    assert (
+        junit_command("pytest", path) == "pytest --junitxml='/tmp/out dir/report.xml'"
+    )
+    assert (
+        junit_command("run --report {junit_xml} -q", path)
+        == "run --report '/tmp/out dir/report.xml' -q"
+    )
+
+
+def test_parse_junit_xml(tmp_path):
+    report = tmp_path / "report.xml"
+    report.write_text(REPORT)
+
+    assert parse_junit_xml(report) == {
+        "tests.test_a::test_ok": ("passed", 0.5),
+        "tests.test_a::test_bad": ("failed", 1.25),
+        "tests.test_a::test_skip": ("skipped", 0.0),
+        "test_error": ("error", 2.0),
+    }
+
+
+def test_parse_junit_xml_truncated_or_missing(tmp_path):
+    report = tmp_path / "report.xml"
+    report.write_text(
+        REPORT[: REPORT.index('<testcase classname="tests.test_a" name="test_skip"')]
+    )
+
+    assert list(parse_junit_xml(report)) == [
+        "tests.test_a::test_ok",
+        "tests.test_a::test_bad",
+    ]
+    assert parse_junit_xml(tmp_path / "missing.xml") == {}
+
+
+def test_timings_roundtrip_and_ranking(tmp_path):
+    timings = {"a": ("passed", 0.1), "b": ("passed", 3.0), "c": ("failed", 1.0)}
+    path = tmp_path / "tests.timings.json"
+    save_timings(timings, path)
+
+    assert load_timings(path) == timings
+    assert load_timings(tmp_path / "missing.json") == {}
+    assert slowest_tests(timings, 2) == [("b", 3.0), ("c", 1.0)]
+
+
+def test_find_slowdowns():
+    previous = {
+        "slower": ("passed", 1.0),
+        "noise": ("passed", 0.01),
+        "steady": ("passed", 1.0),
+        "was_failing": ("failed", 0.1),
+    }
+    current = {
+        "slower": ("passed", 2.0),
+        "noise": ("passed", 0.05),
+        "steady": ("passed", 1.2),
+        "was_failing": ("passed", 5.0),
+        "new": ("passed", 9.0),
+    }
+
+    assert find_slowdowns(current, previous) == [("slower", 1.0, 2.0)]
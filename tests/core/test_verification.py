@@ -539,3 +539,116 @@ def test_signature_identity_not_found(test_ctx):
     result = verification.validate_signatures(ledger, test_ctx.store)
     assert not result.valid
     assert any(v.code == ViolationCode.IDENTITY_NOT_FOUND for v in result.violations)
+
+
+def test_mixed_algorithms_verify(test_ctx, tmp_path):
+    """Legacy sha256 data and newer blake2b data verify side by side."""
+    from geas_ai.core.hashing import file_hash
+
+    (tmp_path / "req.md").write_text("req")
+    (tmp_path / "specs.md").write_text("specs")
+
+    e1 = create_signed_event(
+        1,
+        None,
+        LedgerAction.SEAL_REQ,
+        {"file": "req.md", "hash": file_hash(tmp_path / "req.md")},
+        "human-dev",
+        test_ctx,
+    )
+    e2 = create_signed_event(
+        2,
+        e1.event_hash,
+        LedgerAction.SEAL_SPECS,
+        {"file": "specs.md", "hash": file_hash(tmp_path / "specs.md", "blake2b")},
+        "human-dev",
+        test_ctx,
+    )
+    event_dict = e2.model_dump(mode="json")
+    del event_dict["event_hash"]
+    e2.event_hash = calculate_event_hash(event_dict, "blake2b")
+
+    ledger = Ledger(
+        bolt_id="test",
+        created_at=datetime.now(timezone.utc),
+        events=[e1, e2],
+        head_hash=e2.event_hash,
+    )
+
+    assert e2.event_hash.startswith("blake2b:")
+    assert verification.validate_chain_integrity(ledger).valid
+    result = verification.validate_content_integrity(ledger, tmp_path)
+    assert result.valid
+    assert result.checked_files == 2
+
+    (tmp_path / "specs.md").write_text("changed")
+    result = verification.validate_content_integrity(ledger, tmp_path)
+    assert result.modified_files == 1
+
+
+def test_verify_ledger_matches_separate_checks(test_ctx, mock_workflow, tmp_path):
+    """The single-pass verifier returns the same results as the separate checks."""
+    from geas_ai.core.hashing import file_hash
+    from geas_ai.core.ledger import LedgerCheckpoint
+
+    (tmp_path / "req.md").write_text("req")
+    (tmp_path / "specs.md").write_text("specs")
+
+    e1 = create_signed_event(
+        1,
+        None,
+        LedgerAction.SEAL_REQ,
+        {"file": "req.md", "hash": file_hash(tmp_path / "req.md")},
+        "human-dev",
+        test_ctx,
+    )
+    e2 = create_signed_event(
+        2,
+        e1.event_hash,
+        LedgerAction.SEAL_SPECS,
+        {"file": "specs.md", "hash": file_hash(tmp_path / "specs.md")},
+        "agent-ai",  # Role violation
+        test_ctx,
+    )
+    e3 = create_signed_event(
+        3,
+        "wrong",  # Broken link
+        LedgerAction.SEAL_INTENT,
+        {"hashes": {"req.md": file_hash(tmp_path / "req.md")}},
+        "human-dev",
+        test_ctx,
+    )
+    e3.identity.signature = e1.identity.signature  # Invalid signature
+    ledger = Ledger(
+        bolt_id="test",
+        created_at=datetime.now(timezone.utc),
+        events=[e1, e2, e3],
+        head_hash=e3.event_hash,
+    )
+    (tmp_path / "specs.md").write_text("changed")
+
+    result = verification.verify_ledger(
+        ledger, mock_workflow, test_ctx.store, bolt_path=tmp_path
+    )
+    assert result.chain == verification.validate_chain_integrity(ledger)
+    assert result.signatures == verification.validate_signatures(ledger, test_ctx.store)
+    assert result.workflow == verification.validate_workflow_compliance(
+        ledger, mock_workflow, test_ctx.store
+    )
+    assert result.content == verification.validate_content_integrity(ledger, tmp_path)
+    assert not result.valid
+    assert any(v.code == ViolationCode.CHAIN_BROKEN for v in result.chain.violations)
+
+    # Content is only checked when a bolt path is given
+    assert (
+        verification.verify_ledger(ledger, mock_workflow, test_ctx.store).content
+        is None
+    )
+
+    # Resuming from a checkpoint at the last event skips the broken link
+    checkpoint = LedgerCheckpoint(3, e3.event_hash, 0)
+    result = verification.verify_ledger(
+        ledger, mock_workflow, test_ctx.store, checkpoint=checkpoint
+    )
+    assert result.chain == verification.validate_chain_integrity(ledger, checkpoint)
+    assert result.chain.resumed_from == 3
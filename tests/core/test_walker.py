@@ -1,3 +1,5 @@
+import os
+from unittest.mock import patch
 from geas_ai.core.walker import walk_source_files, load_gitignore_patterns
 
 
@@ -46,3 +48,60 @@ def test_walker_missing_scope(tmp_path):
     files = walk_source_files(tmp_path, ["src", "tests"])
 
     assert files == ["src/file.py"]
+
+
+def test_walker_nested_gitignore(tmp_path):
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    pkg = tmp_path / "src" / "pkg"
+    (pkg / "data").mkdir(parents=True)
+    (pkg / "node_modules" / "dep").mkdir(parents=True)
+    (pkg / ".gitignore").write_text("node_modules/\n/data\n*.tmp\n!keep.log\n")
+
+    (pkg / "mod.py").touch()
+    (pkg / "keep.log").touch()  # Re-included by the nested file
+    (pkg / "other.log").touch()
+    (pkg / "scratch.tmp").touch()
+    (pkg / "data" / "blob.bin").touch()
+    (pkg / "node_modules" / "dep" / "index.js").touch()
+    (tmp_path / "src" / "top.tmp").touch()  # Nested *.tmp does not apply here
+
+    files = walk_source_files(tmp_path, ["src"])
+
+    assert files == [
+        "src/pkg/.gitignore",
+        "src/pkg/keep.log",
+        "src/pkg/mod.py",
+        "src/top.tmp",
+    ]
+
+
+def test_walker_prunes_ignored_dirs(tmp_path):
+    (tmp_path / ".gitignore").write_text("node_modules/\n")
+    (tmp_path / "src" / "node_modules").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").touch()
+
+    with patch("geas_ai.core.walker.os.scandir", wraps=os.scandir) as scandir:
+        files = walk_source_files(tmp_path, ["src"])
+
+    assert files == ["src/main.py"]
+    scanned = [str(call.args[0]) for call in scandir.call_args_list]
+    assert not any("node_modules" in s for s in scanned)
+
+
+def test_walker_git_info_exclude(tmp_path):
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("*.secret\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").touch()
+    (tmp_path / "src" / "key.secret").touch()
+
+    assert walk_source_files(tmp_path, ["src"]) == ["src/main.py"]
+
+
+def test_walker_nested_scope_uses_ancestor_gitignore(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / ".gitignore").write_text("*.gen.py\n")
+    (tmp_path / "src" / "pkg" / "a.py").touch()
+    (tmp_path / "src" / "pkg" / "a.gen.py").touch()
+
+    assert walk_source_files(tmp_path, ["src/pkg"]) == ["src/pkg/a.py"]